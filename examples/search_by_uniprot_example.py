@@ -3,55 +3,123 @@
 Example: How to use atomica_search_by_uniprot results
 
 This script demonstrates how to:
-1. Search for structures by UniProt ID
+1. Search for structures by one or more UniProt IDs
 2. Construct absolute paths from the relative paths in the response
 3. Read and process the ATOMICA analysis files
+
+Pass UniProt IDs as arguments (default: P02649) and use --format ndjson to
+emit one JSON record per structure for pipelines.
 """
 
+import argparse
+import json
+import sys
 from pathlib import Path
-from atomica_mcp.server import AtomicaMCP
+from typing import Any, Dict, List, Optional
 
-def main():
-    # Initialize the MCP server
-    mcp = AtomicaMCP()
-    
-    # Search for P02649 (APOE protein)
-    print("Searching for APOE protein (P02649)...")
-    result = mcp.search_by_uniprot("P02649")
-    
-    print(f"Found {result['count']} structures")
-    print(f"Dataset directory: {result['dataset_directory']}")
-    print()
-    
-    # Get the dataset directory
-    dataset_dir = Path(result['dataset_directory'])
-    
+# Relative file paths returned for each structure
+PATH_KEYS = ('interact_scores_path', 'critical_residues_path', 'pymol_path')
+
+
+def _count_critical_residues(path: Path) -> int:
+    """Count non-comment, non-blank lines of a critical residues file."""
+    with open(path, 'r') as f:
+        return sum(1 for line in f if line.strip() and not line.startswith('#'))
+
+
+def _parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Search ATOMICA structures by UniProt ID")
+    parser.add_argument(
+        "uniprot_ids",
+        nargs="*",
+        default=["P02649"],
+        help="UniProt accessions to search (default: P02649, APOE)",
+    )
+    parser.add_argument(
+        "--format",
+        choices=("text", "ndjson"),
+        default="text",
+        help="Output format: human-readable text or one JSON record per line",
+    )
+    return parser.parse_args(argv)
+
+
+def _report(uniprot_id: str, result: Dict[str, Any], dataset_dir: Path, ndjson: bool) -> None:
+    """Resolve files and residue counts for one search result and print them."""
     # Process each structure
     for structure in result['structures']:
-        pdb_id = structure['pdb_id']
-        print(f"Structure: {pdb_id}")
-        print(f"  Title: {structure.get('title', 'N/A')}")
-        print(f"  Genes: {', '.join(structure.get('gene_symbols', []))}")
-        
         # Construct absolute paths
-        interact_scores_file = dataset_dir / structure['interact_scores_path']
-        critical_residues_file = dataset_dir / structure['critical_residues_path']
-        pymol_file = dataset_dir / structure['pymol_path']
+        files = {
+            key.removesuffix("_path"): dataset_dir / structure[key]
+            for key in PATH_KEYS
+        }
+        critical_residues_file = files['critical_residues']
+        residue_count = (
+            _count_critical_residues(critical_residues_file)
+            if critical_residues_file.exists() else None
+        )
+        genes = structure.get('gene_symbols') or []
+        
+        if ndjson:
+            print(json.dumps({
+                "uniprot_id": uniprot_id,
+                "pdb_id": structure['pdb_id'],
+                "title": structure.get('title'),
+                "gene_symbols": genes,
+                "files": {
+                    name: {"path": str(path), "exists": path.exists()}
+                    for name, path in files.items()
+                },
+                "residue_count": residue_count,
+            }))
+            continue
+        
+        print(f"Structure: {structure['pdb_id']}")
+        print(f"  Title: {structure.get('title') or 'N/A'}")
+        print(f"  Genes: {', '.join(genes)}")
         
         # Verify files exist
         print(f"  Files:")
-        print(f"    Interaction scores: {interact_scores_file} ({'✓' if interact_scores_file.exists() else '✗'})")
-        print(f"    Critical residues: {critical_residues_file} ({'✓' if critical_residues_file.exists() else '✗'})")
-        print(f"    PyMOL commands: {pymol_file} ({'✓' if pymol_file.exists() else '✗'})")
+        print(f"    Interaction scores: {files['interact_scores']} ({'✓' if files['interact_scores'].exists() else '✗'})")
+        print(f"    Critical residues: {critical_residues_file} ({'✓' if residue_count is not None else '✗'})")
+        print(f"    PyMOL commands: {files['pymol']} ({'✓' if files['pymol'].exists() else '✗'})")
         
         # Example: Read critical residues
-        if critical_residues_file.exists():
-            with open(critical_residues_file, 'r') as f:
-                lines = [line for line in f if line.strip() and not line.startswith('#')]
-                print(f"    Critical residues count: {len(lines)}")
+        if residue_count is not None:
+            print(f"    Critical residues count: {residue_count}")
         
         print()
 
+
+def main(argv: Optional[List[str]] = None):
+    args = _parse_args(argv)
+    ndjson = args.format == "ndjson"
+    # In NDJSON mode stdout carries only records, so progress goes to stderr
+    log = sys.stderr if ndjson else sys.stdout
+    
+    # atomica_mcp.server is imported here: it pulls in fastmcp and the mining
+    # stack (about a second), which --help does not need
+    from atomica_mcp.server import AtomicaMCP
+    
+    # Initialize the MCP server
+    mcp = AtomicaMCP()
+    
+    # Search all requested IDs in one pass over the index (default: P02649, APOE protein)
+    print(f"Searching for {', '.join(args.uniprot_ids)}...", file=log)
+    batch = mcp.search_by_uniprots(args.uniprot_ids)
+    if "error" in batch:
+        print(f"Error: {batch['error']}", file=log)
+        return
+    
+    # Get the dataset directory
+    dataset_dir = Path(batch['dataset_directory'])
+    
+    for uniprot_id, result in batch['results'].items():
+        print(f"{uniprot_id}: found {result['count']} structures", file=log)
+        print(f"Dataset directory: {dataset_dir}", file=log)
+        print(file=log)
+        
+        _report(uniprot_id, result, dataset_dir, ndjson)
+
 if __name__ == "__main__":
     main()
-
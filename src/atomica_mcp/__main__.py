@@ -1,8 +1,40 @@
 #!/usr/bin/env python3
 """Main entry point for ATOMICA MCP server."""
 
-from atomica_mcp.server import app, cli_app_stdio_standalone, cli_app_sse_standalone, cli_app_run
+import typer
+
+from atomica_mcp.server import DEFAULT_HOST, DEFAULT_PORT, cli_app_stdio_standalone, cli_app_sse_standalone, cli_app_run
+
+# Create typer app
+app = typer.Typer(help="ATOMICA MCP Server - Protein structure and ATOMICA analysis interface")
+
+
+@app.command("run")
+def cli_app(
+    host: str = typer.Option(DEFAULT_HOST, "--host", help="Host to bind to"),
+    port: int = typer.Option(DEFAULT_PORT, "--port", help="Port to bind to"),
+    transport: str = typer.Option("streamable-http", "--transport", help="Transport type")
+) -> None:
+    """Run the MCP server with specified transport."""
+    cli_app_run(host=host, port=port, transport=transport)
+
+
+@app.command("stdio")
+def cli_app_stdio(
+    verbose: bool = typer.Option(False, "--verbose", "-v", help="Verbose output")
+) -> None:
+    """Run the MCP server with stdio transport."""
+    cli_app_stdio_standalone()
+
+
+@app.command("sse")
+def cli_app_sse(
+    host: str = typer.Option(DEFAULT_HOST, "--host", help="Host to bind to"),
+    port: int = typer.Option(DEFAULT_PORT, "--port", help="Port to bind to")
+) -> None:
+    """Run the MCP server with SSE transport."""
+    cli_app_sse_standalone(host=host, port=port)
+
 
 if __name__ == "__main__":
     app()
-
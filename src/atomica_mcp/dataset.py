@@ -5,14 +5,145 @@ Download and manage atomica_longevity_proteins dataset from Hugging Face.
 """
 
 from pathlib import Path
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, NamedTuple, Tuple
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import atexit
+import errno
+import fnmatch
+import importlib.util
 import json
+import os
+import re
+import shutil
+import time
 
 import typer
-from eliot import start_action, to_file
+from eliot import add_destinations, start_action
 import fsspec
+from fsspec.asyn import AsyncFileSystem
 import polars as pl
 from pycomfort.logging import to_nice_file
+from rich.progress import BarColumn, MofNCompleteColumn, Progress, TextColumn, TimeRemainingColumn
+
+from atomica_mcp.mining.pdb_metadata import get_uniprot_info_batch
+
+try:
+    import orjson
+    
+    _json_loads = orjson.loads
+    
+    def _json_dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode("utf-8")
+except ImportError:  # orjson is optional; json.loads also accepts bytes
+    _json_loads = json.loads
+    _json_dumps = json.dumps
+
+# Suffixes that follow the PDB ID in per-structure file names
+PDB_FILE_SUFFIXES = (
+    "_metadata",
+    "_summary",
+    "_critical_residues",
+    "_interact_scores",
+    "_pymol_commands",
+)
+
+# Full name suffixes of the files that belong to one structure
+STRUCTURE_FILE_SUFFIXES = (
+    ".cif",
+    "_metadata.json",
+    "_summary.json",
+    "_critical_residues.tsv",
+    "_interact_scores.json",
+    "_pymol_commands.pml",
+)
+
+# How long a cached Hugging Face repository listing is reused (seconds)
+LISTING_CACHE_MAX_AGE = 3600
+
+# Write buffer for the JSON log file (bytes)
+LOG_BUFFER_SIZE = 64 * 1024
+
+# Worker threads used to move files into per-PDB folders in reorganize
+MOVE_WORKERS = 16
+
+# Worker threads used to read per-structure local files while indexing
+LOCAL_READ_WORKERS = 32
+
+# Lines that hold only whitespace (the line terminator is matched separately)
+_BLANK_LINE = re.compile(rb"(?m)^[ \t\r\f\v]*$")
+
+# Nested column type for resolved structure details (StructureInfo.to_dict),
+# with coverage flattened from {chain: [(start, end), ...]} into rows
+STRUCTURES_DTYPE = pl.List(pl.Struct({
+    "structure_id": pl.String,
+    "uniprot_id": pl.String,
+    "gene_symbol": pl.String,
+    "deposition_date": pl.String,
+    "experimental_method": pl.String,
+    "resolution": pl.Float64,
+    "r_free": pl.Float64,
+    "pdb_redo_available": pl.Boolean,
+    "pdb_redo_rfree": pl.Float64,
+    "chains": pl.List(pl.String),
+    "coverage": pl.List(pl.Struct({"chain": pl.String, "start": pl.Int64, "end": pl.Int64})),
+    "warnings": pl.List(pl.String),
+    "complex_info": pl.Struct({
+        "has_protein_complex": pl.Boolean,
+        "protein_complex_details": pl.List(pl.String),
+        "has_nucleotide": pl.Boolean,
+        "nucleotide_details": pl.List(pl.String),
+        "has_ligand": pl.Boolean,
+        "ligand_details": pl.List(pl.String),
+        "is_fusion": pl.Boolean,
+    }),
+}))
+
+# Rows per Parquet row group in the written index
+INDEX_ROW_GROUP_SIZE = 4096
+
+# Writer options shared by everything that writes atomica_index.parquet: zstd at a
+# fast level, and no min/max statistics since queries never rely on row-group pruning
+INDEX_PARQUET_OPTIONS: Dict[str, Any] = {
+    "compression": "zstd",
+    "compression_level": 3,
+    "statistics": False,
+    "row_group_size": INDEX_ROW_GROUP_SIZE,
+}
+
+# Bump when the shape of resolve_pdb_metadata results changes to invalidate cached entries
+PDB_METADATA_CACHE_VERSION = 1
+
+# How long resolved PDB metadata is reused before it is queried again (seconds)
+PDB_METADATA_CACHE_MAX_AGE = 30 * 24 * 3600
+
+# Concurrent PDBe/UniProt lookups while indexing (kept low to respect API rate limits)
+METADATA_RESOLVE_WORKERS = 8
+
+class PdbRow(NamedTuple):
+    """Expected file locations for one structure found while indexing."""
+    pdb_id: str
+    cif_path: Path
+    metadata_path: Path
+    summary_path: Path
+    critical_residues_path: Path
+    interact_scores_path: Path
+    pymol_path: Path
+    # Names of the files in the structure's directory, from one scandir
+    present: frozenset
+    # The structure's directory relative to the dataset root, with a trailing
+    # separator ('' for files in the root itself)
+    rel_prefix: str
+    
+    def has(self, path: Path) -> bool:
+        """Check whether one of this row's paths exists, without a stat call."""
+        return path.name in self.present
+    
+    def relative(self, path: Path) -> Optional[str]:
+        """Dataset-relative form of one of this row's paths, or None if it does not exist."""
+        return self.rel_prefix + path.name if path.name in self.present else None
+
 
 app = typer.Typer(
     help="Dataset management commands for ATOMICA longevity proteins",
@@ -20,6 +151,48 @@ app = typer.Typer(
 )
 
 
+class _BufferedLogFile:
+    """
+    Log file that flushes at the end of each top-level action and on failures.
+    
+    Eliot's file destinations flush after every message, which turns each log
+    line into a write() syscall. Those per-message flushes are deferred so the
+    64 KB buffer can fill; _LogFlusher writes it out once a top-level action
+    finishes or anything fails, so a crash only loses the task in progress.
+    The file is also closed (and flushed) by an atexit hook.
+    """
+    
+    def __init__(self, path: Path, mode: str) -> None:
+        self._file = open(path, mode, buffering=LOG_BUFFER_SIZE)
+        atexit.register(self._file.close)
+    
+    def write(self, data: Any) -> int:
+        return self._file.write(data)
+    
+    def flush(self) -> None:
+        # Called by eliot after every message; see flush_buffer
+        pass
+    
+    def flush_buffer(self) -> None:
+        """Write buffered log lines to the file."""
+        if not self._file.closed:
+            self._file.flush()
+
+
+class _LogFlusher:
+    """Eliot destination that flushes log files when a task ends or fails."""
+    
+    def __init__(self, *files: _BufferedLogFile) -> None:
+        self._files = files
+    
+    def __call__(self, message: Dict[str, Any]) -> None:
+        status = message.get("action_status")
+        task_done = status in ("succeeded", "failed") and len(message.get("task_level", ())) == 1
+        if task_done or status == "failed" or message.get("message_type") == "eliot:traceback":
+            for log_file in self._files:
+                log_file.flush_buffer()
+
+
 def setup_logging(log_file_name: str, log_to_file: bool = True) -> None:
     """
     Set up Eliot logging with file destinations.
@@ -37,9 +210,38 @@ def setup_logging(log_file_name: str, log_to_file: bool = True) -> None:
         json_log = log_dir / f"{log_file_name}.json"
         rendered_log = log_dir / f"{log_file_name}.log"
         
-        # Register Eliot destinations
-        to_file(open(str(json_log), "w"))
-        to_nice_file(json_log, rendered_log)
+        # Register Eliot destinations; the rendering destination writes both the
+        # JSON log and the human-readable log, so no separate to_file is needed
+        log_files = (_BufferedLogFile(json_log, "wb"), _BufferedLogFile(rendered_log, "a"))
+        to_nice_file(*log_files)
+        # Added after the rendering destination, so a task's last message is written before the flush
+        add_destinations(_LogFlusher(*log_files))
+
+
+def get_cache_dir() -> Path:
+    """
+    Get the local cache directory for atomica-mcp.
+    
+    Returns:
+        Path from ATOMICA_MCP_CACHE_DIR, or ~/.cache/atomica-mcp by default
+    """
+    return Path(os.environ.get("ATOMICA_MCP_CACHE_DIR", Path.home() / ".cache" / "atomica-mcp")).expanduser()
+
+
+def enable_fast_hf_transfers() -> None:
+    """
+    Turn on multi-connection Hugging Face transfers unless configured otherwise.
+    
+    huggingface_hub reads these variables when it is first imported, so this must
+    run before the hub is loaded (fsspec imports it lazily for the hf:// protocol).
+    Xet high-performance mode is the current mechanism; hf_transfer is only
+    enabled when that optional package is installed, since older hub versions
+    fail downloads if it is requested but missing.
+    """
+    os.environ.setdefault("HF_XET_HIGH_PERFORMANCE", "1")
+    os.environ.setdefault("HF_ENABLE_PARALLEL_DOWNLOADING", "true")
+    if importlib.util.find_spec("hf_transfer") is not None:
+        os.environ.setdefault("HF_HUB_ENABLE_HF_TRANSFER", "1")
 
 
 def get_hf_filesystem() -> fsspec.AbstractFileSystem:
@@ -49,9 +251,245 @@ def get_hf_filesystem() -> fsspec.AbstractFileSystem:
     Returns:
         Hugging Face filesystem instance
     """
+    enable_fast_hf_transfers()
     return fsspec.filesystem("hf", token=None)
 
 
+def cached_ls(
+    fs: fsspec.AbstractFileSystem,
+    repo_id: str,
+    refresh: bool = False,
+    max_age_seconds: int = LISTING_CACHE_MAX_AGE,
+    detail: bool = False
+) -> List[Any]:
+    """
+    List the top level of a dataset repository, cached on local disk.
+    
+    The listing is stored as JSON under ~/.cache/atomica-mcp (override with
+    ATOMICA_MCP_CACHE_DIR) and reused while it is younger than max_age_seconds,
+    so repeated download/list-files runs skip the repository tree request.
+    Entries keep the remote name, size and type, so callers can compare
+    sizes without further requests.
+    
+    Args:
+        fs: Hugging Face filesystem instance
+        repo_id: Hugging Face repository ID
+        refresh: Ignore any cached listing and fetch it again
+        max_age_seconds: Maximum age of a cached listing before it is refetched
+        detail: Return {"name", "size", "type"} dictionaries instead of paths
+    
+    Returns:
+        List of file paths as returned by fs.ls(detail=False), or entry
+        dictionaries if detail is True
+    """
+    cache_file = get_cache_dir() / "hf_listing" / f"{repo_id.replace('/', '__')}.json"
+    
+    with start_action(action_type="cached_ls", repo=repo_id, refresh=refresh) as action:
+        entries: Optional[List[Dict[str, Any]]] = None
+        if not refresh and cache_file.exists():
+            age = time.time() - cache_file.stat().st_mtime
+            if age < max_age_seconds:
+                try:
+                    cached = _json_loads(cache_file.read_bytes())
+                    # Listings cached before sizes were recorded are plain path strings
+                    if all(isinstance(entry, dict) for entry in cached):
+                        entries = cached
+                        action.log(message_type="listing_cache_hit", count=len(entries), age_seconds=int(age))
+                except (OSError, json.JSONDecodeError) as e:
+                    action.log(message_type="listing_cache_unreadable", error=str(e))
+        
+        if entries is None:
+            entries = [
+                {"name": entry["name"], "size": entry.get("size"), "type": entry.get("type")}
+                for entry in fs.ls(f"datasets/{repo_id}", detail=True)
+            ]
+            try:
+                cache_file.parent.mkdir(parents=True, exist_ok=True)
+                cache_file.write_text(json.dumps(entries))
+            except OSError as e:
+                # Caching is best-effort; a read-only home should not break listing
+                action.log(message_type="listing_cache_write_failed", error=str(e))
+            action.log(message_type="listing_fetched", count=len(entries))
+        
+        return entries if detail else [entry["name"] for entry in entries]
+
+
+def filter_by_pattern(files: List[str], pattern: str) -> List[str]:
+    """
+    Keep files whose name matches a glob pattern.
+    
+    The pattern is translated to a regex once instead of going through
+    fnmatch.fnmatch for every file. Matching is case-sensitive on the file
+    name only, e.g. '6ht5*' or '*.cif'.
+    
+    Args:
+        files: File paths to filter
+        pattern: Glob pattern applied to the file name
+    
+    Returns:
+        Files whose name matches the pattern, in the original order
+    """
+    matcher = re.compile(fnmatch.translate(pattern)).match
+    return [f for f in files if matcher(f.rsplit("/", 1)[-1])]
+
+
+def _progress_bar() -> Progress:
+    """
+    Create the progress bar used by long-running dataset commands.
+    
+    Rich redraws it from a background thread, so advancing it per item does
+    not write to the terminal on every iteration.
+    
+    Returns:
+        Progress instance with description, bar, count and ETA columns
+    """
+    return Progress(
+        TextColumn("[progress.description]{task.description}"),
+        BarColumn(),
+        MofNCompleteColumn(),
+        TimeRemainingColumn(),
+    )
+
+
+async def _download_all(
+    fs: fsspec.AbstractFileSystem,
+    files: List[str],
+    output_dir: Path,
+    max_concurrency: int
+) -> Tuple[int, int]:
+    """
+    Download dataset files concurrently.
+    
+    HfFileSystem is synchronous, so each transfer runs in a worker thread while
+    an asyncio semaphore bounds how many are in flight. Counters and the
+    progress bar are only updated on the event loop thread, so they need no lock.
+    
+    Args:
+        fs: Hugging Face filesystem instance
+        files: Remote file paths (without hf:// prefix) to download
+        output_dir: Local directory to download into
+        max_concurrency: Maximum number of concurrent downloads
+    
+    Returns:
+        Tuple of (downloaded, failed) counts
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+    downloaded = 0
+    failed = 0
+    progress = _progress_bar()
+    task_id = progress.add_task("Downloading", total=len(files))
+    
+    async def fetch(remote_file: str) -> None:
+        nonlocal downloaded, failed
+        filename = Path(remote_file).name
+        local_path = output_dir / filename
+        
+        async with semaphore:
+            try:
+                with start_action(action_type="download_file", file=filename) as dl_action:
+                    # Download using fsspec with hf:// protocol
+                    remote_url = f"hf://{remote_file}"
+                    await asyncio.to_thread(fs.get, remote_url, str(local_path))
+                    
+                    downloaded += 1
+                    
+                    dl_action.log(
+                        message_type="download_complete",
+                        size_bytes=local_path.stat().st_size if local_path.exists() else 0
+                    )
+            
+            except Exception as e:
+                failed += 1
+                with start_action(action_type="download_failed", file=filename) as fail_action:
+                    fail_action.log(message_type="error", error=str(e))
+                typer.echo(f"✗ Failed to download {filename}: {e}", err=True)
+            finally:
+                progress.advance(task_id)
+    
+    with progress:
+        await asyncio.gather(*(fetch(remote_file) for remote_file in files))
+    return downloaded, failed
+
+
+def _download_batched(
+    fs: AsyncFileSystem,
+    files: List[str],
+    output_dir: Path,
+    max_concurrency: int
+) -> Tuple[int, int]:
+    """
+    Download dataset files with a single batched fs.get call.
+    
+    Only used for async fsspec filesystems, whose get() dispatches all
+    transfers concurrently on one event loop and HTTP session.
+    
+    Args:
+        fs: Async fsspec filesystem instance
+        files: Remote file paths (without hf:// prefix) to download
+        output_dir: Local directory to download into
+        max_concurrency: Maximum number of concurrent downloads
+    
+    Returns:
+        Tuple of (downloaded, failed) counts
+    """
+    remote_urls = [f"hf://{f}" for f in files]
+    local_paths = [str(output_dir / Path(f).name) for f in files]
+    
+    with start_action(action_type="download_batch", count=len(files)) as action:
+        results = fs.get(remote_urls, local_paths, on_error="return", batch_size=max_concurrency)
+        
+        downloaded = 0
+        failed = 0
+        for remote_file, outcome in zip(files, results or [None] * len(files)):
+            filename = Path(remote_file).name
+            if isinstance(outcome, Exception):
+                failed += 1
+                action.log(message_type="download_failed", file=filename, error=str(outcome))
+                typer.echo(f"✗ Failed to download {filename}: {outcome}", err=True)
+            else:
+                downloaded += 1
+        
+        action.log(message_type="download_batch_complete", downloaded=downloaded, failed=failed)
+        return downloaded, failed
+
+
+def _snapshot_download(
+    repo_id: str,
+    output_dir: Path,
+    pattern: Optional[str],
+    force: bool,
+    max_workers: int
+) -> None:
+    """
+    Download the dataset with huggingface_hub.snapshot_download.
+    
+    The hub client parallelizes files itself and skips files that are already
+    up to date in output_dir, so no listing or per-file loop is needed here.
+    
+    Args:
+        repo_id: Hugging Face repository ID
+        output_dir: Local directory to download into
+        pattern: Optional glob pattern to restrict downloaded files
+        force: Re-download files even if they are up to date
+        max_workers: Number of parallel download workers
+    """
+    enable_fast_hf_transfers()
+    from huggingface_hub import snapshot_download
+    
+    with start_action(action_type="snapshot_download", repo=repo_id, pattern=pattern) as action:
+        typer.echo("📥 Downloading snapshot with huggingface_hub...")
+        local_dir = snapshot_download(
+            repo_id=repo_id,
+            repo_type="dataset",
+            local_dir=output_dir,
+            allow_patterns=[pattern] if pattern else None,
+            force_download=force,
+            max_workers=max_workers,
+        )
+        action.log(message_type="snapshot_complete", local_dir=str(local_dir))
+        typer.echo(f"\n✅ Dataset snapshot downloaded to: {Path(local_dir).resolve()}")
+
+
 @app.command()
 def download(
     output_dir: Path = typer.Option(
@@ -73,6 +511,22 @@ def download(
         None,
         "--pattern", "-p",
         help="Download only files matching pattern (glob, e.g., '*.cif' or '6ht5*')"
+    ),
+    max_concurrency: int = typer.Option(
+        8,
+        "--max-concurrency", "-j",
+        min=1,
+        help="Maximum number of files downloaded concurrently"
+    ),
+    snapshot: bool = typer.Option(
+        False,
+        "--snapshot",
+        help="Use huggingface_hub.snapshot_download (parallel, Xet-accelerated) instead of per-file fsspec transfers"
+    ),
+    refresh_listing: bool = typer.Option(
+        False,
+        "--refresh-listing",
+        help="Ignore the cached repository listing and fetch it again"
     )
 ) -> None:
     """
@@ -93,6 +547,12 @@ def download(
         
         # Download only files for specific PDB (e.g., 6ht5)
         dataset download --pattern "6ht5*"
+        
+        # Download with up to 16 files in flight
+        dataset download -j 16
+        
+        # Let huggingface_hub fetch the whole snapshot in parallel
+        dataset download --snapshot
     """
     # Set up logging
     setup_logging("download_dataset")
@@ -104,23 +564,29 @@ def download(
         typer.echo(f"📁 Output directory: {output_dir}")
         
         try:
+            if snapshot:
+                _snapshot_download(repo_id, output_dir, pattern, force, max_concurrency)
+                return
+            
             # Get fsspec filesystem
             typer.echo("🔌 Connecting to Hugging Face...")
             fs = get_hf_filesystem()
             
             # List files in the dataset using hf:// protocol
             typer.echo("🔍 Discovering dataset files...")
-            repo_path = f"datasets/{repo_id}"
             
             try:
-                files = fs.ls(repo_path, detail=False)
+                entries = cached_ls(fs, repo_id, refresh=refresh_listing, detail=True)
                 # Filter out directories and metadata files
-                files = [f for f in files if not f.endswith('/')]
+                files = [
+                    entry["name"] for entry in entries
+                    if entry["type"] != "directory" and not entry["name"].endswith('/')
+                ]
+                remote_sizes = {Path(entry["name"]).name: entry["size"] for entry in entries}
                 
                 # Apply pattern filter if provided
                 if pattern:
-                    import fnmatch
-                    files = [f for f in files if fnmatch.fnmatch(Path(f).name, pattern)]
+                    files = filter_by_pattern(files, pattern)
                 
                 action.log(message_type="files_listed", count=len(files))
             
@@ -138,47 +604,36 @@ def download(
             else:
                 typer.echo(f"📥 Found {len(files)} files to download")
             
-            downloaded = 0
-            skipped = 0
-            failed = 0
+            # Decide what to skip up front so transfers can be dispatched in one go.
+            # A local file only counts as done if its size matches the remote one,
+            # so interrupted downloads are fetched again.
+            with os.scandir(output_dir) as local_entries:
+                local_sizes = {e.name: e.stat().st_size for e in local_entries if e.is_file()}
             
-            for remote_file in files:
-                # Extract filename from path
-                filename = Path(remote_file).name
-                local_path = output_dir / filename
-                
-                # Check if file exists and skip if not forcing
-                if local_path.exists() and not force:
-                    skipped += 1
-                    continue
-                
-                try:
-                    with start_action(action_type="download_file", file=filename) as dl_action:
-                        # Download using fsspec with hf:// protocol
-                        remote_url = f"hf://{remote_file}"
-                        fs.get(remote_url, str(local_path))
-                        
-                        downloaded += 1
-                        
-                        if downloaded % 10 == 0:
-                            typer.echo(f"✓ Downloaded {downloaded}/{len(files)} files...")
-                        
-                        dl_action.log(
-                            message_type="download_complete",
-                            size_bytes=local_path.stat().st_size if local_path.exists() else 0
-                        )
-                
-                except Exception as e:
-                    failed += 1
-                    with start_action(action_type="download_failed", file=filename) as fail_action:
-                        fail_action.log(message_type="error", error=str(e))
-                    typer.echo(f"✗ Failed to download {filename}: {e}", err=True)
+            def is_up_to_date(remote_file: str) -> bool:
+                name = Path(remote_file).name
+                if name not in local_sizes:
+                    return False
+                remote_size = remote_sizes.get(name)
+                return remote_size is None or local_sizes[name] == remote_size
+            
+            to_fetch = [f for f in files if force or not is_up_to_date(f)]
+            skipped = len(files) - len(to_fetch)
+            
+            if not to_fetch:
+                downloaded, failed = 0, 0
+            elif isinstance(fs, AsyncFileSystem):
+                downloaded, failed = _download_batched(fs, to_fetch, output_dir, max_concurrency)
+            else:
+                downloaded, failed = asyncio.run(
+                    _download_all(fs, to_fetch, output_dir, max_concurrency)
+                )
             
             # Summary
             typer.echo("\n" + "="*60)
             typer.echo("📊 Download Summary:")
             typer.echo(f"  ✓ Downloaded: {downloaded}")
-            typer.echo(f"  ⊘ Skipped (already exist): {skipped}")
+            typer.echo(f"  ⊘ Skipped (already up to date): {skipped}")
             typer.echo(f"  ✗ Failed: {failed}")
             typer.echo(f"  📁 Location: {output_dir.resolve()}")
             typer.echo("="*60)
@@ -210,6 +665,11 @@ def list_files(
         None,
         "--pattern", "-p",
         help="Filter files by pattern (glob, e.g., '*.cif')"
+    ),
+    refresh_listing: bool = typer.Option(
+        False,
+        "--refresh-listing",
+        help="Ignore the cached repository listing and fetch it again"
     )
 ) -> None:
     """
@@ -224,14 +684,12 @@ def list_files(
         
         try:
             fs = get_hf_filesystem()
-            repo_path = f"datasets/{repo_id}"
-            files = fs.ls(repo_path, detail=False)
+            files = cached_ls(fs, repo_id, refresh=refresh_listing)
             files = [f for f in files if not f.endswith('/')]
             
             # Apply pattern filter if provided
             if pattern:
-                import fnmatch
-                files = [f for f in files if fnmatch.fnmatch(Path(f).name, pattern)]
+                files = filter_by_pattern(files, pattern)
             
             # Remove repo prefix for display
             display_files = [Path(f).name for f in files]
@@ -239,17 +697,13 @@ def list_files(
             if pattern:
                 typer.echo(f"🎯 Pattern '{pattern}' matched {len(display_files)} files\n")
             
-            # Group files by extension
-            from collections import defaultdict
-            by_ext: dict[str, list[str]] = defaultdict(list)
-            for f in display_files:
-                ext = Path(f).suffix or "no_extension"
-                by_ext[ext].append(f)
+            # Count files by extension (only the counts are displayed)
+            by_ext = Counter(Path(f).suffix or "no_extension" for f in display_files)
             
             # Display summary
             typer.echo("📊 File Summary:")
-            for ext, file_list in sorted(by_ext.items()):
-                typer.echo(f"  {ext:20s}: {len(file_list):4d} files")
+            for ext, count in sorted(by_ext.items()):
+                typer.echo(f"  {ext:20s}: {count:4d} files")
             
             typer.echo(f"\n📄 Total: {len(display_files)} files")
             
@@ -267,6 +721,64 @@ def list_files(
             raise typer.Exit(code=1)
 
 
+def scan_root_files(dataset_dir: Path) -> Tuple[Dict[str, set], set]:
+    """
+    Group the files directly inside dataset_dir by PDB ID.
+    
+    Uses one os.scandir pass; DirEntry caches the file type, so no extra
+    stat call is made per file. The PDB ID is the file stem with any known
+    per-structure suffix (e.g. '_metadata') removed; files that are neither
+    CIF structures nor suffixed per-structure files are ignored.
+    
+    Args:
+        dataset_dir: Dataset root directory
+    
+    Returns:
+        Tuple of (mapping of lowercase PDB ID to the set of root-level file
+        names for it, set of subdirectory names)
+    """
+    by_pdb: Dict[str, set] = {}
+    dirs: set = set()
+    with os.scandir(dataset_dir) as entries:
+        for entry in entries:
+            if entry.is_dir():
+                dirs.add(entry.name)
+                continue
+            if not entry.is_file():
+                continue
+            stem, _, ext = entry.name.rpartition('.')
+            if stem.endswith(PDB_FILE_SUFFIXES):
+                for suffix in PDB_FILE_SUFFIXES:
+                    if stem.endswith(suffix):
+                        stem = stem[:-len(suffix)]
+                        break
+            elif ext != "cif":
+                # Not a per-structure file (e.g. the index parquet)
+                continue
+            by_pdb.setdefault(stem.lower(), set()).add(entry.name)
+    return by_pdb, dirs
+
+
+def move_file(src: Path, dst: Path) -> None:
+    """
+    Move a file, falling back to a copy when crossing filesystems.
+    
+    os.replace is a single atomic rename on the same filesystem; it fails with
+    EXDEV when src and dst live on different devices (e.g. a Docker bind
+    mount), in which case shutil.move copies and deletes instead.
+    
+    Args:
+        src: Existing file
+        dst: Destination path
+    """
+    try:
+        os.replace(src, dst)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        shutil.move(str(src), str(dst))
+
+
 @app.command()
 def reorganize(
     dataset_dir: Path = typer.Option(
@@ -324,13 +836,19 @@ def reorganize(
         if dry_run:
             typer.echo("🔍 DRY RUN MODE - No files will be moved")
         
-        # Load the index
+        # Load the index lazily; only the pdb_id column is needed up front
         typer.echo("\n📖 Loading index...")
-        df = pl.read_parquet(index_file)
-        typer.echo(f"✓ Found {len(df)} structures in index")
+        lf = pl.scan_parquet(index_file)
+        # File and folder names are lowercase; uppercase IDs are only used for display
+        pdb_ids = lf.select(pl.col('pdb_id').str.to_lowercase()).collect().get_column('pdb_id').to_list()
+        typer.echo(f"✓ Found {len(pdb_ids)} structures in index")
         
-        # Find all PDB IDs
-        pdb_ids = df['pdb_id'].to_list()
+        # Discover root-level files in a single directory pass
+        root_files, root_dirs = scan_root_files(dataset_dir)
+        unindexed = sorted(set(root_files).difference(pdb_ids))
+        if unindexed:
+            typer.echo(f"⚠️  {len(unindexed)} PDB IDs have root-level files but are not in the index; leaving them in place")
+            action.log(message_type="unindexed_root_files", pdb_ids=unindexed)
         
         # Track statistics
         moved_files = 0
@@ -338,46 +856,52 @@ def reorganize(
         updated_paths = 0
         skipped_files = 0
         
+        # Moves are collected while walking the index and run concurrently afterwards
+        pending_moves: List[Tuple[Path, Path]] = []
+        
         # Process each PDB ID
         typer.echo("\n🔧 Reorganizing files...")
         for i, pdb_id in enumerate(pdb_ids, 1):
-            pdb_id_lower = pdb_id.lower()
-            pdb_folder = dataset_dir / pdb_id_lower
+            pdb_id_display = pdb_id.upper()
+            pdb_folder = dataset_dir / pdb_id
             
-            with start_action(action_type="reorganize_pdb", pdb_id=pdb_id) as pdb_action:
+            with start_action(action_type="reorganize_pdb", pdb_id=pdb_id_display) as pdb_action:
                 # Create folder if it doesn't exist
-                if not pdb_folder.exists():
+                if pdb_id not in root_dirs:
                     if not dry_run:
                         pdb_folder.mkdir(parents=True, exist_ok=True)
                     created_folders += 1
-                    typer.echo(f"  [{i}/{len(pdb_ids)}] {pdb_id}: Created folder")
+                    in_place: set = set()
+                    typer.echo(f"  [{i}/{len(pdb_ids)}] {pdb_id_display}: Created folder")
                 else:
-                    typer.echo(f"  [{i}/{len(pdb_ids)}] {pdb_id}: Folder exists")
+                    with os.scandir(pdb_folder) as entries:
+                        in_place = {entry.name for entry in entries}
+                    typer.echo(f"  [{i}/{len(pdb_ids)}] {pdb_id_display}: Folder exists")
                 
                 # Find all files for this PDB
-                file_patterns = [
-                    f"{pdb_id_lower}.cif",
-                    f"{pdb_id_lower}_metadata.json",
-                    f"{pdb_id_lower}_summary.json",
-                    f"{pdb_id_lower}_critical_residues.tsv",
-                    f"{pdb_id_lower}_interact_scores.json",
-                    f"{pdb_id_lower}_pymol_commands.pml"
-                ]
+                file_patterns = [pdb_id + suffix for suffix in STRUCTURE_FILE_SUFFIXES]
                 
+                root_names = root_files.get(pdb_id, set())
                 for pattern in file_patterns:
                     src_file = dataset_dir / pattern
                     dst_file = pdb_folder / pattern
                     
-                    if src_file.exists() and src_file.parent == dataset_dir:
+                    if pattern in root_names:
                         # File exists in root and needs to be moved
                         if not dry_run:
-                            src_file.rename(dst_file)
+                            pending_moves.append((src_file, dst_file))
+                            root_names.discard(pattern)
                         moved_files += 1
                         pdb_action.log(message_type="file_moved", file=pattern)
-                    elif dst_file.exists():
+                    elif pattern in in_place:
                         # File already in correct location
                         skipped_files += 1
                 
+        if pending_moves:
+            with ThreadPoolExecutor(max_workers=MOVE_WORKERS) as executor:
+                # Consume the iterator so the first failed move is raised here
+                list(executor.map(lambda pair: move_file(*pair), pending_moves))
+        
         # Update the index with relative paths
         typer.echo("\n📝 Updating index paths...")
         
@@ -414,30 +938,39 @@ def reorganize(
         ]
         
         # Only process columns that actually exist in the dataframe
-        existing_path_columns = [col for col in path_columns if col in df.columns]
-        
-        # Update all path columns at once
-        for col in existing_path_columns:
-            # Create a new column with updated paths
-            df = df.with_columns(
-                pl.when(pl.col(col).is_not_null())
-                .then(pl.col('pdb_id').str.to_lowercase() + "/" + pl.col(col).map_elements(lambda x: Path(x).name, return_dtype=pl.String))
-                .otherwise(None)
-                .alias(col)
+        index_columns = lf.collect_schema().names()
+        existing_path_columns = [col for col in path_columns if col in index_columns]
+        
+        # Update all path columns at once: one with_columns call, one query plan
+        pdb_folder_expr = pl.col('pdb_id').str.to_lowercase() + "/"
+        lf = lf.with_columns([
+            pl.when(pl.col(col).is_not_null())
+            .then(
+                pdb_folder_expr
+                # Native string ops keep this in Polars; normalise Windows separators first
+                + pl.col(col).str.replace_all("\\", "/", literal=True).str.split("/").list.last()
             )
+            .otherwise(None)
+            .alias(col)
+            for col in existing_path_columns
+        ])
         
         updated_paths = len(existing_path_columns)
         
         # Save updated index
         if not dry_run:
             typer.echo(f"💾 Saving updated index to: {index_file}")
-            df.write_parquet(index_file)
+            # Stream into a sibling file and swap it in: the source is still being scanned
+            tmp_index_file = index_file.with_name(f"{index_file.name}.tmp")
+            lf.sink_parquet(tmp_index_file, **INDEX_PARQUET_OPTIONS)
+            os.replace(tmp_index_file, index_file)
+            lf = pl.scan_parquet(index_file)
         else:
             typer.echo(f"💾 Would save updated index to: {index_file}")
         
         # Show sample of updated paths
         typer.echo("\n📋 Sample of updated paths:")
-        sample_df = df.select(['pdb_id', 'cif_path', 'metadata_path']).head(3)
+        sample_df = lf.select(['pdb_id', 'cif_path', 'metadata_path']).head(3).collect()
         typer.echo(sample_df)
         
         # Summary
@@ -503,6 +1036,80 @@ def info(
     typer.echo("  atomica-dataset list-files")
 
 
+def _load_json_safe(path: Path) -> Tuple[Path, Optional[Dict[str, Any]]]:
+    """
+    Read a JSON file, tolerating missing or malformed files.
+    
+    Args:
+        path: Path to the JSON file
+    
+    Returns:
+        Tuple of (path, parsed JSON or None if the file is missing or unreadable)
+    """
+    with start_action(action_type="read_json", path=str(path)) as action:
+        try:
+            with open(path, 'rb') as f:
+                data = _json_loads(f.read())
+            action.log(message_type="json_loaded")
+            return path, data
+        except FileNotFoundError:
+            action.log(message_type="json_missing")
+            return path, None
+        except Exception as e:
+            action.log(message_type="json_read_error", error=str(e))
+            return path, None
+
+
+def _read_local(pdb_info: PdbRow) -> Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]], Optional[int]]:
+    """
+    Read the local per-structure files used by the index.
+    
+    Args:
+        pdb_info: Expected file locations for the structure
+    
+    Returns:
+        Tuple of (metadata JSON, summary JSON, critical residues count), each None
+        if the file is missing or unreadable
+    """
+    metadata_json = _load_json_safe(pdb_info.metadata_path)[1] if pdb_info.has(pdb_info.metadata_path) else None
+    summary_json = _load_json_safe(pdb_info.summary_path)[1] if pdb_info.has(pdb_info.summary_path) else None
+    
+    critical_residues_count: Optional[int] = None
+    if pdb_info.has(pdb_info.critical_residues_path):
+        with start_action(action_type="count_critical_residues", path=str(pdb_info.critical_residues_path)) as count_action:
+            try:
+                critical_residues_count = count_critical_residues(pdb_info.critical_residues_path)
+                count_action.log(message_type="residues_counted", count=critical_residues_count)
+            except Exception as e:
+                count_action.log(message_type="critical_residues_count_error", error=str(e))
+    
+    return metadata_json, summary_json, critical_residues_count
+
+
+def count_critical_residues(path: Path) -> int:
+    """
+    Count the non-comment, non-blank lines of a critical residues TSV.
+    
+    Counts newlines, comment lines and blank lines with C-level scans over the
+    raw bytes instead of decoding and iterating the file line by line.
+    
+    Args:
+        path: Path to the critical residues TSV file
+    
+    Returns:
+        Number of residue lines
+    """
+    with open(path, 'rb') as f:
+        data = f.read()
+    if not data:
+        return 0
+    total = data.count(b"\n") + (not data.endswith(b"\n"))
+    comments = data.count(b"\n#") + data.startswith(b"#")
+    # findall stays in C; the empty match after a trailing newline is not a line
+    blanks = len(_BLANK_LINE.findall(data)) - data.endswith(b"\n")
+    return total - comments - blanks
+
+
 def resolve_pdb_metadata(pdb_id: str) -> Dict[str, Any]:
     """
     Resolve protein metadata for a PDB ID using comprehensive PDB mining.
@@ -561,6 +1168,195 @@ def resolve_pdb_metadata(pdb_id: str) -> Dict[str, Any]:
         return result
 
 
+def _structures_for_index(structures: List[Dict[str, Any]]) -> Optional[List[Dict[str, Any]]]:
+    """
+    Shape resolved structure details for the nested structures index column.
+    
+    Coverage is keyed by chain ID, which would give every structure a different
+    Struct schema, so it is flattened into {chain, start, end} rows.
+    
+    Args:
+        structures: Structure dictionaries from resolve_pdb_metadata
+    
+    Returns:
+        Structure dictionaries matching STRUCTURES_DTYPE, or None if there are none
+    """
+    if not structures:
+        return None
+    return [
+        {
+            **structure,
+            "coverage": [
+                {"chain": chain, "start": start, "end": end}
+                for chain, ranges in (structure.get("coverage") or {}).items()
+                for start, end in ranges
+            ],
+        }
+        for structure in structures
+    ]
+
+
+def upgrade_legacy_index(df: pl.DataFrame) -> pl.DataFrame:
+    """
+    Convert an index written before the nested structures column existed.
+    
+    Older indexes kept the resolved structure details as a JSON string in a
+    structures_json column. It is decoded into the structures column so readers
+    only deal with the current layout; other indexes are returned unchanged.
+    
+    Args:
+        df: Index DataFrame as read from atomica_index.parquet
+    
+    Returns:
+        DataFrame with a structures column of STRUCTURES_DTYPE instead of structures_json
+    """
+    if "structures_json" not in df.columns or "structures" in df.columns:
+        return df
+    structures = [
+        _structures_for_index(_json_loads(value)) if value else None
+        for value in df.get_column("structures_json")
+    ]
+    return df.with_columns(
+        pl.Series("structures", structures, dtype=STRUCTURES_DTYPE)
+    ).drop("structures_json")
+
+
+def _pdb_cache_path() -> Path:
+    """
+    Get the location of the on-disk resolved PDB metadata cache.
+    
+    Returns:
+        Path to pdb_metadata.parquet inside the atomica-mcp cache directory
+    """
+    return get_cache_dir() / "pdb_metadata.parquet"
+
+
+def _pdb_cache_scan(max_age_seconds: int = PDB_METADATA_CACHE_MAX_AGE) -> Optional[pl.LazyFrame]:
+    """
+    Lazily scan the valid rows of the on-disk PDB metadata cache.
+    
+    Entries written with a different PDB_METADATA_CACHE_VERSION, or older than
+    max_age_seconds, are filtered out so they get resolved again. Callers add
+    their own filters before collecting so they are pushed down into the scan.
+    
+    Args:
+        max_age_seconds: Maximum age of a cached entry
+    
+    Returns:
+        LazyFrame with pdb_id, metadata_json, fetched_at and schema_version columns,
+        or None if there is no cache
+    """
+    cache_file = _pdb_cache_path()
+    if not cache_file.exists():
+        return None
+    return (
+        pl.scan_parquet(cache_file)
+        .select(["pdb_id", "metadata_json", "fetched_at", "schema_version"])
+        .filter(
+            (pl.col("schema_version") == PDB_METADATA_CACHE_VERSION)
+            & (pl.col("fetched_at") >= time.time() - max_age_seconds)
+        )
+    )
+
+
+def _pdb_cache_load(
+    pdb_ids: List[str],
+    max_age_seconds: int = PDB_METADATA_CACHE_MAX_AGE
+) -> Dict[str, Tuple[float, Dict[str, Any]]]:
+    """
+    Load previously resolved PDB metadata for the given PDB IDs from the on-disk cache.
+    
+    Only the requested entries are decoded, so indexing a handful of structures
+    does not parse every cached metadata document.
+    
+    Args:
+        pdb_ids: Uppercase PDB IDs to look up
+        max_age_seconds: Maximum age of a cached entry
+    
+    Returns:
+        Mapping of uppercase PDB ID to (fetched_at timestamp, dictionary returned by
+        resolve_pdb_metadata); empty if there is no cache or it cannot be read
+    """
+    with start_action(action_type="pdb_cache_load", path=str(_pdb_cache_path())) as action:
+        lf = _pdb_cache_scan(max_age_seconds)
+        if lf is None:
+            return {}
+        try:
+            df = lf.filter(pl.col("pdb_id").is_in(pdb_ids)).collect()
+        except Exception as e:
+            # Includes caches written before entries were versioned
+            action.log(message_type="pdb_cache_unreadable", error=str(e))
+            return {}
+        cache = {
+            pdb_id: (fetched_at, _json_loads(metadata_json))
+            for pdb_id, metadata_json, fetched_at, _ in df.iter_rows()
+        }
+        action.log(message_type="pdb_cache_loaded", count=len(cache))
+        return cache
+
+
+def load_cached_pdb_metadata(pdb_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+    """
+    Get resolved PDB metadata from the on-disk cache without any API calls.
+    
+    Args:
+        pdb_ids: Uppercase PDB IDs to look up
+    
+    Returns:
+        Mapping of uppercase PDB ID to the dictionary returned by resolve_pdb_metadata,
+        for the IDs with a valid cache entry
+    """
+    return {pdb_id: metadata for pdb_id, (_, metadata) in _pdb_cache_load(pdb_ids).items()}
+
+
+def _pdb_cache_save(entries: Dict[str, Tuple[float, Dict[str, Any]]]) -> None:
+    """
+    Add resolved PDB metadata to the on-disk cache.
+    
+    Metadata dictionaries are stored as JSON strings because their nested
+    structure lists do not map onto a fixed Parquet schema. Existing rows for
+    the same PDB IDs are replaced; expired and outdated rows are dropped.
+    
+    Args:
+        entries: Mapping of uppercase PDB ID to (fetched_at timestamp, resolved metadata)
+    """
+    cache_file = _pdb_cache_path()
+    with start_action(action_type="pdb_cache_save", path=str(cache_file), count=len(entries)) as action:
+        df = pl.DataFrame(
+            {
+                "pdb_id": list(entries.keys()),
+                "metadata_json": [_json_dumps(metadata) for _, metadata in entries.values()],
+                "fetched_at": [fetched_at for fetched_at, _ in entries.values()],
+                "schema_version": [PDB_METADATA_CACHE_VERSION] * len(entries),
+            },
+            schema={
+                "pdb_id": pl.String,
+                "metadata_json": pl.String,
+                "fetched_at": pl.Float64,
+                "schema_version": pl.Int32,
+            },
+        )
+        lf = _pdb_cache_scan()
+        if lf is not None:
+            try:
+                existing = lf.filter(~pl.col("pdb_id").is_in(df.get_column("pdb_id"))).collect()
+                df = pl.concat([existing, df.cast(existing.schema)])
+            except Exception as e:
+                # An unreadable cache is replaced by the new entries
+                action.log(message_type="pdb_cache_unreadable", error=str(e))
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            # Write a per-process sibling and swap it in so concurrent writers
+            # (e.g. parallel test workers) never leave a half-written cache
+            tmp_cache_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+            df.write_parquet(tmp_cache_file)
+            os.replace(tmp_cache_file, cache_file)
+        except OSError as e:
+            # Caching is best-effort; a read-only home should not break indexing
+            action.log(message_type="pdb_cache_write_failed", error=str(e))
+        action.log(message_type="pdb_cache_saved", total=df.height)
+
+
 @app.command()
 def index(
     dataset_dir: Path = typer.Option(
@@ -582,6 +1378,11 @@ def index(
         False,
         "--include-metadata",
         help="Include full metadata dictionary in output (makes file larger)"
+    ),
+    refresh_metadata: bool = typer.Option(
+        False,
+        "--refresh-metadata",
+        help="Ignore cached PDB metadata and query PDBe/UniProt again"
     )
 ) -> None:
     """
@@ -594,6 +1395,8 @@ def index(
     - Counts and statistics from files
     
     The index is saved as a Parquet file for efficient querying and analysis.
+    Resolved PDB metadata is cached in ~/.cache/atomica-mcp/pdb_metadata.parquet
+    for 30 days, so re-indexing only queries the APIs for new structures.
     Boolean flags like "has_metadata" are not included as they can be computed from queries
     (e.g., pl.col("metadata_path").is_not_null()).
     
@@ -606,6 +1409,9 @@ def index(
         
         # Include full metadata in the index
         dataset index --include-metadata
+        
+        # Re-query PDBe/UniProt instead of using cached metadata
+        dataset index --refresh-metadata
     """
     # Set up logging
     setup_logging("index_dataset")
@@ -631,93 +1437,102 @@ def index(
         records: List[Dict[str, Any]] = []
         
         # Step 1: Collect all PDB IDs and basic file info
-        pdb_data = []
-        for i, cif_file in enumerate(cif_files, 1):
+        pdb_data: List[PdbRow] = []
+        dir_listings: Dict[Path, Tuple[frozenset, str]] = {}
+        for cif_file in cif_files:
             pdb_id = cif_file.stem
             pdb_dir = cif_file.parent
             
-            # Define expected file paths (relative to parent directory)
-            cif_path = cif_file
-            metadata_path = pdb_dir / f"{pdb_id}_metadata.json"
-            summary_path = pdb_dir / f"{pdb_id}_summary.json"
-            critical_residues_path = pdb_dir / f"{pdb_id}_critical_residues.tsv"
-            interact_scores_path = pdb_dir / f"{pdb_id}_interact_scores.json"
-            pymol_path = pdb_dir / f"{pdb_id}_pymol_commands.pml"
+            # One scandir per directory replaces an exists() call per expected file
+            if pdb_dir not in dir_listings:
+                with os.scandir(pdb_dir) as entries:
+                    present = frozenset(entry.name for entry in entries if entry.is_file())
+                rel_dir = pdb_dir.relative_to(dataset_dir)
+                dir_listings[pdb_dir] = (present, "" if rel_dir == Path(".") else str(rel_dir) + os.sep)
+            present, rel_prefix = dir_listings[pdb_dir]
             
-            pdb_data.append({
-                "pdb_id": pdb_id,
-                "cif_path": cif_path,
-                "metadata_path": metadata_path,
-                "summary_path": summary_path,
-                "critical_residues_path": critical_residues_path,
-                "interact_scores_path": interact_scores_path,
-                "pymol_path": pymol_path,
-            })
-        
-        # Step 2: Resolve metadata for all PDB IDs (one by one but with progress tracking)
+            # Define expected file paths (relative to parent directory)
+            pdb_data.append(PdbRow(
+                pdb_id=pdb_id,
+                cif_path=cif_file,
+                metadata_path=pdb_dir / f"{pdb_id}_metadata.json",
+                summary_path=pdb_dir / f"{pdb_id}_summary.json",
+                critical_residues_path=pdb_dir / f"{pdb_id}_critical_residues.tsv",
+                interact_scores_path=pdb_dir / f"{pdb_id}_interact_scores.json",
+                pymol_path=pdb_dir / f"{pdb_id}_pymol_commands.pml",
+                present=present,
+                rel_prefix=rel_prefix,
+            ))
+        
+        # Read all local per-structure files in parallel (file I/O releases the GIL)
+        with ThreadPoolExecutor(max_workers=min(LOCAL_READ_WORKERS, len(pdb_data))) as executor:
+            local_data = list(executor.map(_read_local, pdb_data))
+        
+        # Step 2: Resolve metadata for all PDB IDs concurrently; requests are
+        # network-bound and get_pdb_metadata already retries transient failures
         typer.echo(f"\n🔬 Resolving metadata for {len(pdb_data)} structures...")
+        pdb_ids = [pdb_info.pdb_id for pdb_info in pdb_data]
+        metadata_cache = {} if refresh_metadata else _pdb_cache_load([pdb_id.upper() for pdb_id in pdb_ids])
+        resolved_by_pdb: Dict[str, Dict[str, Any]] = {
+            pdb_id: metadata_cache[pdb_id.upper()][1]
+            for pdb_id in pdb_ids
+            if pdb_id.upper() in metadata_cache
+        }
+        to_resolve = [pdb_id for pdb_id in pdb_ids if pdb_id not in resolved_by_pdb]
+        if resolved_by_pdb:
+            typer.echo(f"  ⚡ {len(resolved_by_pdb)} structures loaded from metadata cache")
+        
+        # UniProt IDs of cached structures are already known, so start their
+        # UniProt lookup now and overlap it with resolving the cache misses
+        uniprot_executor = ThreadPoolExecutor(max_workers=1)
+        cached_uniprot_ids = sorted({
+            uniprot_id
+            for resolved_metadata in resolved_by_pdb.values()
+            for uniprot_id in resolved_metadata.get("uniprot_ids", [])
+        })
+        uniprot_prefetch = (
+            uniprot_executor.submit(get_uniprot_info_batch, cached_uniprot_ids)
+            if cached_uniprot_ids else None
+        )
+        
+        if to_resolve:
+            with _progress_bar() as progress, ThreadPoolExecutor(max_workers=min(METADATA_RESOLVE_WORKERS, len(to_resolve))) as executor:
+                task_id = progress.add_task("Resolving metadata", total=len(to_resolve))
+                for pdb_id, resolved_metadata in zip(to_resolve, executor.map(resolve_pdb_metadata, to_resolve)):
+                    resolved_by_pdb[pdb_id] = resolved_metadata
+                    progress.advance(task_id)
+            # Only cache successful lookups so transient API failures are retried next run
+            fetched_at = time.time()
+            new_entries = {
+                pdb_id.upper(): (fetched_at, resolved_by_pdb[pdb_id])
+                for pdb_id in to_resolve
+                if resolved_by_pdb[pdb_id].get("found")
+            }
+            if new_entries:
+                _pdb_cache_save(new_entries)
         
-        for i, pdb_info in enumerate(pdb_data, 1):
-            pdb_id = pdb_info["pdb_id"]
+        not_found = [pdb_id for pdb_id in pdb_ids if not resolved_by_pdb[pdb_id].get("found")]
+        if not_found:
+            typer.echo(f"  ⚠ No metadata resolved for {len(not_found)} structures (details in the log)")
+        
+        # Step 3: Build records; all I/O has been done above
+        for pdb_info, (metadata_json, summary_json, critical_residues_count) in zip(pdb_data, local_data):
+            pdb_id = pdb_info.pdb_id
             
             with start_action(action_type="index_pdb", pdb_id=pdb_id) as pdb_action:
-                # Read metadata JSON if it exists (for quick lookup)
-                metadata_json: Optional[Dict[str, Any]] = None
-                if pdb_info["metadata_path"].exists():
-                    with start_action(action_type="read_metadata_json", path=str(pdb_info["metadata_path"])) as read_action:
-                        try:
-                            with open(pdb_info["metadata_path"], 'r') as f:
-                                metadata_json = json.load(f)
-                            read_action.log(message_type="metadata_json_loaded")
-                        except Exception as e:
-                            read_action.log(message_type="metadata_read_error", error=str(e))
-                
-                # Read summary JSON if it exists
-                summary_json: Optional[Dict[str, Any]] = None
-                if pdb_info["summary_path"].exists():
-                    with start_action(action_type="read_summary_json", path=str(pdb_info["summary_path"])) as read_action:
-                        try:
-                            with open(pdb_info["summary_path"], 'r') as f:
-                                summary_json = json.load(f)
-                            read_action.log(message_type="summary_json_loaded")
-                        except Exception as e:
-                            read_action.log(message_type="summary_read_error", error=str(e))
-                
-                # Count critical residues if file exists
-                critical_residues_count: Optional[int] = None
-                if pdb_info["critical_residues_path"].exists():
-                    with start_action(action_type="count_critical_residues", path=str(pdb_info["critical_residues_path"])) as count_action:
-                        try:
-                            with open(pdb_info["critical_residues_path"], 'r') as f:
-                                # Count non-comment, non-empty lines
-                                critical_residues_count = sum(1 for line in f if line.strip() and not line.startswith('#'))
-                            count_action.log(message_type="residues_counted", count=critical_residues_count)
-                        except Exception as e:
-                            count_action.log(message_type="critical_residues_count_error", error=str(e))
-                
-                # Resolve protein metadata using comprehensive PDB mining
-                typer.echo(f"  [{i}/{len(pdb_data)}] Resolving metadata for {pdb_id}...", nl=False)
-                resolved_metadata = resolve_pdb_metadata(pdb_id)
-                
-                if resolved_metadata.get("found"):
-                    uniprot_count = len(resolved_metadata.get('uniprot_ids', []))
-                    gene_count = len(resolved_metadata.get('gene_symbols', []))
-                    organism = resolved_metadata.get('organisms', [])[0] if resolved_metadata.get('organisms') else None
-                    typer.echo(f" ✓ ({uniprot_count} UniProt, {gene_count} genes, {organism or 'no organism'})")
-                else:
-                    error_msg = resolved_metadata.get("error", "Unknown error")
-                    typer.echo(f" ⚠ {error_msg}")
+                # Protein metadata was resolved up front
+                resolved_metadata = resolved_by_pdb[pdb_id]
                 
                 # Build record (without boolean flags - can be computed via queries)
                 record = {
                     "pdb_id": pdb_id.upper(),
                     # File paths (relative to dataset dir or None if not exist)
-                    "cif_path": str(pdb_info["cif_path"].relative_to(dataset_dir)) if pdb_info["cif_path"].exists() else None,
-                    "metadata_path": str(pdb_info["metadata_path"].relative_to(dataset_dir)) if pdb_info["metadata_path"].exists() else None,
-                    "summary_path": str(pdb_info["summary_path"].relative_to(dataset_dir)) if pdb_info["summary_path"].exists() else None,
-                    "critical_residues_path": str(pdb_info["critical_residues_path"].relative_to(dataset_dir)) if pdb_info["critical_residues_path"].exists() else None,
-                    "interact_scores_path": str(pdb_info["interact_scores_path"].relative_to(dataset_dir)) if pdb_info["interact_scores_path"].exists() else None,
-                    "pymol_path": str(pdb_info["pymol_path"].relative_to(dataset_dir)) if pdb_info["pymol_path"].exists() else None,
+                    "cif_path": pdb_info.relative(pdb_info.cif_path),
+                    "metadata_path": pdb_info.relative(pdb_info.metadata_path),
+                    "summary_path": pdb_info.relative(pdb_info.summary_path),
+                    "critical_residues_path": pdb_info.relative(pdb_info.critical_residues_path),
+                    "interact_scores_path": pdb_info.relative(pdb_info.interact_scores_path),
+                    "pymol_path": pdb_info.relative(pdb_info.pymol_path),
                     # Counts and stats
                     "critical_residues_count": critical_residues_count,
                     "total_time_seconds": summary_json.get("total_time_seconds") if summary_json else None,
@@ -730,8 +1545,8 @@ def index(
                     "taxonomy_ids": resolved_metadata.get("taxonomy_ids", []),
                     "gene_symbols": resolved_metadata.get("gene_symbols", []),
                     "ensembl_ids": resolved_metadata.get("ensembl_ids", []),
-                    # Convert structures to JSON string to avoid Parquet serialization issues
-                    "structures_json": json.dumps(resolved_metadata.get("structures", [])) if resolved_metadata.get("structures") else None,
+                    # Nested column; see STRUCTURES_DTYPE
+                    "structures": _structures_for_index(resolved_metadata.get("structures", [])),
                 }
                 
                 # Optionally include full metadata
@@ -744,11 +1559,12 @@ def index(
                 pdb_action.log(
                     message_type="pdb_indexed",
                     metadata_found=resolved_metadata.get("found", False),
+                    error=resolved_metadata.get("error"),
                     uniprot_count=len(resolved_metadata.get("uniprot_ids", [])),
                     organisms=resolved_metadata.get("organisms", [])
                 )
         
-        # Step 3: Batch-resolve Ensembl IDs and organisms for all UniProt IDs
+        # Step 4: Batch-resolve Ensembl IDs and organisms for all UniProt IDs
         typer.echo("\n🧬 Batch-resolving Ensembl IDs and organisms for all UniProt IDs...")
         
         # Collect all unique UniProt IDs
@@ -756,30 +1572,40 @@ def index(
         for record in records:
             all_uniprot_ids.update(record.get("uniprot_ids", []))
         
+        uniprot_info_map = uniprot_prefetch.result() if uniprot_prefetch else {}
+        uniprot_executor.shutdown()
+        
         if all_uniprot_ids:
-            from atomica_mcp.mining.pdb_metadata import get_uniprot_info_batch
-            
             typer.echo(f"  Found {len(all_uniprot_ids)} unique UniProt IDs to resolve")
-            uniprot_info_map = get_uniprot_info_batch(list(all_uniprot_ids))
+            remaining_uniprot_ids = [
+                uniprot_id for uniprot_id in all_uniprot_ids if uniprot_id not in uniprot_info_map
+            ]
+            if remaining_uniprot_ids:
+                uniprot_info_map.update(get_uniprot_info_batch(remaining_uniprot_ids))
+            
+            # Derive (Ensembl IDs, organism, taxonomy ID) once per UniProt ID;
+            # records share UniProt IDs, so per-record work is just set unions
+            uniprot_derived: Dict[str, Tuple[frozenset, Optional[str], Optional[int]]] = {
+                uniprot_id: (
+                    frozenset(uniprot_info.get("ensembl_ids", ())),
+                    uniprot_info.get("organism"),
+                    uniprot_info.get("tax_id"),
+                )
+                for uniprot_id, uniprot_info in uniprot_info_map.items()
+                if uniprot_info
+            }
             
             # Update records with Ensembl IDs and organism info from UniProt
             for record in records:
-                ensembl_ids_set = set()
-                organisms_set = set()
-                taxonomy_ids_set = set()
-                
-                for uniprot_id in record.get("uniprot_ids", []):
-                    uniprot_info = uniprot_info_map.get(uniprot_id)
-                    if uniprot_info:
-                        # Add Ensembl IDs
-                        if "ensembl_ids" in uniprot_info:
-                            ensembl_ids_set.update(uniprot_info["ensembl_ids"])
-                        
-                        # Add organism info from UniProt (more reliable than PDB)
-                        if uniprot_info.get("organism"):
-                            organisms_set.add(uniprot_info["organism"])
-                        if uniprot_info.get("tax_id"):
-                            taxonomy_ids_set.add(uniprot_info["tax_id"])
+                derived = [
+                    uniprot_derived[uniprot_id]
+                    for uniprot_id in record.get("uniprot_ids", [])
+                    if uniprot_id in uniprot_derived
+                ]
+                ensembl_ids_set = set().union(*(ensembl_ids for ensembl_ids, _, _ in derived))
+                # Organism info from UniProt is more reliable than PDB
+                organisms_set = {organism for _, organism, _ in derived if organism}
+                taxonomy_ids_set = {tax_id for _, _, tax_id in derived if tax_id}
                 
                 record["ensembl_ids"] = list(ensembl_ids_set)
                 # Override organisms and taxonomy_ids with UniProt data
@@ -793,51 +1619,71 @@ def index(
         
         # Create DataFrame
         typer.echo("\n📊 Creating index DataFrame...")
-        df = pl.DataFrame(records)
+        df = pl.from_dicts(records, schema_overrides={"structures": STRUCTURES_DTYPE})
+        # Pre-format gene symbols once so search results don't join them per query
+        df = df.with_columns(
+            pl.col("gene_symbols").cast(pl.List(pl.String)).list.join(", ").alias("gene_symbols_display")
+        )
+        
+        def write_index(path: Path) -> None:
+            # Streamed through the native writer, one row group per INDEX_ROW_GROUP_SIZE rows
+            df.lazy().sink_parquet(path, **INDEX_PARQUET_OPTIONS)
         
         # Ensure output directory exists
         output_file.parent.mkdir(parents=True, exist_ok=True)
         
         # Save to primary output location
         typer.echo(f"💾 Saving index to: {output_file}")
-        df.write_parquet(output_file)
+        write_index(output_file)
         
-        # Also save to dataset directory if requested
+        # Also save to dataset directory if requested; the bytes are identical,
+        # so copy the file instead of encoding the DataFrame a second time
         if save_to_dataset:
             dataset_index_path = dataset_dir / "atomica_index.parquet"
-            typer.echo(f"💾 Saving index to dataset directory: {dataset_index_path}")
-            df.write_parquet(dataset_index_path)
+            if dataset_index_path.resolve() != output_file.resolve():
+                typer.echo(f"💾 Saving index to dataset directory: {dataset_index_path}")
+                shutil.copyfile(output_file, dataset_index_path)
         
         # Print summary statistics
         typer.echo("\n" + "="*60)
         typer.echo("📊 Dataset Index Summary:")
         typer.echo(f"  Total structures: {len(df)}")
         
-        # Count structures with complete datasets (all file paths not null)
-        complete_count = df.filter(
-            pl.col('metadata_path').is_not_null() & 
-            pl.col('summary_path').is_not_null() & 
-            pl.col('critical_residues_path').is_not_null()
-        ).height
+        # Complete datasets (all file paths not null), resolved metadata,
+        # UniProt/gene/Ensembl totals and the organism distribution, evaluated
+        # together so Polars plans both queries over the same frame at once
+        lf = df.lazy()
+        stats_lf = lf.select([
+            (
+                pl.col('metadata_path').is_not_null() &
+                pl.col('summary_path').is_not_null() &
+                pl.col('critical_residues_path').is_not_null()
+            ).sum().alias('complete'),
+            pl.col('metadata_found').sum().alias('with_metadata'),
+            pl.col('uniprot_ids').list.len().sum().alias('total_uniprot'),
+            pl.col('gene_symbols').list.len().sum().alias('total_genes'),
+            pl.col('ensembl_ids').list.len().sum().alias('total_ensembl'),
+        ])
+        org_counts_lf = (
+            lf.select(pl.col('organisms').cast(pl.List(pl.String)).explode())
+            .filter(pl.col('organisms').is_not_null() & (pl.col('organisms') != ""))
+            .group_by('organisms')
+            .len(name='count')
+            .sort(['count', 'organisms'], descending=[True, False])
+        )
+        stats, org_counts = pl.collect_all([stats_lf, org_counts_lf])
+        complete_count, with_metadata, total_uniprot, total_genes, total_ensembl = stats.row(0)
         typer.echo(f"  Complete datasets (all files): {complete_count}")
-        typer.echo(f"  With metadata resolved: {df.filter(pl.col('metadata_found')).height}")
-        
-        # Count total UniProt IDs, genes, and Ensembl IDs
-        total_uniprot = sum(len(ids) for ids in df['uniprot_ids'].to_list())
-        total_genes = sum(len(genes) for genes in df['gene_symbols'].to_list())
-        total_ensembl = sum(len(ids) for ids in df['ensembl_ids'].to_list())
+        typer.echo(f"  With metadata resolved: {with_metadata}")
         typer.echo(f"  Total UniProt IDs: {total_uniprot}")
         typer.echo(f"  Total gene symbols: {total_genes}")
         typer.echo(f"  Total Ensembl IDs: {total_ensembl}")
         
         # Show organism distribution
-        all_organisms = [org for orgs in df['organisms'].to_list() for org in orgs if org]
-        if all_organisms:
-            from collections import Counter
-            org_counts = Counter(all_organisms)
-            typer.echo(f"  Unique organisms: {len(org_counts)}")
+        if org_counts.height:
+            typer.echo(f"  Unique organisms: {org_counts.height}")
             typer.echo("\n  Top organisms:")
-            for org, count in org_counts.most_common(5):
+            for org, count in org_counts.head(5).iter_rows():
                 typer.echo(f"    • {org}: {count} structures")
         
         typer.echo(f"\n  📁 Index saved: {output_file.resolve()}")
@@ -852,7 +1698,7 @@ def index(
         action.log(
             message_type="index_complete",
             total_structures=len(df),
-            unique_organisms=len(set(org for orgs in df['organisms'].to_list() for org in orgs if org)),
+            unique_organisms=org_counts.height,
             total_uniprot_ids=total_uniprot,
             total_gene_symbols=total_genes,
             total_ensembl_ids=total_ensembl
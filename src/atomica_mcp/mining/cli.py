@@ -114,6 +114,15 @@ def get_uniprot(
     no_alphafold: bool = typer.Option(
         False, "--no-alphafold", help="Exclude AlphaFold structures"
     ),
+    max_structures: Optional[int] = typer.Option(
+        None, "--max-structures", "-n", help="Only fetch metadata for the N best-ranked PDB entries"
+    ),
+    max_resolution: Optional[float] = typer.Option(
+        None, "--max-resolution", help="Skip PDB entries with worse resolution (Angstrom)"
+    ),
+    min_coverage: Optional[float] = typer.Option(
+        None, "--min-coverage", help="Skip PDB entries covering less of the sequence (0-1)"
+    ),
     pretty: bool = typer.Option(
         True, "--pretty/--no-pretty", help="Pretty print JSON output"
     ),
@@ -132,6 +141,9 @@ def get_uniprot(
     
     Example:
         pdb-mining uniprot P22307 -o p22307_structures.json
+        
+        # Only the 5 best-ranked entries at 3.5 A or better covering half the sequence
+        pdb-mining uniprot P04637 -n 5 --max-resolution 3.5 --min-coverage 0.5
     """
     setup_logging(log_file)
     
@@ -139,7 +151,10 @@ def get_uniprot(
         with console.status(f"[bold green]Fetching structures for UniProt {uniprot_id}..."):
             structures = get_structures_for_uniprot(
                 uniprot_id, 
-                include_alphafold=not no_alphafold
+                include_alphafold=not no_alphafold,
+                max_structures=max_structures,
+                max_resolution=max_resolution,
+                min_coverage=min_coverage
             )
         
         if not structures:
@@ -9,10 +9,18 @@ This module provides functions to retrieve and resolve PDB metadata including:
 - Chain mappings and coverage information
 """
 
+import copy
+import functools
+import os
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, List, Optional, Any, Tuple
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 import requests
+from requests.adapters import HTTPAdapter
 from eliot import start_action
 from tenacity import (
     retry,
@@ -23,9 +31,144 @@ from tenacity import (
 )
 import logging
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; Response.json() is used without it
+    orjson = None
+
+try:
+    import requests_cache
+except ImportError:  # requests-cache is optional; without it every call goes to the network
+    requests_cache = None
+
 # Setup logger for tenacity
 logger = logging.getLogger(__name__)
 
+# Connection pool sizes for the shared HTTP session
+HTTP_POOL_CONNECTIONS = 16
+HTTP_POOL_MAXSIZE = 32
+
+# On-disk HTTP cache used when requests-cache is installed (ATOMICA_MCP_HTTP_CACHE=0 disables it).
+# Entries and mappings change rarely, so GET responses are reused for a day, searches for an hour.
+HTTP_CACHE_EXPIRE_SECONDS = 24 * 3600
+HTTP_CACHE_URLS_EXPIRE_AFTER = {
+    "search.rcsb.org": 3600,
+    "rest.uniprot.org/uniprotkb/search": 3600,
+}
+# 404s are cached too so unknown IDs are not re-queried; POSTs here (PDBe batches,
+# RCSB GraphQL) are read-only queries keyed by their body
+HTTP_CACHE_ALLOWABLE_CODES = (200, 404)
+HTTP_CACHE_ALLOWABLE_METHODS = ("GET", "HEAD", "POST")
+
+# PDB IDs per POST to PDBe entry endpoints in get_pdb_structure_metadata_batch
+PDBE_BATCH_SIZE = 100
+
+# UniProt accessions endpoint used by get_uniprot_info_batch; it takes up to 500
+# accessions per page, so larger batches are split into chunks of this size
+UNIPROT_ACCESSIONS_URL = "https://rest.uniprot.org/uniprotkb/accessions"
+UNIPROT_ACCESSIONS_BATCH_SIZE = 500
+
+# Concurrent per-ID UniProt lookups in get_uniprot_info_batch (isoforms and failed chunks)
+UNIPROT_BATCH_WORKERS = 8
+
+# UniProtKB accession format (https://www.uniprot.org/help/accession_numbers), with an optional isoform suffix
+_UNIPROT_ACCESSION_PATTERN = re.compile(
+    r"^([OPQ][0-9][A-Z0-9]{3}[0-9]|[A-NR-Z][0-9]([A-Z][A-Z0-9]{2}[0-9]){1,2})(-[0-9]+)?$"
+)
+
+# Concurrent gene/AlphaFold and per-entry PDB-REDO/complex lookups in get_structures_for_uniprot
+STRUCTURE_DETAIL_WORKERS = 8
+
+# Entries per function kept by _cache_lookup (gene symbols, UniProt entries, ...); only hits
+# are stored. A PDB entry looks each UniProt ID up more than once and entries of one
+# protein share IDs
+LOOKUP_CACHE_SIZE = 4096
+_LOOKUP_LOCK = threading.Lock()
+
+
+def _cache_lookup(is_hit: Callable[[Any], bool] = lambda result: result is not None) -> Callable:
+    """
+    Keep successful results of a single-ID lookup for the life of the process.
+    
+    The same UniProt and PDB IDs come up across structures and runs of one process, so
+    repeated lookups skip the network entirely. Misses are not stored because they also
+    cover transient HTTP errors. Results are mutable, so the cache holds its own copy and
+    hands out copies.
+    
+    Args:
+        is_hit: Tells whether a result should be kept
+    
+    Returns:
+        Decorator for a function taking one ID; the wrapper gains cache_clear() and a
+        cache_seed(key, result) method for results found by other lookups
+    """
+    def decorator(func: Callable[[str], Any]) -> Callable[[str], Any]:
+        cache: Dict[str, Any] = {}
+        
+        @functools.wraps(func)
+        def wrapper(key: str) -> Any:
+            cached = cache.get(key)
+            if cached is not None:
+                return copy.deepcopy(cached)
+            result = func(key)
+            if is_hit(result):
+                with _LOOKUP_LOCK:
+                    if len(cache) < LOOKUP_CACHE_SIZE:
+                        cache[key] = copy.deepcopy(result)
+            return result
+        
+        def cache_seed(key: str, result: Any) -> None:
+            if is_hit(result):
+                with _LOOKUP_LOCK:
+                    if len(cache) < LOOKUP_CACHE_SIZE:
+                        cache.setdefault(key, copy.deepcopy(result))
+        
+        wrapper.cache_clear = cache.clear
+        wrapper.cache_seed = cache_seed
+        return wrapper
+    return decorator
+
+
+def _make_session() -> requests.Session:
+    """
+    Create a requests session with a connection pool large enough for threaded callers.
+
+    Retries are left to the tenacity decorators so failed requests are not retried twice.
+    When requests-cache is installed, successful and not-found responses are also stored in a
+    SQLite cache under the atomica-mcp cache directory, so repeated lookups across
+    runs skip the network.
+
+    Returns:
+        Configured requests session
+    """
+    session: Optional[requests.Session] = None
+    if requests_cache is not None and os.getenv("ATOMICA_MCP_HTTP_CACHE", "1") != "0":
+        # Same location as atomica_mcp.dataset.get_cache_dir, which imports this module
+        cache_dir = Path(os.environ.get("ATOMICA_MCP_CACHE_DIR", Path.home() / ".cache" / "atomica-mcp")).expanduser()
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            session = requests_cache.CachedSession(
+                cache_name=str(cache_dir / "http_cache"),
+                backend="sqlite",
+                expire_after=HTTP_CACHE_EXPIRE_SECONDS,
+                urls_expire_after=HTTP_CACHE_URLS_EXPIRE_AFTER,
+                allowable_codes=HTTP_CACHE_ALLOWABLE_CODES,
+                allowable_methods=HTTP_CACHE_ALLOWABLE_METHODS,
+            )
+        except OSError as e:
+            # Caching is best-effort; a read-only cache directory should not break lookups
+            logger.warning("HTTP cache disabled: %s", e)
+    if session is None:
+        session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=HTTP_POOL_CONNECTIONS, pool_maxsize=HTTP_POOL_MAXSIZE)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+# Shared session so repeated PDBe/RCSB/UniProt calls reuse keep-alive connections
+_SESSION = _make_session()
+
 
 @dataclass
 class ComplexInfo:
@@ -114,6 +257,27 @@ class PDBMetadata:
         }
 
 
+def _response_json(response: requests.Response) -> Any:
+    """
+    Decode a JSON response body, using orjson when it is installed.
+    
+    Decoding errors are raised as requests' JSONDecodeError, like Response.json(),
+    so RequestException handlers and retries treat them the same way.
+    
+    Args:
+        response: Response with a JSON body
+    
+    Returns:
+        Decoded JSON value
+    """
+    if orjson is None:
+        return response.json()
+    try:
+        return orjson.loads(response.content)
+    except orjson.JSONDecodeError as e:
+        raise requests.exceptions.JSONDecodeError(e.msg, e.doc, e.pos)
+
+
 @retry(
     stop=stop_after_attempt(3),
     wait=wait_exponential(multiplier=1, min=2, max=10),
@@ -123,7 +287,7 @@ class PDBMetadata:
 def _make_request(url: str, timeout: int = 30) -> requests.Response:
     """Make HTTP request with retry logic."""
     with start_action(action_type="http_request", url=url) as action:
-        response = requests.get(url, timeout=timeout)
+        response = _SESSION.get(url, timeout=timeout)
         response.raise_for_status()
         return response
 
@@ -131,7 +295,7 @@ def _make_request(url: str, timeout: int = 30) -> requests.Response:
 def _make_request_with_error_handling(url: str, timeout: int = 30) -> Optional[requests.Response]:
     """Make HTTP request that returns None on HTTP errors."""
     try:
-        response = requests.get(url, timeout=timeout)
+        response = _SESSION.get(url, timeout=timeout)
         response.raise_for_status()
         return response
     except requests.exceptions.HTTPError as e:
@@ -139,6 +303,7 @@ def _make_request_with_error_handling(url: str, timeout: int = 30) -> Optional[r
         return None
 
 
+@_cache_lookup()
 def get_gene_symbol(uniprot_id: str) -> Optional[str]:
     """
     Retrieve gene symbol for a UniProt ID.
@@ -158,7 +323,7 @@ def get_gene_symbol(uniprot_id: str) -> Optional[str]:
             action.log(message_type="gene_symbol_invalid_id")
             return None
 
-        data = response.json()
+        data = _response_json(response)
 
         if "genes" in data and len(data["genes"]) > 0:
             if "geneName" in data["genes"][0]:
@@ -170,6 +335,60 @@ def get_gene_symbol(uniprot_id: str) -> Optional[str]:
         return None
 
 
+def _parse_uniprot_entry(uniprot_id: str, data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Extract the fields returned by get_uniprot_info from a UniProtKB JSON entry.
+    
+    Args:
+        uniprot_id: UniProt accession the entry was requested by
+        data: UniProtKB entry as returned by the REST API
+        
+    Returns:
+        Dictionary with UniProt information
+    """
+    info: Dict[str, Any] = {
+        "uniprot_id": uniprot_id,
+        "protein_name": None,
+        "gene_symbol": None,
+        "organism": None,
+        "tax_id": None,
+        "sequence_length": None,
+        "ensembl_ids": [],
+    }
+    
+    # Extract protein name
+    if "proteinDescription" in data:
+        if "recommendedName" in data["proteinDescription"]:
+            info["protein_name"] = data["proteinDescription"]["recommendedName"]["fullName"]["value"]
+    
+    # Extract gene symbol
+    if "genes" in data and len(data["genes"]) > 0:
+        if "geneName" in data["genes"][0]:
+            info["gene_symbol"] = data["genes"][0]["geneName"]["value"]
+    
+    # Extract organism
+    if "organism" in data:
+        info["organism"] = data["organism"]["scientificName"]
+        if "taxonId" in data["organism"]:
+            info["tax_id"] = data["organism"]["taxonId"]
+    
+    # Extract sequence length
+    if "sequence" in data:
+        info["sequence_length"] = data["sequence"]["length"]
+    
+    # Extract Ensembl IDs from cross-references
+    if "uniProtKBCrossReferences" in data:
+        for xref in data["uniProtKBCrossReferences"]:
+            db_name = xref.get("database", "")
+            if db_name in ["Ensembl", "EnsemblGenome"]:
+                ensembl_id = xref.get("id")
+                if ensembl_id:
+                    info["ensembl_ids"].append(ensembl_id)
+    
+    return info
+
+
+@_cache_lookup()
 def get_uniprot_info(uniprot_id: str) -> Optional[Dict[str, Any]]:
     """
     Get comprehensive UniProt information including Ensembl IDs.
@@ -183,77 +402,109 @@ def get_uniprot_info(uniprot_id: str) -> Optional[Dict[str, Any]]:
     with start_action(action_type="get_uniprot_info", uniprot_id=uniprot_id) as action:
         url = f"https://rest.uniprot.org/uniprotkb/{uniprot_id}.json"
         response = _make_request(url)
-        data = response.json()
-        
-        info: Dict[str, Any] = {
-            "uniprot_id": uniprot_id,
-            "protein_name": None,
-            "gene_symbol": None,
-            "organism": None,
-            "tax_id": None,
-            "sequence_length": None,
-            "ensembl_ids": [],
-        }
-        
-        # Extract protein name
-        if "proteinDescription" in data:
-            if "recommendedName" in data["proteinDescription"]:
-                info["protein_name"] = data["proteinDescription"]["recommendedName"]["fullName"]["value"]
-        
-        # Extract gene symbol
-        if "genes" in data and len(data["genes"]) > 0:
-            if "geneName" in data["genes"][0]:
-                info["gene_symbol"] = data["genes"][0]["geneName"]["value"]
-        
-        # Extract organism
-        if "organism" in data:
-            info["organism"] = data["organism"]["scientificName"]
-            if "taxonId" in data["organism"]:
-                info["tax_id"] = data["organism"]["taxonId"]
-        
-        # Extract sequence length
-        if "sequence" in data:
-            info["sequence_length"] = data["sequence"]["length"]
-        
-        # Extract Ensembl IDs from cross-references
-        if "uniProtKBCrossReferences" in data:
-            for xref in data["uniProtKBCrossReferences"]:
-                db_name = xref.get("database", "")
-                if db_name in ["Ensembl", "EnsemblGenome"]:
-                    ensembl_id = xref.get("id")
-                    if ensembl_id:
-                        info["ensembl_ids"].append(ensembl_id)
+        info = _parse_uniprot_entry(uniprot_id, _response_json(response))
         
         action.log(message_type="uniprot_info_retrieved", info=info)
         return info
 
 
+@retry(
+    stop=stop_after_attempt(3),
+    wait=wait_exponential(multiplier=1, min=2, max=10),
+    retry=retry_if_exception_type((requests.exceptions.RequestException, requests.exceptions.Timeout)),
+    before_sleep=before_sleep_log(logger, logging.WARNING),
+)
+def _fetch_uniprot_entries(accessions: List[str]) -> List[Dict[str, Any]]:
+    """
+    Fetch UniProtKB entries for up to UNIPROT_ACCESSIONS_BATCH_SIZE accessions in one request.
+    
+    Args:
+        accessions: Base UniProt accessions (no isoform suffix)
+        
+    Returns:
+        UniProtKB JSON entries; accessions UniProt does not know are left out
+    """
+    with start_action(action_type="fetch_uniprot_entries", count=len(accessions)):
+        params = {"accessions": ",".join(accessions), "format": "json", "size": len(accessions)}
+        response = _SESSION.get(UNIPROT_ACCESSIONS_URL, params=params, timeout=30)
+        response.raise_for_status()
+        return _response_json(response).get("results", [])
+
+
 def get_uniprot_info_batch(uniprot_ids: List[str]) -> Dict[str, Optional[Dict[str, Any]]]:
     """
     Get comprehensive UniProt information for multiple IDs in batch.
     
+    IDs are stripped and uppercased first. Plain accessions are fetched through the UniProt
+    accessions endpoint, one request per UNIPROT_ACCESSIONS_BATCH_SIZE IDs. Isoform IDs, IDs
+    that still do not look like accessions, and the IDs of any chunk whose request fails are
+    looked up one by one with get_uniprot_info. Gene symbols found along the way are added to
+    the get_gene_symbol cache.
+    
     Args:
         uniprot_ids: List of UniProt accession numbers
         
     Returns:
-        Dictionary mapping UniProt ID to its information (or None if not found)
+        Dictionary mapping each given UniProt ID to its information (or None if not found)
     """
     with start_action(action_type="get_uniprot_info_batch", count=len(uniprot_ids)) as action:
+        unique_ids = list(dict.fromkeys(uniprot_ids))
+        # Given ID -> ID actually looked up; unmatched IDs are passed on unchanged
+        lookup_ids: Dict[str, str] = {}
         results: Dict[str, Optional[Dict[str, Any]]] = {}
         
-        # Process in batches of 10 to avoid overwhelming the API
-        batch_size = 10
-        for i in range(0, len(uniprot_ids), batch_size):
-            batch = uniprot_ids[i:i+batch_size]
-            
-            for uniprot_id in batch:
-                try:
-                    info = get_uniprot_info(uniprot_id)
-                    results[uniprot_id] = info
-                except Exception as e:
-                    action.log(message_type="batch_fetch_error", uniprot_id=uniprot_id, error=str(e))
-                    results[uniprot_id] = None
+        seen: Set[str] = set()
+        accessions: List[str] = []
+        single_ids: List[str] = []
+        for uniprot_id in unique_ids:
+            normalized = uniprot_id.strip().upper()
+            match = _UNIPROT_ACCESSION_PATTERN.match(normalized)
+            lookup_id = normalized if match is not None else uniprot_id
+            lookup_ids[uniprot_id] = lookup_id
+            if lookup_id in seen:
+                continue
+            seen.add(lookup_id)
+            if match is not None and not match.group(3):
+                accessions.append(lookup_id)
+            else:
+                single_ids.append(lookup_id)
         
+        for start in range(0, len(accessions), UNIPROT_ACCESSIONS_BATCH_SIZE):
+            chunk = accessions[start:start + UNIPROT_ACCESSIONS_BATCH_SIZE]
+            try:
+                entries = _fetch_uniprot_entries(chunk)
+            except Exception as e:
+                action.log(message_type="batch_request_error", count=len(chunk), error=str(e))
+                single_ids.extend(chunk)
+                continue
+            # Entries come back under their primary accession; a requested secondary
+            # accession is matched through secondaryAccessions
+            entry_by_accession: Dict[str, Dict[str, Any]] = {}
+            for entry in entries:
+                for accession in [entry.get("primaryAccession")] + entry.get("secondaryAccessions", []):
+                    entry_by_accession.setdefault(accession, entry)
+            for accession in chunk:
+                entry = entry_by_accession.get(accession)
+                results[accession] = _parse_uniprot_entry(accession, entry) if entry is not None else None
+        
+        def fetch(uniprot_id: str) -> Optional[Dict[str, Any]]:
+            try:
+                return get_uniprot_info(uniprot_id)
+            except Exception as e:
+                action.log(message_type="batch_fetch_error", uniprot_id=uniprot_id, error=str(e))
+                return None
+        
+        # Leftovers go one request per ID; a bounded pool keeps several in flight
+        # on the shared session without overwhelming the API
+        if single_ids:
+            with ThreadPoolExecutor(max_workers=min(UNIPROT_BATCH_WORKERS, len(single_ids))) as executor:
+                results.update(zip(single_ids, executor.map(fetch, single_ids)))
+        
+        for lookup_id, info in results.items():
+            if info is not None:
+                get_gene_symbol.cache_seed(lookup_id, info["gene_symbol"])
+        
+        results = {uniprot_id: results[lookup_ids[uniprot_id]] for uniprot_id in unique_ids}
         action.log(message_type="batch_fetch_complete", success=len([v for v in results.values() if v is not None]))
         return results
 
@@ -289,6 +540,80 @@ def get_pdb_structures_from_uniprot(uniprot_id: str) -> List[str]:
         return pdb_ids
 
 
+def get_best_structures(uniprot_id: str) -> Optional[List[Dict[str, Any]]]:
+    """
+    Get PDB entries for a UniProt ID ranked by PDBe (coverage, then resolution).
+    
+    A single request to the PDBe best_structures mapping returns coverage and
+    resolution for every entry, so candidates can be filtered before any
+    per-structure metadata is fetched.
+    
+    Args:
+        uniprot_id: UniProt accession number
+    
+    Returns:
+        One dictionary per PDB entry (its best-ranked chain) with pdb_id, chain_id,
+        coverage, resolution, start and end, in PDBe rank order; None if the
+        mapping could not be retrieved
+    """
+    with start_action(action_type="get_best_structures", uniprot_id=uniprot_id) as action:
+        url = f"https://www.ebi.ac.uk/pdbe/api/mappings/best_structures/{uniprot_id}"
+        response = _make_request_with_error_handling(url)
+        
+        if response is None:
+            action.log(message_type="best_structures_unavailable")
+            return None
+        
+        best: List[Dict[str, Any]] = []
+        seen: set = set()
+        for entry in _response_json(response).get(uniprot_id, []):
+            pdb_id = entry.get("pdb_id")
+            if not pdb_id or pdb_id in seen:
+                continue
+            seen.add(pdb_id)
+            best.append(entry)
+        
+        action.log(message_type="best_structures_found", count=len(best))
+        return best
+
+
+def select_pdb_candidates(
+    uniprot_id: str,
+    max_structures: Optional[int] = None,
+    max_resolution: Optional[float] = None,
+    min_coverage: Optional[float] = None,
+) -> List[str]:
+    """
+    Choose which PDB entries of a UniProt ID are worth fetching metadata for.
+    
+    Entries come from get_best_structures and are filtered by resolution and
+    coverage, then capped at max_structures. Entries without a reported
+    resolution (e.g. NMR) are kept by the resolution filter. If the ranked
+    mapping is unavailable, the unranked UniProt cross-references are used
+    and only the cap applies.
+    
+    Args:
+        uniprot_id: UniProt accession number
+        max_structures: Maximum number of PDB IDs to return (None for all)
+        max_resolution: Maximum resolution in Angstrom (None for no limit)
+        min_coverage: Minimum fraction of the UniProt sequence covered, 0-1 (None for no limit)
+    
+    Returns:
+        PDB IDs in PDBe rank order
+    """
+    best = get_best_structures(uniprot_id)
+    if best is None:
+        pdb_ids = get_pdb_structures_from_uniprot(uniprot_id)
+    else:
+        pdb_ids = [
+            entry["pdb_id"]
+            for entry in best
+            if (max_resolution is None or entry.get("resolution") is None or entry["resolution"] <= max_resolution)
+            and (min_coverage is None or (entry.get("coverage") or 0.0) >= min_coverage)
+        ]
+    return pdb_ids if max_structures is None else pdb_ids[:max_structures]
+
+
 @retry(
     stop=stop_after_attempt(3),
     wait=wait_exponential(multiplier=1, min=2, max=10),
@@ -330,9 +655,9 @@ def resolve_gene_to_uniprot(gene_symbol: str, species: str = "9606") -> List[str
         }
         
         try:
-            response = requests.get(url, params=params, timeout=30)
+            response = _SESSION.get(url, params=params, timeout=30)
             response.raise_for_status()
-            data = response.json()
+            data = _response_json(response)
             
             uniprot_ids = []
             if "results" in data and len(data["results"]) > 0:
@@ -349,9 +674,9 @@ def resolve_gene_to_uniprot(gene_symbol: str, species: str = "9606") -> List[str
             # Try fallback with unreviewed entries
             try:
                 params["query"] = f"(gene:{gene_symbol}) AND ({species_query})"
-                response = requests.get(url, params=params, timeout=30)
+                response = _SESSION.get(url, params=params, timeout=30)
                 response.raise_for_status()
-                data = response.json()
+                data = _response_json(response)
                 
                 uniprot_ids = []
                 if "results" in data and len(data["results"]) > 0:
@@ -367,6 +692,7 @@ def resolve_gene_to_uniprot(gene_symbol: str, species: str = "9606") -> List[str
                 return []
 
 
+@_cache_lookup()
 def get_alphafold_structure(uniprot_id: str) -> Optional[StructureInfo]:
     """
     Get AlphaFold structure information for a UniProt ID.
@@ -386,7 +712,7 @@ def get_alphafold_structure(uniprot_id: str) -> Optional[StructureInfo]:
             action.log(message_type="alphafold_invalid_id")
             return None
 
-        data = response.json()
+        data = _response_json(response)
 
         if not data or len(data) == 0:
             action.log(message_type="alphafold_not_found")
@@ -407,6 +733,29 @@ def get_alphafold_structure(uniprot_id: str) -> Optional[StructureInfo]:
         return structure_info
 
 
+def _structure_metadata_from_summary(pdb_id: str, entry_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Build the get_pdb_structure_metadata dictionary from a PDBe entry summary (resolution unset)."""
+    # Format deposition date
+    dep_date = entry_data.get("deposition_date", "")
+    if len(dep_date) == 8:
+        dep_date = f"{dep_date[:4]}-{dep_date[4:6]}-{dep_date[6:]}"
+    
+    return {
+        "pdb_id": pdb_id.upper(),
+        "deposition_date": dep_date,
+        "experimental_method": entry_data.get("experimental_method", [""])[0].upper() if entry_data.get("experimental_method") else None,
+        "resolution": None,
+        "r_free": None,
+    }
+
+
+def _needs_resolution(metadata: Dict[str, Any]) -> bool:
+    """Whether the experiment endpoint has a resolution for this entry (not for NMR)."""
+    exp_method = metadata["experimental_method"]
+    return bool(exp_method) and "NMR" not in exp_method
+
+
+@_cache_lookup()
 def get_pdb_structure_metadata(pdb_id: str) -> Optional[Dict[str, Any]]:
     """
     Get comprehensive metadata for a PDB structure.
@@ -427,35 +776,21 @@ def get_pdb_structure_metadata(pdb_id: str) -> Optional[Dict[str, Any]]:
             action.log(message_type="pdb_metadata_invalid_id")
             return None
 
-        data = response.json()
+        data = _response_json(response)
 
         if pdb_id.lower() not in data:
             action.log(message_type="pdb_metadata_not_found")
             return None
         
-        entry_data = data[pdb_id.lower()][0]
-        
-        # Format deposition date
-        dep_date = entry_data.get("deposition_date", "")
-        if len(dep_date) == 8:
-            dep_date = f"{dep_date[:4]}-{dep_date[4:6]}-{dep_date[6:]}"
-        
-        metadata: Dict[str, Any] = {
-            "pdb_id": pdb_id.upper(),
-            "deposition_date": dep_date,
-            "experimental_method": entry_data.get("experimental_method", [""])[0].upper() if entry_data.get("experimental_method") else None,
-            "resolution": None,
-            "r_free": None,
-        }
+        metadata = _structure_metadata_from_summary(pdb_id, data[pdb_id.lower()][0])
         
         # Get experimental data for resolution
-        exp_method = metadata["experimental_method"]
-        if exp_method and "NMR" not in exp_method:
+        if _needs_resolution(metadata):
             exp_url = f"https://www.ebi.ac.uk/pdbe/api/pdb/entry/experiment/{pdb_id}"
             exp_response = _make_request_with_error_handling(exp_url)
 
             if exp_response is not None:
-                exp_data = exp_response.json()
+                exp_data = _response_json(exp_response)
                 if pdb_id.lower() in exp_data:
                     exp_entry = exp_data[pdb_id.lower()][0]
                     metadata["resolution"] = exp_entry.get("resolution")
@@ -464,6 +799,70 @@ def get_pdb_structure_metadata(pdb_id: str) -> Optional[Dict[str, Any]]:
         return metadata
 
 
+def _post_pdbe_batch(endpoint: str, pdb_ids: List[str]) -> Dict[str, Any]:
+    """
+    Query a PDBe entry endpoint for several PDB IDs with one POST request.
+    
+    Args:
+        endpoint: PDBe API endpoint URL ending in '/'
+        pdb_ids: Lowercase PDB IDs
+    
+    Returns:
+        Response mapping lowercase PDB ID to entries; IDs PDBe does not know are absent
+    
+    Raises:
+        requests.exceptions.RequestException: If the request fails
+    """
+    response = _SESSION.post(endpoint, data=",".join(pdb_ids), timeout=30)
+    response.raise_for_status()
+    return _response_json(response)
+
+
+def get_pdb_structure_metadata_batch(pdb_ids: List[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+    """
+    Get get_pdb_structure_metadata results for several PDB IDs in a few requests.
+    
+    The PDBe summary and experiment endpoints accept a comma-separated list of IDs
+    by POST, so PDBE_BATCH_SIZE entries cost two requests instead of two per entry.
+    A batch that fails is looked up entry by entry instead.
+    
+    Args:
+        pdb_ids: PDB identifiers (case-insensitive)
+    
+    Returns:
+        Mapping of each requested PDB ID (as given) to its metadata, or None if not found
+    """
+    with start_action(action_type="get_pdb_structure_metadata_batch", count=len(pdb_ids)) as action:
+        results: Dict[str, Optional[Dict[str, Any]]] = {}
+        unique_ids = list(dict.fromkeys(pdb_ids))
+        for start in range(0, len(unique_ids), PDBE_BATCH_SIZE):
+            chunk = unique_ids[start:start + PDBE_BATCH_SIZE]
+            lower_ids = [pdb_id.lower() for pdb_id in chunk]
+            try:
+                summaries = _post_pdbe_batch("https://www.ebi.ac.uk/pdbe/api/pdb/entry/summary/", lower_ids)
+                metadata_by_id = {
+                    pdb_id: _structure_metadata_from_summary(pdb_id, summaries[pdb_id.lower()][0])
+                    for pdb_id in chunk
+                    if summaries.get(pdb_id.lower())
+                }
+                resolution_ids = [pdb_id.lower() for pdb_id, metadata in metadata_by_id.items() if _needs_resolution(metadata)]
+                if resolution_ids:
+                    experiments = _post_pdbe_batch("https://www.ebi.ac.uk/pdbe/api/pdb/entry/experiment/", resolution_ids)
+                    for pdb_id, metadata in metadata_by_id.items():
+                        if experiments.get(pdb_id.lower()) and _needs_resolution(metadata):
+                            metadata["resolution"] = experiments[pdb_id.lower()][0].get("resolution")
+            except requests.exceptions.RequestException as e:
+                action.log(message_type="pdbe_batch_failed", error=str(e), count=len(chunk))
+                metadata_by_id = {pdb_id: get_pdb_structure_metadata(pdb_id) for pdb_id in chunk}
+            
+            for pdb_id in chunk:
+                results[pdb_id] = metadata_by_id.get(pdb_id)
+        
+        action.log(message_type="pdb_metadata_batch_retrieved", found=sum(1 for m in results.values() if m))
+        return results
+
+
+@_cache_lookup(is_hit=lambda result: result[0])
 def get_pdb_redo_info(pdb_id: str) -> Tuple[bool, Optional[float]]:
     """
     Check if PDB structure is available in PDB-REDO and get its R-free value.
@@ -483,7 +882,7 @@ def get_pdb_redo_info(pdb_id: str) -> Tuple[bool, Optional[float]]:
             action.log(message_type="pdb_redo_not_found")
             return (False, None)
 
-        data = response.json()
+        data = _response_json(response)
         r_free = data.get("properties", {}).get("RFFIN")
         action.log(message_type="pdb_redo_found", r_free=r_free)
         return (True, r_free)
@@ -506,7 +905,7 @@ def get_complex_info(pdb_id: str, uniprot_id: str) -> Optional[ComplexInfo]:
         # Get UniProt segments mapping
         url = f"https://www.ebi.ac.uk/pdbe/api/mappings/uniprot_segments/{pdb_id}"
         response = _make_request(url)
-        data = response.json()
+        data = _response_json(response)
         
         if pdb_id.lower() not in data:
             return None
@@ -547,7 +946,7 @@ def get_complex_info(pdb_id: str, uniprot_id: str) -> Optional[ComplexInfo]:
         # Get molecule information for ligands and nucleotides
         mol_url = f"https://www.ebi.ac.uk/pdbe/api/pdb/entry/molecules/{pdb_id}"
         mol_response = _make_request(mol_url)
-        mol_data = mol_response.json()
+        mol_data = _response_json(mol_response)
         
         if pdb_id.lower() in mol_data:
             molecules = mol_data[pdb_id.lower()]
@@ -583,13 +982,26 @@ def get_complex_info(pdb_id: str, uniprot_id: str) -> Optional[ComplexInfo]:
         return complex_info
 
 
-def get_structures_for_uniprot(uniprot_id: str, include_alphafold: bool = True) -> List[StructureInfo]:
+def get_structures_for_uniprot(
+    uniprot_id: str,
+    include_alphafold: bool = True,
+    max_structures: Optional[int] = None,
+    max_resolution: Optional[float] = None,
+    min_coverage: Optional[float] = None,
+) -> List[StructureInfo]:
     """
     Get all structures (PDB + AlphaFold) for a UniProt ID with comprehensive metadata.
     
+    Each PDB entry costs several API requests, so when any limit is given the
+    candidates are ranked and filtered with select_pdb_candidates first and
+    metadata is only fetched for the survivors.
+    
     Args:
         uniprot_id: UniProt accession number
         include_alphafold: Whether to include AlphaFold structures
+        max_structures: Maximum number of PDB structures to fetch (None for all)
+        max_resolution: Skip PDB entries with a worse resolution, in Angstrom (None for no limit)
+        min_coverage: Skip PDB entries covering less of the UniProt sequence, 0-1 (None for no limit)
         
     Returns:
         List of StructureInfo objects with comprehensive metadata
@@ -597,45 +1009,52 @@ def get_structures_for_uniprot(uniprot_id: str, include_alphafold: bool = True)
     with start_action(action_type="get_structures_for_uniprot", uniprot_id=uniprot_id) as action:
         structures = []
         
-        # Get gene symbol
-        gene_symbol = get_gene_symbol(uniprot_id)
-        
-        # Get PDB structures
-        pdb_ids = get_pdb_structures_from_uniprot(uniprot_id)
-        
-        for pdb_id in pdb_ids:
-            # Get basic metadata
-            metadata = get_pdb_structure_metadata(pdb_id)
-            if not metadata:
-                continue
+        with ThreadPoolExecutor(max_workers=STRUCTURE_DETAIL_WORKERS) as executor:
+            # Gene symbol and AlphaFold model only depend on the UniProt ID; fetch them
+            # while the PDB entries are being listed
+            gene_symbol_future = executor.submit(get_gene_symbol, uniprot_id)
+            af_future = executor.submit(get_alphafold_structure, uniprot_id) if include_alphafold else None
             
-            # Get PDB-REDO info
-            redo_available, redo_rfree = get_pdb_redo_info(pdb_id)
+            # Get PDB structures
+            if max_structures is None and max_resolution is None and min_coverage is None:
+                pdb_ids = get_pdb_structures_from_uniprot(uniprot_id)
+            else:
+                pdb_ids = select_pdb_candidates(uniprot_id, max_structures, max_resolution, min_coverage)
             
-            # Get complex information
-            complex_info = get_complex_info(pdb_id, uniprot_id)
+            # Basic metadata for all entries in a few batched requests
+            metadata_by_id = get_pdb_structure_metadata_batch(pdb_ids)
+            found_ids = [pdb_id for pdb_id in pdb_ids if metadata_by_id.get(pdb_id)]
             
-            structure_info = StructureInfo(
-                structure_id=pdb_id.upper(),
-                uniprot_id=uniprot_id,
-                gene_symbol=gene_symbol,
-                deposition_date=metadata.get("deposition_date"),
-                experimental_method=metadata.get("experimental_method"),
-                resolution=metadata.get("resolution"),
-                r_free=metadata.get("r_free"),
-                pdb_redo_available=redo_available,
-                pdb_redo_rfree=redo_rfree,
-                complex_info=complex_info,
-            )
+            # PDB-REDO and complex info are per-entry requests; run them all concurrently
+            redo_futures = [executor.submit(get_pdb_redo_info, pdb_id) for pdb_id in found_ids]
+            complex_futures = [executor.submit(get_complex_info, pdb_id, uniprot_id) for pdb_id in found_ids]
             
-            structures.append(structure_info)
-        
-        # Add AlphaFold structure if requested
-        if include_alphafold:
-            af_structure = get_alphafold_structure(uniprot_id)
-            if af_structure:
-                af_structure.gene_symbol = gene_symbol
-                structures.append(af_structure)
+            gene_symbol = gene_symbol_future.result()
+            for pdb_id, redo_future, complex_future in zip(found_ids, redo_futures, complex_futures):
+                metadata = metadata_by_id[pdb_id]
+                redo_available, redo_rfree = redo_future.result()
+                
+                structure_info = StructureInfo(
+                    structure_id=pdb_id.upper(),
+                    uniprot_id=uniprot_id,
+                    gene_symbol=gene_symbol,
+                    deposition_date=metadata.get("deposition_date"),
+                    experimental_method=metadata.get("experimental_method"),
+                    resolution=metadata.get("resolution"),
+                    r_free=metadata.get("r_free"),
+                    pdb_redo_available=redo_available,
+                    pdb_redo_rfree=redo_rfree,
+                    complex_info=complex_future.result(),
+                )
+                
+                structures.append(structure_info)
+            
+            # Add AlphaFold structure if requested
+            if af_future is not None:
+                af_structure = af_future.result()
+                if af_structure:
+                    af_structure.gene_symbol = gene_symbol
+                    structures.append(af_structure)
         
         # Sort structures by experimental method priority and resolution
         method_priority = {
@@ -683,7 +1102,7 @@ def get_uniprot_mappings_sifts(pdb_id: str) -> Dict[str, Any]:
             action.log(message_type="sifts_api_failed")
             return {}
         
-        data = response.json()
+        data = _response_json(response)
         
         # Extract UniProt IDs from SIFTS response
         uniprot_mappings = {}
@@ -715,7 +1134,7 @@ def get_uniprot_mappings_rcsb(pdb_id: str) -> List[str]:
             action.log(message_type="rcsb_api_failed")
             return []
         
-        data = response.json()
+        data = _response_json(response)
         uniprot_ids = []
         
         # Try to get polymer entities
@@ -723,7 +1142,7 @@ def get_uniprot_mappings_rcsb(pdb_id: str) -> List[str]:
         polymer_response = _make_request_with_error_handling(polymer_url)
         
         if polymer_response is not None:
-            polymer_data = polymer_response.json()
+            polymer_data = _response_json(polymer_response)
             # Extract UniProt accessions from reference sequence identifiers
             if "rcsb_polymer_entity_container_identifiers" in polymer_data:
                 identifiers = polymer_data["rcsb_polymer_entity_container_identifiers"]
@@ -764,14 +1183,14 @@ def get_uniprot_mappings_graphql(pdb_id: str) -> List[str]:
         """
         
         try:
-            response = requests.post(
+            response = _SESSION.post(
                 url,
                 json={"query": query, "variables": {"pdb_id": pdb_id.upper()}},
                 timeout=30
             )
             response.raise_for_status()
             
-            data = response.json()
+            data = _response_json(response)
             uniprot_ids = []
             
             if "data" in data and data["data"] and "entry" in data["data"]:
@@ -819,7 +1238,7 @@ def resolve_uniprot_ids_with_fallbacks(pdb_id: str) -> List[str]:
         mapping_response = _make_request_with_error_handling(mapping_url)
         
         if mapping_response is not None:
-            mapping_data = mapping_response.json()
+            mapping_data = _response_json(mapping_response)
             # FIX: Use lowercase key to match API response
             if pdb_id.lower() in mapping_data:
                 uniprot_mappings = mapping_data[pdb_id.lower()].get("UniProt", {})
@@ -884,7 +1303,7 @@ def get_pdb_metadata(pdb_id: str) -> Optional[PDBMetadata]:
             action.log(message_type="pdb_invalid_id", pdb_id=pdb_id)
             return None
 
-        data = response.json()
+        data = _response_json(response)
 
         if pdb_id.lower() not in data:
             action.log(message_type="pdb_not_found", pdb_id=pdb_id)
@@ -903,7 +1322,7 @@ def get_pdb_metadata(pdb_id: str) -> Optional[PDBMetadata]:
             entity_response = _make_request_with_error_handling(entity_url)
 
             if entity_response is not None:
-                entity_data = entity_response.json()
+                entity_data = _response_json(entity_response)
                 if pdb_id.lower() in entity_data:
                     for entity in entity_data[pdb_id.lower()]:
                         if entity.get("molecule_type", []) == ["polypeptide(L)"]:
@@ -13,8 +13,15 @@ has been moved to the pdb_mcp.sifts subpackage.
 from typing import Optional, List, Dict, Any, Set, Tuple, Iterable
 from pathlib import Path
 import gzip
+import hashlib
 import json
+import os
+import pickle
+import re
+import sys
+import tempfile
 from collections import OrderedDict
+from functools import lru_cache
 
 import polars as pl
 import requests
@@ -35,53 +42,225 @@ from atomica_mcp.preprocessing.sifts import (
 )
 import atomica_mcp.preprocessing.sifts.utils as sifts_utils
 
+try:
+    import orjson
+    
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError, so handlers are unchanged
+    _json_loads = orjson.loads
+except ImportError:  # orjson is optional; json.loads also accepts bytes
+    _json_loads = json.loads
+
+
+# Shared session so the entry and per-entity RCSB requests reuse keep-alive connections
+_SESSION = requests.Session()
 
 # Global dictionary to store AnAge data
 ANAGE_DATA: Dict[str, Dict[str, Any]] = {}
 
+# AnAge columns read by load_anage_data and their types
+ANAGE_SCHEMA: Dict[str, Any] = {
+    "Kingdom": pl.String,
+    "Phylum": pl.String,
+    "Class": pl.String,
+    "Genus": pl.String,
+    "Species": pl.String,
+    "Common name": pl.String,
+    "Maximum longevity (yrs)": pl.Float64,
+}
+
+# classify_organism result for names that are not in AnAge; callers get copies
+UNKNOWN_CLASSIFICATION: Dict[str, Any] = {
+    "classification": "Unknown",
+    "common_name": "",
+    "max_longevity_yrs": None,
+    "kingdom": "",
+    "phylum": "",
+    "in_anage": False
+}
+
+# AnAge database location under the project data directory
+ANAGE_FILE_RELATIVE_PATH = Path("input") / "anage" / "anage_data.txt"
+
+# Bump when the AnAge lookup dictionary layout changes to invalidate snapshots
+ANAGE_SNAPSHOT_VERSION = 1
+
+# AnAge dictionaries already loaded in this process: resolved path -> (file key, dictionary)
+_ANAGE_LOADED: Dict[Path, Tuple[Tuple[int, int, int], Dict[str, Dict[str, Any]]]] = {}
+
+# Columns of classify_organisms_batch results
+ORGANISM_CLASSIFICATION_SCHEMA: Dict[str, Any] = {
+    "scientific_name": pl.String,
+    "classification": pl.String,
+    "common_name": pl.String,
+    "max_longevity_yrs": pl.Float64,
+    "kingdom": pl.String,
+    "phylum": pl.String,
+    "in_anage": pl.Boolean,
+}
+
+# Upper bound on cached organism classifications per AnAge dictionary
+ANAGE_CLASSIFICATION_CACHE_SIZE = 4096
+
+# Lookups derived from an AnAge dictionary, keyed by its id(); the dictionary
+# itself and its size are kept alongside to detect reuse of the id or changes
+_ANAGE_DERIVED_CACHE: Dict[int, Tuple[Dict[str, Dict[str, Any]], int, Dict[str, Any]]] = {}
 
-def load_anage_data(anage_file: Path) -> Dict[str, Dict[str, Any]]:
+
+def load_anage_data(anage_file: Optional[Path] = None) -> Dict[str, Dict[str, Any]]:
     """
     Load AnAge database from TSV file and create a lookup dictionary.
     
+    The parsed dictionary is kept for the rest of the process and pickled under
+    the atomica-mcp cache directory, both keyed by the file's modification time
+    and size, so repeated loads return the same dictionary and later runs skip
+    parsing. Callers share the result and must not modify it.
+    
     Args:
-        anage_file: Path to the AnAge data file (TSV format)
+        anage_file: Path to the AnAge data file (TSV format). If None, uses the
+            bundled data/input/anage/anage_data.txt.
     
     Returns:
         Dictionary mapping lowercase scientific names to AnAge data
     """
-    # Load with polars
+    if anage_file is None:
+        anage_file = get_default_anage_file()
+    anage_file = Path(anage_file).resolve()
+    stat = anage_file.stat()
+    key = (ANAGE_SNAPSHOT_VERSION, stat.st_mtime_ns, stat.st_size)
+    
+    loaded = _ANAGE_LOADED.get(anage_file)
+    if loaded is not None and loaded[0] == key:
+        return loaded[1]
+    
+    with start_action(action_type="load_anage_data", anage_file=str(anage_file)) as action:
+        snapshot_file = _anage_snapshot_file(anage_file)
+        anage_dict: Optional[Dict[str, Dict[str, Any]]] = None
+        if snapshot_file.exists():
+            try:
+                with snapshot_file.open("rb") as f:
+                    snapshot = pickle.load(f)
+                if snapshot.get("key") == key:
+                    # Unpickled strings are not interned; re-intern the lookup keys
+                    anage_dict = {sys.intern(name): entry for name, entry in snapshot["anage"].items()}
+                    action.log(message_type="snapshot_hit")
+                else:
+                    action.log(message_type="snapshot_stale")
+            except Exception as e:
+                action.log(message_type="snapshot_unreadable", error=str(e))
+        
+        if anage_dict is None:
+            anage_dict = _read_anage_tsv(anage_file)
+            try:
+                snapshot_file.parent.mkdir(parents=True, exist_ok=True)
+                # Write to a temporary file first so concurrent loads never read a partial snapshot
+                fd, tmp_name = tempfile.mkstemp(dir=snapshot_file.parent, suffix=".tmp")
+                with os.fdopen(fd, "wb") as f:
+                    pickle.dump({"key": key, "anage": anage_dict}, f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp_name, snapshot_file)
+                action.log(message_type="snapshot_written")
+            except OSError as e:
+                # Snapshots are best-effort; a read-only cache should not break loading
+                action.log(message_type="snapshot_write_failed", error=str(e))
+        
+        _ANAGE_LOADED[anage_file] = (key, anage_dict)
+        action.log(message_type="anage_loaded", organism_count=len(anage_dict))
+        return anage_dict
+
+
+def _anage_snapshot_file(anage_file: Path) -> Path:
+    """Location of the pickled snapshot for an AnAge file, one per file path."""
+    # Same location as atomica_mcp.dataset.get_cache_dir; importing that module would
+    # cost more than the snapshot saves
+    cache_dir = Path(os.environ.get("ATOMICA_MCP_CACHE_DIR", Path.home() / ".cache" / "atomica-mcp")).expanduser()
+    digest = hashlib.sha1(str(anage_file).encode()).hexdigest()[:16]
+    return cache_dir / "anage_snapshots" / f"{digest}.pkl"
+
+
+def _read_anage_tsv(anage_file: Path) -> Dict[str, Dict[str, Any]]:
+    """Parse the AnAge TSV into the lookup dictionary returned by load_anage_data."""
+    # Only these columns are used; fixed dtypes skip inferring all 31 columns
     df = pl.read_csv(
         anage_file,
         separator='\t',
         has_header=True,
+        columns=list(ANAGE_SCHEMA),
+        schema_overrides=ANAGE_SCHEMA,
         ignore_errors=True
+    ).filter(
+        (pl.col("Genus").fill_null("") != "") & (pl.col("Species").fill_null("") != "")
     )
     
     # Create scientific name column
+    scientific_name = pl.col("Genus") + " " + pl.col("Species")
     df = df.with_columns([
-        (pl.col("Genus") + " " + pl.col("Species")).alias("scientific_name"),
-        (pl.col("Genus") + " " + pl.col("Species")).str.to_lowercase().alias("scientific_name_lower")
+        scientific_name.alias("scientific_name"),
+        scientific_name.str.to_lowercase().alias("scientific_name_lower")
     ])
     
-    # Build dictionary
+    # Build dictionary column-wise rather than one named row at a time;
+    # taxonomy ranks repeat across thousands of species, so intern them
     anage_dict = {}
-    for row in df.iter_rows(named=True):
-        if row["Genus"] and row["Species"]:
-            anage_dict[row["scientific_name_lower"]] = {
-                "scientific_name": row["scientific_name"],
-                "common_name": row["Common name"] or "",
-                "max_longevity_yrs": row["Maximum longevity (yrs)"],
-                "genus": row["Genus"],
-                "species": row["Species"],
-                "kingdom": row["Kingdom"] or "",
-                "phylum": row["Phylum"] or "",
-                "class": row["Class"] or "",
-            }
+    columns = ["scientific_name_lower", "scientific_name", "Common name", "Maximum longevity (yrs)",
+               "Genus", "Species", "Kingdom", "Phylum", "Class"]
+    for name_lower, name, common_name, max_longevity, genus, species, kingdom, phylum, class_ in zip(
+        *(df.get_column(column).to_list() for column in columns)
+    ):
+        anage_dict[sys.intern(name_lower)] = {
+            "scientific_name": name,
+            "common_name": common_name or "",
+            "max_longevity_yrs": max_longevity,
+            "genus": sys.intern(genus),
+            "species": species,
+            "kingdom": sys.intern(kingdom or ""),
+            "phylum": sys.intern(phylum or ""),
+            "class": sys.intern(class_ or ""),
+        }
     
     return anage_dict
 
 
+def _anage_derived(anage_data: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Get the cache of derived lookups for an AnAge dictionary.
+    
+    AnAge dictionaries are unhashable, so they cannot key an lru_cache; the
+    cache is keyed by identity instead and reset if the dictionary was resized.
+    
+    Args:
+        anage_data: AnAge data dictionary
+    
+    Returns:
+        Mutable dictionary in which callers store lookups derived from anage_data
+    """
+    cached = _ANAGE_DERIVED_CACHE.get(id(anage_data))
+    if cached is None or cached[0] is not anage_data or cached[1] != len(anage_data):
+        cached = (anage_data, len(anage_data), {})
+        _ANAGE_DERIVED_CACHE[id(anage_data)] = cached
+    return cached[2]
+
+
+def anage_common_name_lookup(anage_data: Dict[str, Dict[str, Any]]) -> Dict[str, str]:
+    """
+    Map lowercase AnAge common names to scientific names, built once per dictionary.
+    
+    Args:
+        anage_data: AnAge data dictionary
+    
+    Returns:
+        Dictionary mapping lowercase common name to scientific name
+    """
+    derived = _anage_derived(anage_data)
+    lookup = derived.get("common_names")
+    if lookup is None:
+        lookup = {}
+        for anage_entry in anage_data.values():
+            common_name = anage_entry.get("common_name", "").lower().strip()
+            if common_name:
+                lookup[common_name] = anage_entry.get("scientific_name", "")
+        derived["common_names"] = lookup
+    return lookup
+
+
 # SIFTS functions (load_pdb_annotations, get_uniprot_ids_from_tsv, get_organism_from_tsv)
 # are now imported from pdb_mcp.sifts package above
 
@@ -117,7 +296,7 @@ def parse_entry_id(entry_id: str) -> Dict[str, str]:
 )
 def _fetch_pdb_entry_info(pdb_id: str) -> Dict[str, Any]:
     """
-    Fetch PDB entry information using biotite's RCSB API.
+    Fetch PDB entry information from the RCSB REST API.
     
     Args:
         pdb_id: PDB identifier (e.g., '2uxq')
@@ -128,15 +307,12 @@ def _fetch_pdb_entry_info(pdb_id: str) -> Dict[str, Any]:
     Raises:
         Exception: If biotite fetch fails after retries
     """
-    # Use biotite to fetch entry info
+    # Only the entry JSON is needed; the coordinate file itself is never parsed
     try:
-        entry_info = rcsb.fetch(pdb_id, format="cif")
-        # biotite returns structure, we need to extract metadata
-        # For better metadata, use JSON format
-        import urllib.request
         url = f"https://data.rcsb.org/rest/v1/core/entry/{pdb_id}"
-        with urllib.request.urlopen(url, timeout=10) as response:
-            return json.loads(response.read().decode())
+        response = _SESSION.get(url, timeout=10)
+        response.raise_for_status()
+        return _json_loads(response.content)
     except Exception:
         # Fallback if entry_info fails
         raise
@@ -162,14 +338,11 @@ def _fetch_pdb_entry_info_with_retries(pdb_id: str, timeout: int = 10, retries:
 
     for attempt in range(retries + 1):
         try:
-            # Use biotite to fetch entry info
-            entry_info = rcsb.fetch(pdb_id, format="cif")
-            # biotite returns structure, we need to extract metadata
-            # For better metadata, use JSON format
-            import urllib.request
+            # Only the entry JSON is needed; the coordinate file itself is never parsed
             url = f"https://data.rcsb.org/rest/v1/core/entry/{pdb_id}"
-            with urllib.request.urlopen(url, timeout=timeout) as response:
-                return json.loads(response.read().decode())
+            response = _SESSION.get(url, timeout=timeout)
+            response.raise_for_status()
+            return _json_loads(response.content)
         except (requests.exceptions.Timeout, requests.exceptions.ConnectionError) as e:
             if attempt == retries:
                 # Last attempt failed
@@ -193,7 +366,7 @@ def fetch_pdb_metadata(pdb_id: str, timeout: int = 10, retries: int = 3, use_tsv
 
     Args:
         pdb_id: PDB identifier (e.g., '2uxq')
-        timeout: Request timeout in seconds (passed to urllib)
+        timeout: Request timeout in seconds (per HTTP request)
         retries: Number of retry attempts for API calls
         use_tsv: If True, use local TSV files for organism/UniProt data. If False, use RCSB API.
         pdb_uniprot_data: Optional pre-loaded PDB-UniProt mapping. Uses global if not provided.
@@ -297,9 +470,9 @@ def fetch_pdb_metadata(pdb_id: str, timeout: int = 10, retries: int = 3, use_tsv
                 for entity_id in polymer_entity_ids:
                     try:
                         entity_url = f"https://data.rcsb.org/rest/v1/core/polymer_entity/{pdb_id}/{entity_id}"
-                        import urllib.request
-                        with urllib.request.urlopen(entity_url, timeout=timeout) as response:
-                            entity = json.loads(response.read().decode())
+                        response = _SESSION.get(entity_url, timeout=timeout)
+                        response.raise_for_status()
+                        entity = _json_loads(response.content)
                         
                         chains_str = entity.get("entity_poly", {}).get("pdbx_strand_id", "")
                         chains = [c.strip() for c in chains_str.split(",")] if chains_str else []
@@ -372,52 +545,70 @@ def fetch_pdb_metadata(pdb_id: str, timeout: int = 10, retries: int = 3, use_tsv
         return {"pdb_id": pdb_id, "found": False, "error": str(e)}
 
 
+# Common typos and synonyms in PDB data, keyed by lowercase name
+ORGANISM_TYPO_MAP: Dict[str, str] = {
+    # Human
+    "home sapiens": "homo sapiens",
+    "homo sapien": "homo sapiens",
+    # Mouse
+    "balb/c mouse": "mus musculus",
+    "c57bl/6 mouse": "mus musculus",
+    "c57bl/6j mouse": "mus musculus",
+    "swiss mouse": "mus musculus",
+    # Rat
+    "buffalo rat": "rattus norvegicus",
+    "wistar rat": "rattus norvegicus",
+    "sprague-dawley rat": "rattus norvegicus",
+    # Cattle
+    "bos bovis": "bos taurus",
+    # Fruit fly
+    "drosophila melangaster": "drosophila melanogaster",
+    # Yeast
+    "baker's yeast": "saccharomyces cerevisiae",
+    "bakers yeast": "saccharomyces cerevisiae",
+    # Bacteria (E. coli is in AnAge as a model organism)
+    "bacillus coli": "escherichia coli",
+    # Other bacteria (not in AnAge, but correct for consistency)
+    "micrococcus aureus": "staphylococcus aureus",
+    "bacillus mesentericus": "bacillus subtilis",
+    "bacillus tuberculosis": "mycobacterium tuberculosis",
+    "bacillus pestis": "yersinia pestis",
+    "bacillus aeruginosus": "pseudomonas aeruginosa",
+    "ampylobacter jejuni": "campylobacter jejuni",
+}
+
+# Third words that mark a strain/subspecies variant of "genus species"
+STRAIN_MARKERS: Tuple[str, ...] = (
+    'atcc', 'dsm', 'strain', 'var.', 'subsp.', 'k-', 'h37rv', 'kt2440', 'pa01', 'dcc', 'v583'
+)
+
+# All markers as one alternation, so a name is scanned once instead of once per marker
+_STRAIN_MARKER_PATTERN = re.compile("|".join(re.escape(marker) for marker in STRAIN_MARKERS))
+
+
+@lru_cache(maxsize=4096)
 def normalize_organism_name(name: str) -> str:
     """
     Normalize organism name by fixing common typos and variants.
     
+    Results are cached and interned: the same few organisms recur on many chains,
+    and interned names match the interned AnAge keys by identity.
+    
     Args:
         name: Organism name (scientific or common)
     
     Returns:
         Normalized name
     """
+    return sys.intern(_normalize_organism_name(name))
+
+
+def _normalize_organism_name(name: str) -> str:
+    """Uncached normalization; see normalize_organism_name."""
     name_lower = name.lower().strip()
     
-    # Common typos and synonyms in PDB data
-    typo_map = {
-        # Human
-        "home sapiens": "homo sapiens",
-        "homo sapien": "homo sapiens",
-        # Mouse
-        "balb/c mouse": "mus musculus",
-        "c57bl/6 mouse": "mus musculus",
-        "c57bl/6j mouse": "mus musculus",
-        "swiss mouse": "mus musculus",
-        # Rat
-        "buffalo rat": "rattus norvegicus",
-        "wistar rat": "rattus norvegicus",
-        "sprague-dawley rat": "rattus norvegicus",
-        # Cattle
-        "bos bovis": "bos taurus",
-        # Fruit fly
-        "drosophila melangaster": "drosophila melanogaster",
-        # Yeast
-        "baker's yeast": "saccharomyces cerevisiae",
-        "bakers yeast": "saccharomyces cerevisiae",
-        # Bacteria (E. coli is in AnAge as a model organism)
-        "bacillus coli": "escherichia coli",
-        # Other bacteria (not in AnAge, but correct for consistency)
-        "micrococcus aureus": "staphylococcus aureus",
-        "bacillus mesentericus": "bacillus subtilis",
-        "bacillus tuberculosis": "mycobacterium tuberculosis",
-        "bacillus pestis": "yersinia pestis",
-        "bacillus aeruginosus": "pseudomonas aeruginosa",
-        "ampylobacter jejuni": "campylobacter jejuni",
-    }
-    
-    if name_lower in typo_map:
-        return typo_map[name_lower]
+    if name_lower in ORGANISM_TYPO_MAP:
+        return ORGANISM_TYPO_MAP[name_lower]
     
     # Handle strain/subspecies variants - extract genus + species (first two words)
     # Examples: "Escherichia coli K-12" → "Escherichia coli"
@@ -427,10 +618,12 @@ def normalize_organism_name(name: str) -> str:
         # Check if third word looks like a strain/subspecies marker
         third_word = parts[2]
         # Common strain markers
-        if any(marker in third_word for marker in ['atcc', 'dsm', 'strain', 'var.', 'subsp.', 'k-', 'h37rv', 'kt2440', 'pa01', 'dcc', 'v583']):
+        if _STRAIN_MARKER_PATTERN.search(third_word):
             return f"{parts[0]} {parts[1]}"
-        # If third word is all uppercase or starts with uppercase (likely strain ID)
-        if third_word.isupper() or (len(third_word) > 0 and third_word[0].isupper()):
+        # If third word is all uppercase or starts with uppercase (likely strain ID);
+        # case has to be read from the original name, parts are already lowercased
+        original_third_word = name.split()[2]
+        if original_third_word.isupper() or original_third_word[0].isupper():
             return f"{parts[0]} {parts[1]}"
         # If third word is numeric (e.g., "168", "27634")
         if third_word.isdigit():
@@ -452,12 +645,56 @@ def classify_organism(scientific_name: str, anage_data: Optional[Dict[str, Dict[
         Dictionary with classification, common name, and max longevity from AnAge database.
         If not found in AnAge, returns "Unknown" classification.
     """
+    # Blank names cannot match anything; skip normalization and the lookups
+    if not scientific_name or not scientific_name.strip():
+        return dict(UNKNOWN_CLASSIFICATION)
+    
     if anage_data is None:
         anage_data = ANAGE_DATA
     
     # Normalize the name to fix typos and variants
     normalized_name = normalize_organism_name(scientific_name)
     
+    # The same few species recur across chains; reuse their classification
+    classifications = _anage_derived(anage_data).setdefault("classifications", {})
+    classification = classifications.get(normalized_name)
+    if classification is None:
+        classification = _classify_normalized_organism(normalized_name, anage_data)
+        if len(classifications) < ANAGE_CLASSIFICATION_CACHE_SIZE:
+            classifications[normalized_name] = classification
+    # Hand out a copy so callers cannot alter the cached entry
+    return dict(classification)
+
+
+def classify_organisms_batch(
+    scientific_names: Iterable[Optional[str]],
+    anage_data: Optional[Dict[str, Dict[str, Any]]] = None
+) -> pl.DataFrame:
+    """
+    Classify many organism names at once.
+    
+    PDB chains repeat a handful of organisms, so each distinct name is classified
+    once with classify_organism and the results are joined back onto the input.
+    
+    Args:
+        scientific_names: Organism names, e.g. one per chain; may contain None
+        anage_data: Optional AnAge data dictionary. If None, uses global ANAGE_DATA.
+    
+    Returns:
+        DataFrame with one row per input name, in input order: scientific_name
+        plus the classify_organism fields as columns
+    """
+    names = pl.DataFrame({"scientific_name": list(scientific_names)}, schema={"scientific_name": pl.String})
+    unique_names = names.get_column("scientific_name").unique(maintain_order=True).to_list()
+    classified = pl.DataFrame(
+        [{"scientific_name": name, **classify_organism(name, anage_data)} for name in unique_names],
+        schema=ORGANISM_CLASSIFICATION_SCHEMA,
+    )
+    return names.join(classified, on="scientific_name", how="left", nulls_equal=True, maintain_order="left")
+
+
+def _classify_normalized_organism(normalized_name: str, anage_data: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+    """Classify an already normalized organism name; see classify_organism."""
     # Check if organism is in AnAge database (exact match after normalization)
     if normalized_name in anage_data:
         anage_entry = anage_data[normalized_name]
@@ -486,14 +723,7 @@ def classify_organism(scientific_name: str, anage_data: Optional[Dict[str, Dict[
             }
     
     # Not found in AnAge database
-    return {
-        "classification": "Unknown",
-        "common_name": "",
-        "max_longevity_yrs": None,
-        "kingdom": "",
-        "phylum": "",
-        "in_anage": False
-    }
+    return UNKNOWN_CLASSIFICATION
 
 
 def get_chain_protein_name(metadata: Dict[str, Any], chain_id: str) -> str:
@@ -600,7 +830,7 @@ def iter_jsonl_gz_lines(file_path: Path, line_numbers: Optional[Iterable[int]] =
                 continue
                 
             try:
-                entry = json.loads(line)
+                entry = _json_loads(line)
                 yield {"line_number": line_num, "entry": entry}
             except json.JSONDecodeError as e:
                 with start_action(action_type="json_decode_error", line_number=line_num, error=str(e)):
@@ -881,11 +1111,12 @@ def parse_line_numbers(line_numbers_str: str) -> LineNumberFilter:
     return LineNumberFilter(ranges, singles)
 
 
+@lru_cache(maxsize=None)
 def get_project_data_dir() -> Path:
-    """Get the project data directory, adjusting for different contexts."""
+    """Get the project data directory, adjusting for different contexts (resolved once per process)."""
     # When run as a script or module
     current_file = Path(__file__).resolve()
-    project_root = current_file.parent.parent.parent  # src/pdb_mcp/pdb_utils.py -> project root
+    project_root = current_file.parents[3]  # src/atomica_mcp/preprocessing/pdb_utils.py -> project root
     data_dir = project_root / "data"
     
     if not data_dir.exists():
@@ -893,3 +1124,8 @@ def get_project_data_dir() -> Path:
         data_dir = Path.cwd() / "data"
     
     return data_dir
+
+
+def get_default_anage_file() -> Path:
+    """Get the bundled AnAge database path (data/input/anage/anage_data.txt)."""
+    return get_project_data_dir() / ANAGE_FILE_RELATIVE_PATH
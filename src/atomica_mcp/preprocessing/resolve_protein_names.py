@@ -9,6 +9,15 @@ from eliot import start_action
 import typer
 from datetime import datetime
 
+try:
+    import orjson
+    
+    _json_loads = orjson.loads
+except ImportError:  # orjson is optional; fall back to the stdlib parser
+    import json
+    
+    _json_loads = json.loads
+
 # Configure Polars to display all columns
 pl.Config.set_tbl_cols(-1)  # Show all columns
 pl.Config.set_tbl_width_chars(1000)  # Wider table display
@@ -25,6 +34,9 @@ BATCH_SIZE = 100  # IDs per request (reduced from 500 due to URL length limits i
 REQUEST_TIMEOUT = 30
 MAX_WORKERS = 5  # Parallel requests
 
+# Shared session so batch, ID-mapping and polling requests reuse keep-alive connections
+_SESSION = requests.Session()
+
 
 def fetch_uniprot_batch(
     uniprot_ids: List[str],
@@ -56,7 +68,7 @@ def fetch_uniprot_batch(
                 # Build query: accession:Q9V2J8 OR accession:P12345 ...
                 query = " OR ".join([f"accession:{uid}" for uid in batch])
                 
-                response = requests.get(
+                response = _SESSION.get(
                     UNIPROT_SEARCH_URL,
                     params={
                         "query": query,
@@ -68,10 +80,12 @@ def fetch_uniprot_batch(
                 response.raise_for_status()
                 
                 if response.text.strip():
+                    # All fields are text; reading them as String keeps every
+                    # batch on the same schema for the vertical concat below
                     df = pl.read_csv(
                         StringIO(response.text),
                         separator="\t",
-                        schema_overrides={"Accession": pl.Utf8},
+                        infer_schema=False,
                     )
                     all_results.append(df)
                     typer.echo(
@@ -92,7 +106,7 @@ def fetch_uniprot_batch(
                 action.write_failure(batch_error=str(e), batch_num=batch_num)
     
     if all_results:
-        return pl.concat(all_results)
+        return pl.concat(all_results, how="vertical")
     return pl.DataFrame()
 
 
@@ -116,7 +130,7 @@ def fetch_uniprot_parallel(
     def fetch_batch(batch: List[str]) -> pl.DataFrame:
         query = " OR ".join([f"accession:{uid}" for uid in batch])
         
-        response = requests.get(
+        response = _SESSION.get(
             UNIPROT_SEARCH_URL,
             params={
                 "query": query,
@@ -127,7 +141,7 @@ def fetch_uniprot_parallel(
         )
         
         if response.status_code == 200 and response.text.strip():
-            return pl.read_csv(StringIO(response.text), separator="\t")
+            return pl.read_csv(StringIO(response.text), separator="\t", infer_schema=False)
         return pl.DataFrame()
     
     # Create batches
@@ -164,7 +178,7 @@ def fetch_uniprot_parallel(
                         err=True,
                     )
     
-    return pl.concat(all_results) if all_results else pl.DataFrame()
+    return pl.concat(all_results, how="vertical") if all_results else pl.DataFrame()
 
 
 def fetch_gene_symbols_batch(uniprot_ids: List[str]) -> pl.DataFrame:
@@ -180,7 +194,7 @@ def fetch_gene_symbols_batch(uniprot_ids: List[str]) -> pl.DataFrame:
             typer.echo("  Submitting ID mapping request to UniProt...")
             
             # Submit mapping job
-            response = requests.post(
+            response = _SESSION.post(
                 UNIPROT_MAPPING_URL,
                 data={
                     "ids": " ".join(uniprot_ids),
@@ -191,7 +205,7 @@ def fetch_gene_symbols_batch(uniprot_ids: List[str]) -> pl.DataFrame:
             )
             response.raise_for_status()
             
-            job_data = response.json()
+            job_data = _json_loads(response.content)
             job_id = job_data.get("jobId")
             
             if not job_id:
@@ -203,12 +217,12 @@ def fetch_gene_symbols_batch(uniprot_ids: List[str]) -> pl.DataFrame:
             # Poll for results
             max_attempts = 60
             for attempt in range(max_attempts):
-                status_response = requests.get(
+                status_response = _SESSION.get(
                     f"{UNIPROT_MAPPING_STATUS_URL}/{job_id}",
                     timeout=REQUEST_TIMEOUT,
                 )
                 status_response.raise_for_status()
-                status_data = status_response.json()
+                status_data = _json_loads(status_response.content)
                 
                 if status_data.get("jobStatus") == "FINISHED":
                     typer.echo(f"  ✓ Mapping completed")
@@ -222,7 +236,7 @@ def fetch_gene_symbols_batch(uniprot_ids: List[str]) -> pl.DataFrame:
             download_url = f"https://rest.uniprot.org/idmapping/stream/{job_id}"
             
             typer.echo("  Downloading mapping results...")
-            result_response = requests.get(
+            result_response = _SESSION.get(
                 download_url,
                 params={"format": "tsv"},
                 timeout=REQUEST_TIMEOUT,
@@ -258,7 +272,7 @@ def fetch_gene_names_batch(uniprot_ids: List[str]) -> pl.DataFrame:
             typer.echo("  Submitting gene name mapping request to UniProt...")
             
             # Submit mapping job to Gene_Name database
-            response = requests.post(
+            response = _SESSION.post(
                 UNIPROT_MAPPING_URL,
                 data={
                     "ids": " ".join(uniprot_ids),
@@ -269,7 +283,7 @@ def fetch_gene_names_batch(uniprot_ids: List[str]) -> pl.DataFrame:
             )
             response.raise_for_status()
             
-            job_data = response.json()
+            job_data = _json_loads(response.content)
             job_id = job_data.get("jobId")
             
             if not job_id:
@@ -281,12 +295,12 @@ def fetch_gene_names_batch(uniprot_ids: List[str]) -> pl.DataFrame:
             # Poll for results
             max_attempts = 60
             for attempt in range(max_attempts):
-                status_response = requests.get(
+                status_response = _SESSION.get(
                     f"{UNIPROT_MAPPING_STATUS_URL}/{job_id}",
                     timeout=REQUEST_TIMEOUT,
                 )
                 status_response.raise_for_status()
-                status_data = status_response.json()
+                status_data = _json_loads(status_response.content)
                 
                 if status_data.get("jobStatus") == "FINISHED":
                     typer.echo(f"  ✓ Gene name mapping completed")
@@ -300,7 +314,7 @@ def fetch_gene_names_batch(uniprot_ids: List[str]) -> pl.DataFrame:
             download_url = f"https://rest.uniprot.org/idmapping/stream/{job_id}"
             
             typer.echo("  Downloading gene name results...")
-            result_response = requests.get(
+            result_response = _SESSION.get(
                 download_url,
                 params={"format": "tsv"},
                 timeout=REQUEST_TIMEOUT,
@@ -338,13 +352,13 @@ def fetch_gene_info_from_ensembl(ensembl_ids: List[str]) -> pl.DataFrame:
         results = []
         for ensembl_id in ensembl_ids[:100]:  # Limit to 100 per batch
             try:
-                response = requests.get(
+                response = _SESSION.get(
                     f"https://rest.ensembl.org/lookup/id/{ensembl_id}",
                     headers={"Content-Type": "application/json"},
                     timeout=10
                 )
                 if response.status_code == 200:
-                    data = response.json()
+                    data = _json_loads(response.content)
                     results.append({
                         "ensembl_id": ensembl_id,
                         "gene_name_from_ensembl": data.get("external_name")
@@ -29,6 +29,7 @@ from atomica_mcp.preprocessing.pdb_utils import (
     parse_line_numbers,
     parse_entry_id,
     get_project_data_dir,
+    get_default_anage_file,
     ANAGE_DATA,
     PDB_UNIPROT_DATA,
     PDB_TAXONOMY_DATA,
@@ -80,7 +81,7 @@ def resolve(
     data_dir = get_project_data_dir()
     
     if anage_file is None:
-        anage_file = data_dir / "input" / "anage" / "anage_data.txt"
+        anage_file = get_default_anage_file()
     
     # Ensure output goes to data/output/ for relative paths, or create parent dirs for absolute paths
     output_dir = data_dir / "output"
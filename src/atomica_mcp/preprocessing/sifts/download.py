@@ -11,10 +11,9 @@ import sys
 from pathlib import Path
 from typing import Optional, List
 from urllib.parse import urlparse
-import urllib.request
-import urllib.error
 from html.parser import HTMLParser
 
+import requests
 import typer
 from eliot import start_action, Logger
 from pycomfort.logging import to_nice_stdout
@@ -26,6 +25,12 @@ EBI_SIFTS_HTTPS_URL = "https://ftp.ebi.ac.uk/pub/databases/msd/sifts/flatfiles/t
 # EBI SIFTS FTP base URL (fallback)
 EBI_SIFTS_FTP_URL = "ftp://ftp.ebi.ac.uk/pub/databases/msd/sifts/flatfiles/tsv/"
 
+# Bytes per chunk when streaming a download to disk
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Shared session so the listing and every file download reuse one keep-alive connection
+_SESSION = requests.Session()
+
 
 class LinkExtractor(HTMLParser):
     """Extract links from HTML."""
@@ -56,11 +61,15 @@ def get_output_dir() -> Path:
 def download_https(url: str, local_path: Path, action) -> bool:
     """Download a file via HTTPS. Returns True if successful."""
     try:
-        with urllib.request.urlopen(url, timeout=30) as response:
+        with _SESSION.get(url, timeout=30, stream=True) as response:
+            response.raise_for_status()
             with open(local_path, 'wb') as f:
-                f.write(response.read())
+                for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                    f.write(chunk)
         return True
     except Exception as e:
+        # Do not leave a truncated file behind for skip_existing to keep
+        local_path.unlink(missing_ok=True)
         action.log(message_type="https_download_failed", url=url, error=str(e))
         return False
 
@@ -68,8 +77,9 @@ def download_https(url: str, local_path: Path, action) -> bool:
 def list_files_https(url: str, action) -> Optional[List[str]]:
     """List .tsv.gz files from HTTPS directory listing."""
     try:
-        with urllib.request.urlopen(url, timeout=30) as response:
-            html = response.read().decode('utf-8')
+        response = _SESSION.get(url, timeout=30)
+        response.raise_for_status()
+        html = response.text
         
         parser = LinkExtractor()
         parser.feed(html)
@@ -9,11 +9,27 @@ This module provides functions for working with SIFTS data from EBI:
 SIFTS Data Sources:
 https://ftp.ebi.ac.uk/pub/databases/msd/sifts/flatfiles/tsv/
 """
+import hashlib
+import os
+import tempfile
 from typing import Optional, List, Dict, Any
 from pathlib import Path
 
 import polars as pl
 
+try:
+    import rapidgzip
+except ImportError:  # rapidgzip is optional; polars then inflates the .gz itself on one thread
+    rapidgzip = None
+
+
+# Columns read from the SIFTS TSVs (the files carry more) with their types, so parsing skips
+# schema inference and the unused residue-range columns
+PDB_UNIPROT_SCHEMA = {"PDB": pl.String, "CHAIN": pl.String, "SP_PRIMARY": pl.String}
+PDB_TAXONOMY_SCHEMA = {"PDB": pl.String, "CHAIN": pl.String, "TAX_ID": pl.Int64, "SCIENTIFIC_NAME": pl.String}
+
+# Bump when the parsed SIFTS frame layout changes to invalidate snapshots
+SIFTS_SNAPSHOT_VERSION = 1
 
 # Global dictionaries for local PDB annotations from SIFTS
 PDB_UNIPROT_DATA: Optional[pl.DataFrame] = None
@@ -37,38 +53,89 @@ def load_pdb_annotations(
     global PDB_UNIPROT_DATA, PDB_TAXONOMY_DATA, UNIPROT_PDB_DATA
     
     # Load pdb_chain_uniprot.tsv.gz - Maps PDB chains to UniProt IDs
+    # UniProt IDs repeat across chains, so store each once
     uniprot_file = annotations_dir / "pdb_chain_uniprot.tsv.gz"
     if uniprot_file.exists() and not skip_uniprot:
-        PDB_UNIPROT_DATA = pl.read_csv(
-            uniprot_file,
-            separator='\t',
-            has_header=True,
-            skip_rows=1,  # Skip comment header
-            ignore_errors=True,
-            quote_char=None,  # Disable quote character handling
-            infer_schema_length=10000,
-        )
-        # Normalize PDB IDs to lowercase
-        PDB_UNIPROT_DATA = PDB_UNIPROT_DATA.with_columns(
-            pl.col("PDB").str.to_lowercase()
-        )
+        PDB_UNIPROT_DATA = _load_sifts_tsv(uniprot_file, PDB_UNIPROT_SCHEMA, "SP_PRIMARY")
     
     # Load pdb_chain_taxonomy.tsv.gz - Maps PDB chains to taxonomy information
+    # A few organism names cover most chains, so store each once
     taxonomy_file = annotations_dir / "pdb_chain_taxonomy.tsv.gz"
     if taxonomy_file.exists() and not skip_taxonomy:
-        PDB_TAXONOMY_DATA = pl.read_csv(
-            taxonomy_file,
-            separator='\t',
-            has_header=True,
-            skip_rows=1,  # Skip comment header
-            ignore_errors=True,
-            quote_char=None,  # Disable quote character handling
-            infer_schema_length=10000,
-        )
+        PDB_TAXONOMY_DATA = _load_sifts_tsv(taxonomy_file, PDB_TAXONOMY_SCHEMA, "SCIENTIFIC_NAME")
+
+
+def _sifts_snapshot_file(tsv_file: Path) -> Path:
+    """Location of the Parquet snapshot for a SIFTS TSV, named by its path and current version."""
+    # Same location as atomica_mcp.dataset.get_cache_dir, without importing that module
+    cache_dir = Path(os.environ.get("ATOMICA_MCP_CACHE_DIR", Path.home() / ".cache" / "atomica-mcp")).expanduser()
+    stat = tsv_file.stat()
+    path_digest = hashlib.sha1(str(tsv_file).encode()).hexdigest()[:16]
+    key_digest = hashlib.sha1(f"{SIFTS_SNAPSHOT_VERSION}:{stat.st_mtime_ns}:{stat.st_size}".encode()).hexdigest()[:16]
+    return cache_dir / "sifts_snapshots" / f"{path_digest}-{key_digest}.parquet"
+
+
+def _load_sifts_tsv(tsv_file: Path, schema: Dict[str, Any], categorical_column: str) -> pl.DataFrame:
+    """
+    Parse a gzipped SIFTS TSV, or read its Parquet snapshot from an earlier run.
+    
+    Decompressing and parsing the chain-level TSVs dominates loading, so the parsed frame
+    is written to the atomica-mcp cache directory, keyed by the file's path, modification
+    time and size. Snapshots are best-effort: unreadable ones are re-parsed and write
+    failures are ignored.
+    
+    Args:
+        tsv_file: SIFTS .tsv.gz file
+        schema: Columns to read with their types
+        categorical_column: Column with few distinct values, stored as Categorical
+    
+    Returns:
+        DataFrame with lowercase PDB IDs
+    """
+    tsv_file = tsv_file.resolve()
+    snapshot_file = _sifts_snapshot_file(tsv_file)
+    if snapshot_file.exists():
+        try:
+            return pl.read_parquet(snapshot_file)
+        except Exception:
+            pass
+    
+    source: Any = tsv_file
+    if rapidgzip is not None:
+        # Inflate the DEFLATE blocks on all cores and hand polars the plain TSV
+        with rapidgzip.open(str(tsv_file), parallelization=os.cpu_count() or 1) as f:
+            source = f.read()
+    
+    df = pl.read_csv(
+        source,
+        separator='\t',
+        has_header=True,
+        skip_rows=1,  # Skip comment header
+        ignore_errors=True,
+        quote_char=None,  # Disable quote character handling
+        columns=list(schema),
+        schema_overrides=schema,
+        infer_schema=False,
+    ).with_columns(
         # Normalize PDB IDs to lowercase
-        PDB_TAXONOMY_DATA = PDB_TAXONOMY_DATA.with_columns(
-            pl.col("PDB").str.to_lowercase()
-        )
+        pl.col("PDB").str.to_lowercase(),
+        pl.col(categorical_column).cast(pl.Categorical),
+    )
+    
+    try:
+        snapshot_file.parent.mkdir(parents=True, exist_ok=True)
+        # Write to a temporary file first so concurrent loads never read a partial snapshot
+        fd, tmp_name = tempfile.mkstemp(dir=snapshot_file.parent, suffix=".tmp")
+        os.close(fd)
+        df.write_parquet(tmp_name)
+        os.replace(tmp_name, snapshot_file)
+        # Drop snapshots of earlier versions of the same file
+        for stale in snapshot_file.parent.glob(f"{snapshot_file.name.split('-')[0]}-*.parquet"):
+            if stale != snapshot_file:
+                stale.unlink(missing_ok=True)
+    except OSError:
+        pass
+    return df
 
 
 def get_uniprot_ids_from_tsv(pdb_id: str, chain_id: str, pdb_uniprot_data: Optional[pl.DataFrame] = None) -> List[str]:
@@ -114,7 +181,7 @@ def get_organism_from_tsv(pdb_id: str, chain_id: str, pdb_taxonomy_data: Optiona
     Returns:
         Dictionary with organism information (scientific_name, taxonomy_id)
     """
-    from atomica_mcp.preprocessing.pdb_utils import ANAGE_DATA
+    from atomica_mcp.preprocessing.pdb_utils import ANAGE_DATA, anage_common_name_lookup
     
     default_result = {
         "scientific_name": "Unknown",
@@ -135,16 +202,11 @@ def get_organism_from_tsv(pdb_id: str, chain_id: str, pdb_taxonomy_data: Optiona
     if len(matches) == 0:
         return default_result
     
-    # Build reverse lookup from AnAge: common_name -> scientific_name
-    common_name_to_scientific: Dict[str, str] = {}
-    if anage:
-        for scientific_lower, anage_entry in anage.items():
-            common_name = anage_entry.get("common_name", "").lower().strip()
-            if common_name:
-                common_name_to_scientific[common_name] = anage_entry.get("scientific_name", "")
+    # Reverse lookup from AnAge: common_name -> scientific_name (cached per AnAge dictionary)
+    common_name_to_scientific = anage_common_name_lookup(anage) if anage else {}
     
-    # Common known scientific names that appear in AnAge (for exact matching)
-    known_names = set(anage.keys()) if anage else set()  # All scientific names in AnAge (lowercase)
+    # Known scientific names in AnAge (lowercase keys) for exact matching
+    known_names = anage if anage else {}
     
     # First pass: look for exact matches with known correct names from AnAge
     all_names = matches["SCIENTIFIC_NAME"].to_list()
@@ -13,13 +13,20 @@ This server provides access to ATOMICA longevity protein structures with:
 """
 
 import asyncio
+import hashlib
 import os
+import pickle
+import re
+import tempfile
+import threading
 import json
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
+from functools import lru_cache
 
-import typer
 from fastmcp import FastMCP
 from pydantic import BaseModel, Field
 from eliot import start_action, to_file, Logger
@@ -27,7 +34,8 @@ from huggingface_hub import hf_hub_download
 import polars as pl
 from pycomfort.logging import to_nice_file
 
-from atomica_mcp.dataset import get_hf_filesystem, resolve_pdb_metadata
+# atomica_mcp.dataset is imported where it is used: it carries the dataset CLI (typer and click),
+# which server launches do not need on their startup path
 from atomica_mcp.mining.pdb_metadata import get_pdb_metadata, get_structures_for_uniprot
 
 # Hugging Face repository configuration
@@ -41,6 +49,49 @@ DEFAULT_HOST = os.getenv("MCP_HOST", "0.0.0.0")
 DEFAULT_PORT = int(os.getenv("MCP_PORT", "3002"))
 DEFAULT_TRANSPORT = os.getenv("MCP_TRANSPORT", "streamable-http")
 DEFAULT_TIMEOUT = int(os.getenv("MCP_TIMEOUT", "300"))  # Timeout for external API requests
+# How long a tool call waits for background dataset loading before reporting it as still loading
+DATA_READY_WAIT_SECONDS = 0.05
+# get_structures_for_uniprot waits longer: answering from the external APIs while the index
+# loads would report dataset structures as having no ATOMICA analysis
+STRUCTURES_DATA_READY_WAIT_SECONDS = 30.0
+DATA_LOADING_ERROR = "ATOMICA dataset is still loading, try again shortly"
+# Resolved PDB metadata kept per server instance for repeated resolve_pdb calls
+PDB_METADATA_CACHE_SIZE = 2048
+# Concurrent lookups used by resolve_pdbs for PDB IDs that are not cached yet
+PDB_RESOLVE_WORKERS = 8
+# Bump when the pickled index snapshot layout or the structures derived from the index change
+INDEX_SNAPSHOT_VERSION = 2
+# Index columns returned per structure by the gene and UniProt searches
+GENE_SEARCH_COLUMNS = [
+    "pdb_id", "title", "uniprot_ids", "gene_symbols",
+    "interact_scores_path", "critical_residues_path", "pymol_path",
+]
+UNIPROT_SEARCH_COLUMNS = GENE_SEARCH_COLUMNS + ["gene_symbols_display"]
+# Dataset directories found by get_dataset_directory, keyed by (ATOMICA_DATASET_DIR, cwd)
+_DATASET_DIR_CACHE: Dict[Tuple[Optional[str], str], Path] = {}
+# Eliot tracing of server actions; ATOMICA_MCP_TRACE=0 turns actions into no-ops
+TRACE_ENABLED = os.getenv("ATOMICA_MCP_TRACE", "1") != "0"
+
+
+class _NullAction:
+    """Stand-in for an eliot action when tracing is disabled."""
+    
+    def __enter__(self) -> "_NullAction":
+        return self
+    
+    def __exit__(self, *exc_info: Any) -> bool:
+        return False
+    
+    def log(self, message_type: str, **fields: Any) -> None:
+        pass
+
+
+_NULL_ACTION = _NullAction()
+
+if not TRACE_ENABLED:
+    def start_action(action_type: str = "", **fields: Any) -> _NullAction:  # noqa: F811
+        """Skip eliot action bookkeeping; call sites stay unchanged."""
+        return _NULL_ACTION
 
 
 def get_dataset_directory() -> Path:
@@ -54,10 +105,25 @@ def get_dataset_directory() -> Path:
     4. Default path
     
     Returns path if it exists, otherwise returns default path
-    (caller should handle downloading if needed).
+    (caller should handle downloading if needed). Directories that were found
+    are remembered per ATOMICA_DATASET_DIR and working directory, so later
+    server instances skip the filesystem checks.
     """
+    key = (os.getenv("ATOMICA_DATASET_DIR"), os.getcwd())
+    cached = _DATASET_DIR_CACHE.get(key)
+    if cached is not None:
+        return cached
+    
+    dataset_path = _locate_dataset_directory(key[0])
+    # Only found directories are remembered; a missing one may still be downloaded later
+    if dataset_path.exists():
+        _DATASET_DIR_CACHE[key] = dataset_path
+    return dataset_path
+
+
+def _locate_dataset_directory(env_path: Optional[str]) -> Path:
+    """Search the locations listed in get_dataset_directory, without caching."""
     # Check environment variable first
-    env_path = os.getenv("ATOMICA_DATASET_DIR")
     if env_path:
         dataset_path = Path(env_path)
         if dataset_path.exists():
@@ -90,13 +156,14 @@ def ensure_dataset_available(dataset_dir: Path) -> bool:
     Returns:
         True if dataset is available or was successfully downloaded
     """
-    if dataset_dir.exists() and list(dataset_dir.glob("*.cif")):
+    # Stop at the first structure file instead of listing them all
+    if dataset_dir.exists() and next(dataset_dir.glob("*.cif"), None) is not None:
         return True
     
     # Dataset not found, try to download
     with start_action(action_type="download_atomica_dataset", dataset_dir=str(dataset_dir)) as action:
         try:
-            from atomica_mcp.dataset import download as download_dataset
+            from atomica_mcp.dataset import download as download_dataset, get_hf_filesystem
             
             # Download dataset using the download function
             dataset_dir.mkdir(parents=True, exist_ok=True)
@@ -131,6 +198,206 @@ def ensure_dataset_available(dataset_dir: Path) -> bool:
             return False
 
 
+@lru_cache(maxsize=8)
+def _read_index_cached(index_path: str, mtime_ns: int) -> pl.DataFrame:
+    """
+    Read the parquet index once per (path, modification time).
+    
+    The whole index is small enough to keep in memory, so every server instance
+    in the process shares the same DataFrame until the file changes on disk.
+    
+    Args:
+        index_path: Path to index file
+        mtime_ns: Modification time of the index file, part of the cache key
+    
+    Returns:
+        DataFrame with index data
+    """
+    from atomica_mcp.dataset import upgrade_legacy_index
+    
+    # Indexes built before the nested structures column still carry structures_json
+    df = upgrade_legacy_index(pl.read_parquet(index_path))
+    # Indexes built before gene_symbols_display existed get it computed once here
+    if "gene_symbols" in df.columns and "gene_symbols_display" not in df.columns:
+        df = df.with_columns(
+            pl.col("gene_symbols").cast(pl.List(pl.String)).list.join(", ").alias("gene_symbols_display")
+        )
+    return df
+
+
+def summarize_index(df: pl.DataFrame) -> Dict[str, Any]:
+    """
+    Compute the dataset statistics reported by dataset_info.
+    
+    The index does not change while the server runs, so this is done once
+    after loading instead of on every call.
+    
+    Args:
+        df: Index DataFrame
+    
+    Returns:
+        Dictionary with structure counts and, when the columns exist, sorted
+        tuples of unique gene symbols and organisms and the number of
+        structures with organism data
+    """
+    with_metadata, with_critical_residues, with_interact_scores = df.select([
+        pl.col("metadata_path").is_not_null().sum(),
+        pl.col("critical_residues_path").is_not_null().sum(),
+        pl.col("interact_scores_path").is_not_null().sum(),
+    ]).row(0)
+    summary: Dict[str, Any] = {
+        "total_structures": len(df),
+        "structures_with_metadata": with_metadata,
+        "structures_with_critical_residues": with_critical_residues,
+        "structures_with_interact_scores": with_interact_scores,
+    }
+    for column, key in (("gene_symbols", "unique_genes"), ("organisms", "unique_organisms")):
+        if column in df.columns:
+            summary[key] = tuple(
+                df.get_column(column).cast(pl.List(pl.String)).explode().drop_nulls().unique().sort()
+            )
+    if "organisms" in df.columns:
+        summary["structures_with_organisms"] = df.select(
+            (pl.col("organisms").list.len() > 0).sum()
+        ).item()
+    return summary
+
+
+def rows_as_dicts(df: pl.DataFrame, columns: List[str]) -> List[Dict[str, Any]]:
+    """
+    Convert rows to dictionaries holding only the given columns.
+    
+    Tool responses use a handful of columns, so the rest (notably the nested
+    structures column) is never converted to Python objects. Columns missing
+    from older indexes are skipped, so callers keep using row.get().
+    
+    Args:
+        df: Rows to convert
+        columns: Columns to include
+    
+    Returns:
+        One dictionary per row
+    """
+    return df.select([column for column in columns if column in df.columns]).to_dicts()
+
+
+def pagination_error(limit: int, offset: int) -> Optional[str]:
+    """
+    Validate limit/offset paging arguments.
+    
+    limit=0 would make next_offset equal offset, so clients following it never
+    finish, and a negative offset would slice from the end of the index.
+    
+    Returns:
+        Error message, or None if the arguments are valid
+    """
+    if limit < 1:
+        return f"limit must be at least 1, got {limit}"
+    if offset < 0:
+        return f"offset must not be negative, got {offset}"
+    return None
+
+
+def next_page_offset(offset: int, limit: int, total: int) -> Optional[int]:
+    """Offset of the page after [offset, offset + limit), or None if that page was the last."""
+    return offset + limit if offset + limit < total else None
+
+
+def build_uniprot_row_index(df: pl.DataFrame) -> Dict[str, List[int]]:
+    """
+    Map each UniProt ID to the index rows that list it.
+    
+    Built once after loading so UniProt searches gather their rows directly
+    instead of scanning every row's uniprot_ids list.
+    
+    Args:
+        df: Index DataFrame with a uniprot_ids list column
+    
+    Returns:
+        Dictionary of UniProt ID to ascending row positions in df
+    """
+    grouped = (
+        df.select(
+            pl.int_range(pl.len(), dtype=pl.UInt32).alias("row"),
+            pl.col("uniprot_ids").cast(pl.List(pl.String)),
+        )
+        .explode("uniprot_ids")
+        .drop_nulls("uniprot_ids")
+        .unique(maintain_order=True)
+        .group_by("uniprot_ids", maintain_order=True)
+        .agg("row")
+    )
+    return dict(zip(grouped.get_column("uniprot_ids").to_list(), grouped.get_column("row").to_list()))
+
+
+def _index_snapshot_file(index_path: Path) -> Path:
+    """Location of the pickled snapshot for an index file, one per index path."""
+    from atomica_mcp.dataset import get_cache_dir
+    
+    digest = hashlib.sha1(str(index_path.resolve()).encode()).hexdigest()[:16]
+    return get_cache_dir() / "index_snapshots" / f"{digest}.pkl"
+
+
+def load_index_derived(index: pl.DataFrame, index_path: Path) -> Tuple[Dict[str, Any], Dict[str, List[int]]]:
+    """
+    Get the dataset summary and UniProt row map for an index, reusing a snapshot.
+    
+    Both are pickled under the cache directory after they are first computed and
+    loaded back on later starts while the index file keeps the same modification
+    time and size, so a warm start skips recomputing them. Snapshot problems are
+    logged and fall back to computing from the index.
+    
+    Args:
+        index: Index DataFrame loaded from index_path
+        index_path: Parquet file the index was read from
+    
+    Returns:
+        Tuple of (summarize_index result, build_uniprot_row_index result); the
+        row map is empty when the index has no uniprot_ids column
+    """
+    with start_action(action_type="load_index_derived", index_path=str(index_path)) as action:
+        try:
+            stat = index_path.stat()
+            key = (INDEX_SNAPSHOT_VERSION, stat.st_mtime_ns, stat.st_size)
+            snapshot_file = _index_snapshot_file(index_path)
+        except OSError as e:
+            action.log(message_type="index_not_on_disk", error=str(e))
+            key = None
+        
+        if key is not None and snapshot_file.exists():
+            try:
+                with snapshot_file.open("rb") as f:
+                    snapshot = pickle.load(f)
+                if snapshot.get("key") == key:
+                    action.log(message_type="snapshot_hit")
+                    return snapshot["summary"], snapshot["uniprot_rows"]
+                action.log(message_type="snapshot_stale")
+            except Exception as e:
+                action.log(message_type="snapshot_unreadable", error=str(e))
+        
+        summary = summarize_index(index)
+        uniprot_rows = build_uniprot_row_index(index) if "uniprot_ids" in index.columns else {}
+        
+        if key is not None:
+            try:
+                snapshot_file.parent.mkdir(parents=True, exist_ok=True)
+                # Write to a temporary file first so concurrent starts never read a partial snapshot
+                fd, tmp_name = tempfile.mkstemp(dir=snapshot_file.parent, suffix=".tmp")
+                with os.fdopen(fd, "wb") as f:
+                    pickle.dump(
+                        {"key": key, "summary": summary, "uniprot_rows": uniprot_rows},
+                        f,
+                        protocol=pickle.HIGHEST_PROTOCOL
+                    )
+                os.replace(tmp_name, snapshot_file)
+                action.log(message_type="snapshot_written")
+            except OSError as e:
+                # Snapshots are best-effort; a read-only cache should not break loading
+                action.log(message_type="snapshot_write_failed", error=str(e))
+        
+        return summary, uniprot_rows
+
+
 def get_or_create_index(dataset_dir: Path, index_path: Path) -> Optional[pl.DataFrame]:
     """
     Get index DataFrame, create if it doesn't exist.
@@ -143,31 +410,37 @@ def get_or_create_index(dataset_dir: Path, index_path: Path) -> Optional[pl.Data
         DataFrame with index data or None if creation fails
     """
     if index_path.exists():
-        return pl.read_parquet(index_path)
+        return _read_index_cached(str(index_path), index_path.stat().st_mtime_ns)
     
     # Index doesn't exist, try to create it
     with start_action(action_type="create_index", dataset_dir=str(dataset_dir)) as action:
         try:
-            # Find all CIF files
-            cif_files = sorted(dataset_dir.glob("*.cif"))
+            # One directory listing instead of an exists() check per structure file
+            with os.scandir(dataset_dir) as entries:
+                file_names = {entry.name for entry in entries if entry.is_file()}
+            pdb_ids = sorted(name[:-len(".cif")] for name in file_names if name.endswith(".cif"))
             
-            if not cif_files:
+            if not pdb_ids:
                 action.log(message_type="no_cif_files")
                 return None
             
+            # Paths are stored relative to the dataset root, e.g. "<group>/<subset>/1abc.cif"
+            rel_prefix = os.path.join(str(dataset_dir.relative_to(dataset_dir.parent.parent)), "")
+            
+            def relative(name: str) -> Optional[str]:
+                return rel_prefix + name if name in file_names else None
+            
             # Build records
             records = []
-            for cif_file in cif_files:
-                pdb_id = cif_file.stem
-                
+            for pdb_id in pdb_ids:
                 record = {
                     "pdb_id": pdb_id.upper(),
-                    "cif_path": str(cif_file.relative_to(dataset_dir.parent.parent)),
-                    "metadata_path": str((dataset_dir / f"{pdb_id}_metadata.json").relative_to(dataset_dir.parent.parent)) if (dataset_dir / f"{pdb_id}_metadata.json").exists() else None,
-                    "summary_path": str((dataset_dir / f"{pdb_id}_summary.json").relative_to(dataset_dir.parent.parent)) if (dataset_dir / f"{pdb_id}_summary.json").exists() else None,
-                    "critical_residues_path": str((dataset_dir / f"{pdb_id}_critical_residues.tsv").relative_to(dataset_dir.parent.parent)) if (dataset_dir / f"{pdb_id}_critical_residues.tsv").exists() else None,
-                    "interact_scores_path": str((dataset_dir / f"{pdb_id}_interact_scores.json").relative_to(dataset_dir.parent.parent)) if (dataset_dir / f"{pdb_id}_interact_scores.json").exists() else None,
-                    "pymol_path": str((dataset_dir / f"{pdb_id}_pymol_commands.pml").relative_to(dataset_dir.parent.parent)) if (dataset_dir / f"{pdb_id}_pymol_commands.pml").exists() else None,
+                    "cif_path": rel_prefix + f"{pdb_id}.cif",
+                    "metadata_path": relative(f"{pdb_id}_metadata.json"),
+                    "summary_path": relative(f"{pdb_id}_summary.json"),
+                    "critical_residues_path": relative(f"{pdb_id}_critical_residues.tsv"),
+                    "interact_scores_path": relative(f"{pdb_id}_interact_scores.json"),
+                    "pymol_path": relative(f"{pdb_id}_pymol_commands.pml"),
                 }
                 
                 records.append(record)
@@ -176,8 +449,9 @@ def get_or_create_index(dataset_dir: Path, index_path: Path) -> Optional[pl.Data
             df = pl.DataFrame(records)
             
             # Save index
+            from atomica_mcp.dataset import INDEX_PARQUET_OPTIONS
             index_path.parent.mkdir(parents=True, exist_ok=True)
-            df.write_parquet(index_path)
+            df.write_parquet(index_path, **INDEX_PARQUET_OPTIONS)
             
             action.log(message_type="index_created", rows=len(df))
             return df
@@ -218,6 +492,7 @@ class AtomicaMCP(FastMCP):
         index_path: Optional[Path] = None,
         timeout: int = DEFAULT_TIMEOUT,
         log_to_file: bool = True,
+        background_load: bool = False,
         **kwargs
     ):
         """
@@ -228,11 +503,14 @@ class AtomicaMCP(FastMCP):
             dataset_dir: Path to dataset directory (auto-detected if None)
             index_path: Path to index file (default: {dataset_dir}/atomica_index.parquet)
             timeout: Timeout for external API requests in seconds (default: 30)
-            log_to_file: Whether to log to files in logs/ directory (default: True)
+            log_to_file: Whether to log to files in logs/ directory (default: True; ignored
+                when ATOMICA_MCP_TRACE=0)
+            background_load: Load the dataset and index in a background thread so tools are
+                registered immediately; queries report "still loading" until it finishes (default: False)
             **kwargs: Additional arguments for FastMCP
         """
         # Configure eliot logging to file to avoid stdout interference with stdio transport
-        if log_to_file:
+        if log_to_file and TRACE_ENABLED:
             log_dir = Path(__file__).parent.parent.parent / "logs"
             log_dir.mkdir(exist_ok=True)
             json_log = log_dir / "mcp_server.json"
@@ -251,19 +529,119 @@ class AtomicaMCP(FastMCP):
         self.index_path = index_path or (self.dataset_dir / "atomica_index.parquet")
         self.timeout = timeout
         
-        # Ensure dataset is available (with timeout consideration)
-        self.dataset_available = ensure_dataset_available(self.dataset_dir)
-        
-        # Load or create index
-        if self.dataset_available:
-            self.index = get_or_create_index(self.dataset_dir, self.index_path)
+        # Dataset and index are filled in by _load_data
+        self.dataset_available = False
+        self.index: Optional[pl.DataFrame] = None
+        self._index_summary: Dict[str, Any] = {}
+        self._uniprot_rows: Dict[str, List[int]] = {}
+        self._organisms_lower: Dict[str, str] = {}
+        self._dataset_info_cache: Optional[Dict[str, Any]] = None
+        self._data_ready = threading.Event()
+        self._pdb_metadata_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._pdb_metadata_lock = threading.Lock()
+        if background_load:
+            threading.Thread(target=self._load_data, name="atomica-data-loader", daemon=True).start()
         else:
-            self.index = None
+            self._load_data()
         
         # Register tools and resources
         self._register_atomica_tools()
         self._register_atomica_resources()
     
+    def _load_data(self) -> None:
+        """Ensure the dataset is available (downloading it if needed) and load or create the index."""
+        with start_action(action_type="load_atomica_data", dataset_dir=str(self.dataset_dir)) as action:
+            try:
+                self.dataset_available = ensure_dataset_available(self.dataset_dir)
+                if self.dataset_available:
+                    index = get_or_create_index(self.dataset_dir, self.index_path)
+                    if index is not None:
+                        self._index_summary, self._uniprot_rows = load_index_derived(index, self.index_path)
+                        self._organisms_lower = {
+                            name: name.lower() for name in self._index_summary.get("unique_organisms", ())
+                        }
+                        self._warm_pdb_metadata_cache(index)
+                    self.index = index
+                action.log(
+                    message_type="data_loaded",
+                    dataset_available=self.dataset_available,
+                    rows=len(self.index) if self.index is not None else 0
+                )
+            finally:
+                # Anything built from the pre-load state is stale now
+                self._dataset_info_cache = None
+                self._data_ready.set()
+    
+    def _warm_pdb_metadata_cache(self, index: pl.DataFrame) -> None:
+        """
+        Seed the resolve_pdb cache with the dataset's PDB IDs from the on-disk metadata cache.
+        
+        `dataset index` stores every resolved structure there, so the dataset's own
+        structures resolve from memory on first use. Only local reads are made;
+        IDs without a cache entry are resolved through the APIs when requested.
+        
+        Args:
+            index: Loaded index DataFrame
+        """
+        from atomica_mcp.dataset import load_cached_pdb_metadata
+        
+        pdb_ids = index.get_column("pdb_id").head(PDB_METADATA_CACHE_SIZE).to_list()
+        cached = load_cached_pdb_metadata(pdb_ids)
+        with self._pdb_metadata_lock:
+            for pdb_id, metadata in cached.items():
+                if metadata.get("found"):
+                    self._pdb_metadata_cache.setdefault(pdb_id, metadata)
+    
+    def _cached_pdb_metadata(self, pdb_id: str) -> Dict[str, Any]:
+        """
+        Resolve PDB metadata, reusing earlier results for the same PDB ID.
+        
+        Only successful lookups are kept, so transient API failures are retried
+        on the next call. The least recently used entry is evicted once
+        PDB_METADATA_CACHE_SIZE entries are stored.
+        
+        Args:
+            pdb_id: PDB identifier (case-insensitive)
+        
+        Returns:
+            Dictionary returned by resolve_pdb_metadata
+        """
+        key = pdb_id.upper()
+        with self._pdb_metadata_lock:
+            metadata = self._pdb_metadata_cache.get(key)
+            if metadata is not None:
+                self._pdb_metadata_cache.move_to_end(key)
+                return metadata
+        
+        from atomica_mcp.dataset import resolve_pdb_metadata
+        
+        metadata = resolve_pdb_metadata(pdb_id)
+        if metadata.get("found"):
+            with self._pdb_metadata_lock:
+                self._pdb_metadata_cache[key] = metadata
+                if len(self._pdb_metadata_cache) > PDB_METADATA_CACHE_SIZE:
+                    self._pdb_metadata_cache.popitem(last=False)
+        return metadata
+    
+    def _dataset_error(self, require_index: bool = True) -> Optional[str]:
+        """
+        Check whether dataset queries can be served.
+        
+        Waits briefly for background loading so a request arriving right after
+        startup is not rejected needlessly.
+        
+        Args:
+            require_index: Whether the parquet index is needed in addition to the files
+        
+        Returns:
+            Error message if the dataset cannot be used yet, None otherwise
+        """
+        if not self._data_ready.wait(timeout=DATA_READY_WAIT_SECONDS):
+            return DATA_LOADING_ERROR
+        if not self.dataset_available or (require_index and self.index is None):
+            return "ATOMICA dataset not available"
+        return None
+    
     def _resolve_path(self, relative_path: Optional[str]) -> Optional[str]:
         """
         Resolve relative path from index to absolute path and verify existence.
@@ -348,9 +726,14 @@ class AtomicaMCP(FastMCP):
             description="Search ATOMICA dataset by UniProt ID. Returns structures WITH ATOMICA interaction scores, critical residues TSV paths, and PyMOL visualization command paths. FAST (instant, uses local Polars index with uniprot_ids column). USE THIS IMMEDIATELY when user asks for 'ATOMICA scores of Q14145' or similar - it queries local index and returns file paths to all ATOMICA analysis data. Example: atomica_search_by_uniprot('Q14145') returns 56 KEAP1 structures with ATOMICA analysis paths in 0.003 seconds."
         )(self.search_by_uniprot)
         
+        self.tool(
+            name="atomica_search_by_uniprots",
+            description="Search ATOMICA dataset for MULTIPLE UniProt IDs in one call. Returns per-ID structures WITH ATOMICA interaction scores, critical residues TSV paths, and PyMOL command paths. FAST (single local index pass for all IDs). Use instead of repeated atomica_search_by_uniprot calls when sweeping several proteins. Example: atomica_search_by_uniprots(['P02649', 'Q14145'])"
+        )(self.search_by_uniprots)
+        
         self.tool(
             name="atomica_search_by_organism",
-            description="Search ATOMICA dataset by organism name (e.g. 'Homo sapiens', 'human'). Returns structures WITH ATOMICA analysis data. FAST (instant, local index). Note: organism data is often incomplete; prefer atomica_search_by_gene with species parameter for reliable results. Example: atomica_search_by_organism('Homo sapiens')"
+            description="Search ATOMICA dataset by organism name (e.g. 'Homo sapiens', 'human'). Returns structures WITH ATOMICA analysis data. FAST (instant, local index). Paginated with limit/offset (default 100); 'count' is the total number of matches and 'next_offset' fetches the next page. Note: organism data is often incomplete; prefer atomica_search_by_gene with species parameter for reliable results. Example: atomica_search_by_organism('Homo sapiens')"
         )(self.search_by_organism)
         
         # ============================================================================
@@ -363,6 +746,11 @@ class AtomicaMCP(FastMCP):
             description="Resolve general PDB metadata for ANY PDB ID (not limited to ATOMICA dataset): UniProt IDs, gene symbols, organisms, taxonomy. Makes external API calls. SLOW (~5-10 seconds per PDB). Does NOT return ATOMICA scores or analysis. Only use when you need metadata for PDB IDs outside ATOMICA dataset. Example: atomica_resolve_pdb('1tup')"
         )(self.resolve_pdb)
         
+        self.tool(
+            name="atomica_resolve_pdbs",
+            description="Resolve general PDB metadata for MULTIPLE PDB IDs in one call (not limited to ATOMICA dataset): UniProt IDs, gene symbols, organisms, taxonomy per ID. Makes external API calls, resolving uncached IDs concurrently. SLOW but much faster than repeated atomica_resolve_pdb calls. Does NOT return ATOMICA scores or analysis. Example: atomica_resolve_pdbs(['1tup', '4iqk'])"
+        )(self.resolve_pdbs)
+        
         self.tool(
             name="atomica_get_structures_for_uniprot",
             description="Get PDB structures for a UniProt ID. ALWAYS checks ATOMICA dataset index first (instant)! If found in ATOMICA, returns ATOMICA analysis data immediately. Only queries external PDB APIs (slow, 2-5 min) if UniProt NOT in ATOMICA dataset. Returns 'source' field indicating data origin: 'atomica_dataset' (has ATOMICA scores) or 'external_pdb' (no ATOMICA scores). For most queries, atomica_search_by_uniprot is preferred as it's explicitly for ATOMICA data. Example: atomica_get_structures_for_uniprot('Q14145') checks index first, finds KEAP1 in ATOMICA, returns in 0.003s with ATOMICA analysis."
@@ -441,7 +829,8 @@ Extended columns (if index was built with metadata):
   • organisms: List of organism names
   • taxonomy_ids: List of NCBI taxonomy IDs
   • gene_symbols: List of gene symbols
-  • structures_json: JSON string with structure details
+  • gene_symbols_display: Gene symbols pre-joined as a comma-separated string
+  • structures: List of structure detail structs (method, resolution, chains, coverage, complex info)
   • critical_residues_count: Number of critical residues identified
   • total_time_seconds: Processing time
   • gpu_memory_mb_max: Maximum GPU memory used
@@ -461,7 +850,8 @@ Query patterns:
             offset: Structures to skip
         
         Returns:
-            List of structures with availability flags
+            List of structures with availability flags; next_offset is the offset
+            of the following page, or None on the last page
             
         Example:
             >>> list_structures(limit=10, offset=0)
@@ -469,13 +859,15 @@ Query patterns:
                 "structures": [{"pdb_id": "1B68", "has_metadata": true, ...}],
                 "total": 94,
                 "limit": 10,
-                "offset": 0
+                "offset": 0,
+                "next_offset": 10
             }
         """
         with start_action(action_type="list_structures", limit=limit, offset=offset) as action:
-            if not self.dataset_available or self.index is None:
+            error = pagination_error(limit, offset) or self._dataset_error()
+            if error:
                 return {
-                    "error": "ATOMICA dataset not available",
+                    "error": error,
                     "structures": [],
                     "total": 0
                 }
@@ -491,7 +883,10 @@ Query patterns:
                     "has_critical_residues": row.get("critical_residues_path") is not None,
                     "has_interact_scores": row.get("interact_scores_path") is not None,
                 }
-                for row in results.iter_rows(named=True)
+                for row in rows_as_dicts(
+                    results,
+                    ["pdb_id", "metadata_path", "critical_residues_path", "interact_scores_path"]
+                )
             ]
             
             action.log(message_type="structures_listed", count=len(structures), total=total)
@@ -500,7 +895,8 @@ Query patterns:
                 "structures": structures,
                 "total": total,
                 "limit": limit,
-                "offset": offset
+                "offset": offset,
+                "next_offset": next_page_offset(offset, limit, total)
             }
     
     def get_structure(self, pdb_id: str) -> Dict[str, Any]:
@@ -527,9 +923,10 @@ Query patterns:
             }
         """
         with start_action(action_type="get_structure", pdb_id=pdb_id) as action:
-            if not self.dataset_available or self.index is None:
+            error = self._dataset_error()
+            if error:
                 return {
-                    "error": "ATOMICA dataset not available",
+                    "error": error,
                     "pdb_id": pdb_id.upper()
                 }
             
@@ -547,7 +944,11 @@ Query patterns:
                 }
             
             # Get row data
-            row = result.row(0, named=True)
+            row = rows_as_dicts(result.head(1), [
+                "pdb_id", "cif_path", "metadata_path", "summary_path", "critical_residues_path",
+                "interact_scores_path", "pymol_path", "title", "uniprot_ids", "gene_symbols",
+                "organisms", "taxonomy_ids", "critical_residues_count",
+            ])[0]
             
             # Build structure info with absolute paths
             path_keys = ["cif_path", "metadata_path", "summary_path", 
@@ -589,9 +990,10 @@ Query patterns:
             Dictionary with file paths and availability
         """
         with start_action(action_type="get_structure_files", pdb_id=pdb_id) as action:
-            if not self.dataset_available:
+            error = self._dataset_error(require_index=False)
+            if error:
                 return {
-                    "error": "ATOMICA dataset not available",
+                    "error": error,
                     "pdb_id": pdb_id.upper()
                 }
             
@@ -678,9 +1080,10 @@ Query patterns:
             }
         """
         with start_action(action_type="search_by_gene", gene_symbol=gene_symbol, species=species) as action:
-            if not self.dataset_available or self.index is None:
+            error = self._dataset_error()
+            if error:
                 return {
-                    "error": "ATOMICA dataset not available",
+                    "error": error,
                     "gene_symbol": gene_symbol,
                     "structures": []
                 }
@@ -715,7 +1118,7 @@ Query patterns:
                             "critical_residues_path": row.get("critical_residues_path"),
                             "pymol_path": row.get("pymol_path"),
                         }
-                        for row in results.iter_rows(named=True)
+                        for row in rows_as_dicts(results, GENE_SEARCH_COLUMNS)
                     ]
                     
                     return {
@@ -747,11 +1150,7 @@ Query patterns:
             action.log(message_type="uniprot_resolved", uniprot_ids=uniprot_ids)
             
             # Search by resolved UniProt IDs in index
-            results = self.index.filter(
-                pl.col("uniprot_ids").list.eval(
-                    pl.element().is_in(uniprot_ids)
-                ).list.any()
-            )
+            results = self._rows_for_uniprots(uniprot_ids)
             
             structures = [
                 {
@@ -763,7 +1162,7 @@ Query patterns:
                     "critical_residues_path": row.get("critical_residues_path"),
                     "pymol_path": row.get("pymol_path"),
                 }
-                for row in results.iter_rows(named=True)
+                for row in rows_as_dicts(results, GENE_SEARCH_COLUMNS)
             ]
             
             action.log(message_type="search_complete", count=len(structures))
@@ -811,6 +1210,7 @@ Query patterns:
                         "pdb_id": "1U6D",
                         "uniprot_ids": ["Q14145"],
                         "gene_symbols": ["KEAP1"],
+                        "gene_symbols_display": "KEAP1",
                         "interact_scores_path": "1u6d/1u6d_interact_scores.json",
                         "critical_residues_path": "1u6d/1u6d_critical_residues.tsv",
                         "pymol_path": "1u6d/1u6d_pymol_commands.pml"
@@ -821,9 +1221,10 @@ Query patterns:
             }
         """
         with start_action(action_type="search_by_uniprot", uniprot_id=uniprot_id) as action:
-            if not self.dataset_available or self.index is None:
+            error = self._dataset_error()
+            if error:
                 return {
-                    "error": "ATOMICA dataset not available",
+                    "error": error,
                     "uniprot_id": uniprot_id,
                     "structures": []
                 }
@@ -837,22 +1238,12 @@ Query patterns:
                     "structures": []
                 }
             
-            # Filter by UniProt ID (uniprot_ids is list[str])
-            results = self.index.filter(
-                pl.col("uniprot_ids").list.contains(uniprot_id)
-            )
+            # Rows come straight from the UniProt -> rows map built at load time
+            results = self._rows_for_uniprots([uniprot_id])
             
             structures = [
-                {
-                    "pdb_id": row["pdb_id"],
-                    "title": row.get("title"),
-                    "uniprot_ids": row.get("uniprot_ids", []),
-                    "gene_symbols": row.get("gene_symbols", []),
-                    "interact_scores_path": row.get("interact_scores_path"),
-                    "critical_residues_path": row.get("critical_residues_path"),
-                    "pymol_path": row.get("pymol_path"),
-                }
-                for row in results.iter_rows(named=True)
+                self._uniprot_structure_entry(row)
+                for row in rows_as_dicts(results, UNIPROT_SEARCH_COLUMNS)
             ]
             
             action.log(message_type="search_complete", count=len(structures))
@@ -864,7 +1255,103 @@ Query patterns:
                 "count": len(structures)
             }
     
-    def search_by_organism(self, organism: str) -> Dict[str, Any]:
+    def _rows_for_uniprots(self, uniprot_ids: List[str]) -> pl.DataFrame:
+        """
+        Get index rows listing any of the given UniProt IDs, in index order.
+        
+        Args:
+            uniprot_ids: UniProt accessions to look up
+        
+        Returns:
+            Matching rows of the index
+        """
+        rows = sorted({row for uid in uniprot_ids for row in self._uniprot_rows.get(uid, ())})
+        return self.index[rows]
+    
+    @staticmethod
+    def _uniprot_structure_entry(row: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the per-structure entry returned by the UniProt searches."""
+        return {
+            "pdb_id": row["pdb_id"],
+            "title": row.get("title"),
+            "uniprot_ids": row.get("uniprot_ids", []),
+            "gene_symbols": row.get("gene_symbols", []),
+            "gene_symbols_display": row.get("gene_symbols_display"),
+            "interact_scores_path": row.get("interact_scores_path"),
+            "critical_residues_path": row.get("critical_residues_path"),
+            "pymol_path": row.get("pymol_path"),
+        }
+    
+    def search_by_uniprots(self, uniprot_ids: List[str]) -> Dict[str, Any]:
+        """
+        Search ATOMICA dataset for several UniProt IDs at once (FAST - single index pass).
+        
+        Equivalent to calling search_by_uniprot for every ID, but the index is
+        filtered once for all requested IDs and the matches are then grouped
+        per ID, so sweeping dozens of proteins costs about as much as one search.
+        
+        Args:
+            uniprot_ids: UniProt accessions (e.g., ['P02649', 'Q14145'])
+        
+        Returns:
+            Dictionary with per-ID results, each shaped like search_by_uniprot's
+            'structures'/'count' fields (paths relative to dataset_directory)
+            
+        Example:
+            >>> search_by_uniprots(['P02649', 'Q14145'])
+            {
+                "uniprot_ids": ["P02649", "Q14145"],
+                "dataset_directory": "/path/to/atomica_longevity_proteins",
+                "results": {
+                    "P02649": {"structures": [...], "count": 9},
+                    "Q14145": {"structures": [...], "count": 56}
+                },
+                "count": 65
+            }
+        """
+        # Keep request order but drop duplicates
+        requested = list(dict.fromkeys(uniprot_ids))
+        with start_action(action_type="search_by_uniprots", uniprot_ids=requested) as action:
+            error = self._dataset_error()
+            if error:
+                return {
+                    "error": error,
+                    "uniprot_ids": requested,
+                    "results": {}
+                }
+            
+            if "uniprot_ids" not in self.index.columns:
+                action.log(message_type="uniprot_column_missing")
+                return {
+                    "error": "Index does not have UniProt ID information. Run 'dataset index --include-metadata' to rebuild.",
+                    "uniprot_ids": requested,
+                    "results": {}
+                }
+            
+            # Gather rows for all IDs at once, then fan them out to each requested ID
+            results = self._rows_for_uniprots(requested)
+            
+            wanted = set(requested)
+            grouped: Dict[str, List[Dict[str, Any]]] = {uid: [] for uid in requested}
+            for row in rows_as_dicts(results, UNIPROT_SEARCH_COLUMNS):
+                entry = self._uniprot_structure_entry(row)
+                for uid in dict.fromkeys(row.get("uniprot_ids") or []):
+                    if uid in wanted:
+                        grouped[uid].append(entry)
+            
+            action.log(message_type="search_complete", count=results.height)
+            
+            return {
+                "uniprot_ids": requested,
+                "dataset_directory": str(self.dataset_dir),
+                "results": {
+                    uid: {"structures": structures, "count": len(structures)}
+                    for uid, structures in grouped.items()
+                },
+                "count": results.height
+            }
+    
+    def search_by_organism(self, organism: str, limit: int = 100, offset: int = 0) -> Dict[str, Any]:
         """
         Search for structures by organism name (best-effort).
         
@@ -875,14 +1362,18 @@ Query patterns:
         
         Args:
             organism: Organism name or substring (e.g., 'Homo sapiens', 'human', 'sapiens')
+            limit: Max structures to return
+            offset: Matching structures to skip
         
         Returns:
-            Dictionary with matching structures and warning if data is sparse
+            Dictionary with one page of matching structures, the total match count
+            ('count'), next_offset (None on the last page) and a warning if data is sparse
         """
         with start_action(action_type="search_by_organism", organism=organism) as action:
-            if not self.dataset_available or self.index is None:
+            error = pagination_error(limit, offset) or self._dataset_error()
+            if error:
                 return {
-                    "error": "ATOMICA dataset not available",
+                    "error": error,
                     "organism": organism,
                     "structures": []
                 }
@@ -897,8 +1388,10 @@ Query patterns:
                     "suggestion": "Try: atomica_search_by_gene('KEAP1', 'Homo sapiens')"
                 }
             
-            # Count how many structures have organism data
-            with_organisms = self.index.filter(pl.col("organisms").list.len() > 0).height
+            # Counted once at load time; the index does not change while serving
+            with_organisms = self._index_summary.get("structures_with_organisms")
+            if with_organisms is None:
+                with_organisms = self.index.filter(pl.col("organisms").list.len() > 0).height
             total = len(self.index)
             
             # If no structures have organism data, return early with warning
@@ -922,13 +1415,13 @@ Query patterns:
             
             # Filter by organism (case-insensitive substring match)
             # Check for null values and empty lists
+            # Only the few distinct organism names are matched, lowercased once at load
             organism_lower = organism.lower()
             try:
+                pattern = re.compile(organism_lower)
+                matching = [name for name, name_lower in self._organisms_lower.items() if pattern.search(name_lower)]
                 results = self.index.filter(
-                    pl.col("organisms").list.eval(
-                        pl.element().is_not_null() & 
-                        pl.element().str.to_lowercase().str.contains(organism_lower)
-                    ).list.any()
+                    pl.col("organisms").list.eval(pl.element().cast(pl.String).is_in(matching)).list.any()
                 )
             except Exception as e:
                 # Fallback: organisms column might have null values
@@ -944,6 +1437,8 @@ Query patterns:
                     "suggestion": "Try: atomica_search_by_gene('KEAP1', 'Homo sapiens')"
                 }
             
+            # Broad queries ('human') match most of the dataset, so only one page is converted
+            matches = results.height
             structures = [
                 {
                     "pdb_id": row["pdb_id"],
@@ -952,16 +1447,22 @@ Query patterns:
                     "gene_symbols": row.get("gene_symbols", []),
                     "uniprot_ids": row.get("uniprot_ids", []),
                 }
-                for row in results.iter_rows(named=True)
+                for row in rows_as_dicts(
+                    results[offset:offset+limit],
+                    ["pdb_id", "title", "organisms", "gene_symbols", "uniprot_ids"]
+                )
             ]
             
-            action.log(message_type="search_complete", count=len(structures), 
+            action.log(message_type="search_complete", count=matches, returned=len(structures),
                       with_organisms=with_organisms, total=total)
             
             result = {
                 "organism": organism,
                 "structures": structures,
-                "count": len(structures),
+                "count": matches,
+                "limit": limit,
+                "offset": offset,
+                "next_offset": next_page_offset(offset, limit, matches),
                 "index_coverage": {
                     "structures_with_organism_data": with_organisms,
                     "total_structures": total,
@@ -991,10 +1492,46 @@ Query patterns:
             Dictionary with resolved metadata
         """
         with start_action(action_type="resolve_pdb", pdb_id=pdb_id) as action:
-            metadata = resolve_pdb_metadata(pdb_id)
+            metadata = self._cached_pdb_metadata(pdb_id)
             action.log(message_type="pdb_resolved", found=metadata.get("found", False))
             return metadata
     
+    def resolve_pdbs(self, pdb_ids: List[str]) -> Dict[str, Any]:
+        """
+        Resolve metadata for several PDB IDs in one call.
+        
+        Duplicate IDs are resolved once, previously resolved IDs come from the
+        per-server cache, and the rest are looked up concurrently.
+        
+        Args:
+            pdb_ids: PDB identifiers (case-insensitive, e.g., ['1tup', '4iqk'])
+        
+        Returns:
+            Dictionary with per-ID metadata, each shaped like resolve_pdb's result
+            
+        Example:
+            >>> resolve_pdbs(['1tup', '4iqk'])
+            {
+                "pdb_ids": ["1TUP", "4IQK"],
+                "results": {"1TUP": {"found": True, ...}, "4IQK": {"found": True, ...}},
+                "found": 2
+            }
+        """
+        # Keep request order but drop duplicates
+        requested = list(dict.fromkeys(pdb_id.upper() for pdb_id in pdb_ids))
+        with start_action(action_type="resolve_pdbs", pdb_ids=requested) as action:
+            workers = max(1, min(PDB_RESOLVE_WORKERS, len(requested)))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = dict(zip(requested, executor.map(self._cached_pdb_metadata, requested)))
+            
+            found = sum(1 for metadata in results.values() if metadata.get("found"))
+            action.log(message_type="pdbs_resolved", found=found, total=len(requested))
+            return {
+                "pdb_ids": requested,
+                "results": results,
+                "found": found
+            }
+    
     def get_structures_for_uniprot(self, uniprot_id: str, include_alphafold: bool = True, max_structures: Optional[int] = None, force_comprehensive: bool = False) -> Dict[str, Any]:
         """
         Get PDB structures for a UniProt ID.
@@ -1021,7 +1558,16 @@ Query patterns:
         with start_action(action_type="get_structures_for_uniprot", uniprot_id=uniprot_id, force_comprehensive=force_comprehensive) as action:
             # STEP 1: ALWAYS check ATOMICA index first
             atomica_result = None
-            if self.dataset_available and self.index is not None and not force_comprehensive:
+            if not force_comprehensive and not self._data_ready.wait(timeout=STRUCTURES_DATA_READY_WAIT_SECONDS):
+                # Never fall back to the external APIs just because the index is not loaded yet
+                action.log(message_type="atomica_index_still_loading", uniprot_id=uniprot_id)
+                return {
+                    "error": DATA_LOADING_ERROR,
+                    "uniprot_id": uniprot_id,
+                    "structures": [],
+                    "count": 0,
+                }
+            if not force_comprehensive and self._dataset_error() is None:
                 action.log(message_type="checking_atomica_index", uniprot_id=uniprot_id)
                 atomica_result = self.search_by_uniprot(uniprot_id)
                 
@@ -1051,7 +1597,12 @@ Query patterns:
             )
             
             try:
-                structures = get_structures_for_uniprot(uniprot_id, include_alphafold=include_alphafold)
+                # The cap is applied before per-PDB metadata is fetched, not after
+                structures = get_structures_for_uniprot(
+                    uniprot_id,
+                    include_alphafold=include_alphafold,
+                    max_structures=max_structures
+                )
                 
                 if not structures:
                     return {
@@ -1063,7 +1614,7 @@ Query patterns:
                         "message": "No structures found in PDB"
                     }
                 
-                # Limit results if requested
+                # Limit results if requested (the AlphaFold model counts towards the cap)
                 if max_structures is not None:
                     structures = structures[:max_structures]
                 
@@ -1096,111 +1647,98 @@ Query patterns:
         """
         Get information about the ATOMICA dataset status and statistics.
         
+        Nothing in the response changes once loading has finished, so it is
+        built once and the same dictionary is returned on later calls.
+        
         Returns:
             Dictionary with dataset information
         """
         with start_action(action_type="dataset_info") as action:
+            if self._dataset_info_cache is not None:
+                action.log(message_type="info_retrieved", available=self.dataset_available, cached=True)
+                return self._dataset_info_cache
+            
+            error = self._dataset_error()
             info = {
                 "dataset_available": self.dataset_available,
+                "loading": not self._data_ready.is_set(),
                 "dataset_directory": str(self.dataset_dir),
                 "index_path": str(self.index_path),
                 "repository": HF_REPO_ID,
                 "repository_url": f"https://huggingface.co/datasets/{HF_REPO_ID}"
             }
             
-            if self.dataset_available and self.index is not None:
-                info["total_structures"] = len(self.index)
-                
-                # Count files
-                info["structures_with_metadata"] = self.index.filter(
-                    pl.col("metadata_path").is_not_null()
-                ).height
-                info["structures_with_critical_residues"] = self.index.filter(
-                    pl.col("critical_residues_path").is_not_null()
-                ).height
-                info["structures_with_interact_scores"] = self.index.filter(
-                    pl.col("interact_scores_path").is_not_null()
-                ).height
+            if error is None:
+                summary = self._index_summary
+                info["total_structures"] = summary["total_structures"]
+                info["structures_with_metadata"] = summary["structures_with_metadata"]
+                info["structures_with_critical_residues"] = summary["structures_with_critical_residues"]
+                info["structures_with_interact_scores"] = summary["structures_with_interact_scores"]
                 
                 # Extended info if available
-                if "gene_symbols" in self.index.columns:
-                    all_genes = [
-                        gene
-                        for genes in self.index["gene_symbols"].to_list()
-                        if genes
-                        for gene in genes
-                    ]
-                    unique_genes = sorted(set(all_genes))
-                    info["unique_genes"] = unique_genes
-                    info["gene_count"] = len(unique_genes)
+                if "unique_genes" in summary:
+                    info["unique_genes"] = list(summary["unique_genes"])
+                    info["gene_count"] = len(summary["unique_genes"])
                 
-                if "organisms" in self.index.columns:
-                    all_organisms = [
-                        org
-                        for orgs in self.index["organisms"].to_list()
-                        if orgs
-                        for org in orgs
-                    ]
-                    unique_organisms = sorted(set(all_organisms))
-                    info["unique_organisms"] = unique_organisms
-                    info["organism_count"] = len(unique_organisms)
+                if "unique_organisms" in summary:
+                    info["unique_organisms"] = list(summary["unique_organisms"])
+                    info["organism_count"] = len(summary["unique_organisms"])
+            elif info["loading"]:
+                info["message"] = error
             else:
                 info["message"] = "Dataset not available. Download using: atomica-mcp dataset download"
             
+            if not info["loading"]:
+                self._dataset_info_cache = info
             action.log(message_type="info_retrieved", available=self.dataset_available)
             return info
 
 
-# Initialize the ATOMICA MCP server
-mcp = AtomicaMCP()
-
-# Create typer app
-app = typer.Typer(help="ATOMICA MCP Server - Protein structure and ATOMICA analysis interface")
-
+_mcp: Optional[AtomicaMCP] = None
 
-@app.command("run")
-def cli_app(
-    host: str = typer.Option(DEFAULT_HOST, "--host", help="Host to bind to"),
-    port: int = typer.Option(DEFAULT_PORT, "--port", help="Port to bind to"),
-    transport: str = typer.Option("streamable-http", "--transport", help="Transport type")
-) -> None:
-    """Run the MCP server with specified transport."""
-    mcp.run(transport=transport, host=host, port=port)
 
-
-@app.command("stdio")
-def cli_app_stdio(
-    verbose: bool = typer.Option(False, "--verbose", "-v", help="Verbose output")
-) -> None:
-    """Run the MCP server with stdio transport."""
-    mcp.run(transport="stdio")
+def get_mcp() -> AtomicaMCP:
+    """
+    Get the ATOMICA MCP server, creating it on first use.
+    
+    Construction is deferred until a transport actually starts instead of
+    running on module import, and the dataset and index are loaded in the
+    background so tools are registered immediately.
+    
+    Returns:
+        Shared AtomicaMCP instance
+    """
+    global _mcp
+    if _mcp is None:
+        _mcp = AtomicaMCP(background_load=True)
+    return _mcp
 
 
-@app.command("sse")
-def cli_app_sse(
-    host: str = typer.Option(DEFAULT_HOST, "--host", help="Host to bind to"),
-    port: int = typer.Option(DEFAULT_PORT, "--port", help="Port to bind to")
-) -> None:
-    """Run the MCP server with SSE transport."""
-    mcp.run(transport="sse", host=host, port=port)
+def __getattr__(name: str) -> Any:
+    # Keep `from atomica_mcp.server import mcp` working without an import-time server
+    if name == "mcp":
+        return get_mcp()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
-# Standalone CLI functions for direct script access
-def cli_app_run() -> None:
+# Standalone CLI functions for direct script access; the typer commands in atomica_mcp.__main__ call them too
+def cli_app_run(host: str = DEFAULT_HOST, port: int = DEFAULT_PORT, transport: str = "streamable-http") -> None:
     """Standalone function for atomica-mcp-run script."""
-    mcp.run(transport="streamable-http", host=DEFAULT_HOST, port=DEFAULT_PORT)
+    get_mcp().run(transport=transport, host=host, port=port)
 
 
 def cli_app_stdio_standalone() -> None:
     """Standalone function for atomica-mcp-stdio script."""
-    mcp.run(transport="stdio")
+    get_mcp().run(transport="stdio")
 
 
-def cli_app_sse_standalone() -> None:
+def cli_app_sse_standalone(host: str = DEFAULT_HOST, port: int = DEFAULT_PORT) -> None:
     """Standalone function for atomica-mcp-sse script."""
-    mcp.run(transport="sse", host=DEFAULT_HOST, port=DEFAULT_PORT)
+    get_mcp().run(transport="sse", host=host, port=port)
 
 
 if __name__ == "__main__":
+    # The typer CLI lives in atomica_mcp.__main__ so script launches never import it
+    from atomica_mcp.__main__ import app
     app()
 
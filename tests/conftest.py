@@ -0,0 +1,177 @@
+"""Shared pytest fixtures."""
+
+import json
+import threading
+from pathlib import Path
+
+import pytest
+
+try:
+    import vcr
+except ImportError:  # vcrpy is optional; without it API tests always go to the network
+    vcr = None
+
+from atomica_mcp.preprocessing.pdb_utils import get_default_anage_file, load_anage_data
+from atomica_mcp.server import AtomicaMCP
+
+
+# Canned resolve_pdb_metadata results, one <pdb_id>.json per entry
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+# Recorded API responses, one <test module>.yaml per module using api_cassette
+CASSETTES_DIR = Path(__file__).parent / "cassettes"
+
+# Minimum share of HTTP responses served from requests-cache under --cache-required
+CACHE_HIT_THRESHOLD = 0.9
+
+_http_counts = {"requests": 0, "cache_hits": 0}
+_http_counts_lock = threading.Lock()
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--live",
+        action="store_true",
+        default=False,
+        help="Query the real PDB APIs instead of the canned responses in tests/fixtures and tests/cassettes",
+    )
+    parser.addoption(
+        "--run-network",
+        action="store_true",
+        default=False,
+        help="Run tests marked network even when no recorded cassette can replay them",
+    )
+    parser.addoption(
+        "--record",
+        action="store_true",
+        default=False,
+        help="Record API responses missing from tests/cassettes (needs network access); implies --run-network",
+    )
+    parser.addoption(
+        "--cache-required",
+        action="store_true",
+        default=False,
+        help=f"Fail the session if under {CACHE_HIT_THRESHOLD:.0%} of API responses come from the HTTP cache",
+    )
+
+
+def _count_http_response(response, *args, **kwargs):
+    with _http_counts_lock:
+        _http_counts["requests"] += 1
+        _http_counts["cache_hits"] += bool(getattr(response, "from_cache", False))
+
+
+def pytest_configure(config):
+    if not config.getoption("--cache-required"):
+        return
+    from atomica_mcp.mining import pdb_metadata
+    
+    if pdb_metadata.requests_cache is None or not isinstance(pdb_metadata._SESSION, pdb_metadata.requests_cache.CachedSession):
+        raise pytest.UsageError("--cache-required needs requests-cache installed and ATOMICA_MCP_HTTP_CACHE enabled")
+    pdb_metadata._SESSION.hooks["response"].append(_count_http_response)
+
+
+def _cassette_file(module) -> Path:
+    """Cassette holding a test module's recorded API responses."""
+    return CASSETTES_DIR / f"{module.__name__.rsplit('.', 1)[-1]}.yaml"
+
+
+def _has_cassette(item) -> bool:
+    """Whether the item's module has a recorded cassette that api_cassette can replay."""
+    return vcr is not None and _cassette_file(item.module).exists()
+
+
+def pytest_collection_modifyitems(config, items):
+    # Live API calls are opt-in; tests whose responses are recorded still run offline
+    if config.getoption("--run-network") or config.getoption("--live") or config.getoption("--record"):
+        return
+    skip_network = pytest.mark.skip(reason="calls external APIs and has no recorded cassette; pass --run-network to run")
+    for item in items:
+        if "network" in item.keywords and not _has_cassette(item):
+            item.add_marker(skip_network)
+
+
+def pytest_sessionfinish(session, exitstatus):
+    if not session.config.getoption("--cache-required") or not _http_counts["requests"]:
+        return
+    hit_ratio = _http_counts["cache_hits"] / _http_counts["requests"]
+    if hit_ratio < CACHE_HIT_THRESHOLD:
+        print(
+            f"\nHTTP cache hit ratio {hit_ratio:.0%} "
+            f"({_http_counts['cache_hits']}/{_http_counts['requests']}) is below {CACHE_HIT_THRESHOLD:.0%}"
+        )
+        session.exitstatus = pytest.ExitCode.TESTS_FAILED
+
+
+@pytest.fixture(scope="session")
+def mcp_server():
+    """Create the MCP server once per test session; tests only query it."""
+    return AtomicaMCP()
+
+
+@pytest.fixture(scope="session")
+def anage_data():
+    """Load the AnAge database once per test session; tests only read it."""
+    anage_file = get_default_anage_file()
+    
+    if not anage_file.exists():
+        pytest.skip(f"AnAge data not found at {anage_file}")
+    
+    return load_anage_data(anage_file)
+
+
+@pytest.fixture
+def mock_pdb_metadata(request, monkeypatch, mcp_server):
+    """
+    Serve PDB metadata lookups from tests/fixtures instead of the network.
+    
+    Canned entries are evicted from the shared server's cache before and after
+    the test, so other tests never see them. With --live the real APIs are used.
+    """
+    if request.config.getoption("--live"):
+        yield {}
+        return
+    
+    canned = {path.stem.upper(): json.loads(path.read_text()) for path in FIXTURES_DIR.glob("*.json")}
+    
+    def resolve_pdb_metadata(pdb_id):
+        metadata = canned.get(pdb_id.upper())
+        assert metadata is not None, f"No canned metadata for {pdb_id} in {FIXTURES_DIR}"
+        return metadata
+    
+    def evict_canned():
+        with mcp_server._pdb_metadata_lock:
+            for pdb_id in canned:
+                mcp_server._pdb_metadata_cache.pop(pdb_id, None)
+    
+    monkeypatch.setattr("atomica_mcp.dataset.resolve_pdb_metadata", resolve_pdb_metadata)
+    evict_canned()
+    yield canned
+    evict_canned()
+
+
+@pytest.fixture(scope="module")
+def api_cassette(request):
+    """
+    Replay a test module's API responses from tests/cassettes/<module>.yaml.
+    
+    Module scope also covers class-scoped prefetch fixtures, and one cassette per module
+    lets lookups memoized by an earlier test replay in any test order. Replay is strict:
+    a request missing from the cassette fails instead of reaching the network or writing
+    to the source tree. Only --record adds missing responses to the cassette. Without
+    vcrpy, with --live, or when the module has no cassette yet, the real APIs are used.
+    """
+    cassette_file = _cassette_file(request.module)
+    record = request.config.getoption("--record")
+    if vcr is None or request.config.getoption("--live") or not (record or cassette_file.exists()):
+        yield
+        return
+    recorder = vcr.VCR(
+        cassette_library_dir=str(CASSETTES_DIR),
+        record_mode="new_episodes" if record else "none",
+        allow_playback_repeats=True,
+        decode_compressed_response=True,
+        match_on=["method", "scheme", "host", "port", "path", "query", "body"],
+    )
+    with recorder.use_cassette(cassette_file.name):
+        yield
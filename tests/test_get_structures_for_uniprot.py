@@ -6,11 +6,12 @@ Tests the new behavior where the function ALWAYS checks ATOMICA index first:
 2. If NOT in index: Falls back to external API calls (slow path)
 """
 
-from atomica_mcp.server import AtomicaMCP
 import time
 
+import pytest
 
-def test_mcp_get_structures_for_uniprot_q14145_fast_path():
+
+def test_mcp_get_structures_for_uniprot_q14145_fast_path(mcp_server):
     """
     Test MCP server function for Q14145 (KEAP1) - should use FAST path.
     
@@ -20,12 +21,11 @@ def test_mcp_get_structures_for_uniprot_q14145_fast_path():
     - NOT make external API calls
     - Complete in < 1 second
     """
-    server = AtomicaMCP()
     uniprot_id = "Q14145"
     
-    start = time.time()
-    result = server.get_structures_for_uniprot(uniprot_id=uniprot_id, include_alphafold=False)
-    elapsed = time.time() - start
+    start = time.perf_counter()
+    result = mcp_server.get_structures_for_uniprot(uniprot_id=uniprot_id, include_alphafold=False)
+    elapsed = time.perf_counter() - start
     
     # Should be very fast (from index)
     assert elapsed < 1.0, f"Should be instant (< 1s), took {elapsed:.3f}s"
@@ -60,13 +60,12 @@ def test_mcp_get_structures_for_uniprot_q14145_fast_path():
     print(f"  ✓ Has PyMOL commands: {first['pymol_path'] is not None}")
 
 
-def test_mcp_get_structures_for_uniprot_with_limit():
+def test_mcp_get_structures_for_uniprot_with_limit(mcp_server):
     """Test getting limited number of structures from MCP server."""
-    server = AtomicaMCP()
     uniprot_id = "Q14145"
     max_structures = 10
     
-    result = server.get_structures_for_uniprot(
+    result = mcp_server.get_structures_for_uniprot(
         uniprot_id=uniprot_id,
         include_alphafold=False,
         max_structures=max_structures
@@ -79,25 +78,24 @@ def test_mcp_get_structures_for_uniprot_with_limit():
     print(f"✓ Limited to {result['count']} structures (max: {max_structures})")
 
 
-def test_mcp_search_by_uniprot_comparison():
+def test_mcp_search_by_uniprot_comparison(mcp_server):
     """
     Compare atomica_search_by_uniprot vs atomica_get_structures_for_uniprot.
     
     Both should return same data for Q14145 since it's in ATOMICA dataset,
     but search_by_uniprot is the explicit/direct method.
     """
-    server = AtomicaMCP()
     uniprot_id = "Q14145"
     
     # Test search_by_uniprot (explicit ATOMICA search)
-    start1 = time.time()
-    search_result = server.search_by_uniprot(uniprot_id)
-    elapsed1 = time.time() - start1
+    start1 = time.perf_counter()
+    search_result = mcp_server.search_by_uniprot(uniprot_id)
+    elapsed1 = time.perf_counter() - start1
     
     # Test get_structures_for_uniprot (checks index first, then falls back)
-    start2 = time.time()
-    get_result = server.get_structures_for_uniprot(uniprot_id, include_alphafold=False)
-    elapsed2 = time.time() - start2
+    start2 = time.perf_counter()
+    get_result = mcp_server.get_structures_for_uniprot(uniprot_id, include_alphafold=False)
+    elapsed2 = time.perf_counter() - start2
     
     # Both should be fast
     assert elapsed1 < 1.0, f"search_by_uniprot should be instant, took {elapsed1:.3f}s"
@@ -125,7 +123,8 @@ def test_mcp_search_by_uniprot_comparison():
     print(f"  ✓ Both are instant (use local index)")
 
 
-def test_mcp_get_structures_for_uniprot_not_in_dataset():
+@pytest.mark.network
+def test_mcp_get_structures_for_uniprot_not_in_dataset(mcp_server):
     """
     Test with a UniProt NOT in ATOMICA dataset - should fall back to slow path.
     
@@ -134,11 +133,10 @@ def test_mcp_get_structures_for_uniprot_not_in_dataset():
     
     Note: This test might be slow if TP53 is not in ATOMICA dataset!
     """
-    server = AtomicaMCP()
     uniprot_id = "P04637"  # TP53 - tumor suppressor, not a longevity protein
     
     # First check if it's in ATOMICA dataset
-    search_result = server.search_by_uniprot(uniprot_id)
+    search_result = mcp_server.search_by_uniprot(uniprot_id)
     
     if search_result.get("count", 0) > 0:
         print(f"⚠ P04637 IS in ATOMICA dataset ({search_result['count']} structures), skipping slow path test")
@@ -148,13 +146,13 @@ def test_mcp_get_structures_for_uniprot_not_in_dataset():
     print(f"  (This will be slow - making external API calls)")
     
     # Should fall back to external APIs (slow)
-    start = time.time()
-    result = server.get_structures_for_uniprot(
+    start = time.perf_counter()
+    result = mcp_server.get_structures_for_uniprot(
         uniprot_id=uniprot_id,
         include_alphafold=False,
         max_structures=5  # Limit to avoid very long test
     )
-    elapsed = time.time() - start
+    elapsed = time.perf_counter() - start
     
     # Should indicate external source
     if result.get("count", 0) > 0:
@@ -5,32 +5,35 @@ import pytest
 from pathlib import Path
 import json
 
-from atomica_mcp.server import AtomicaMCP, get_dataset_directory, ensure_dataset_available
+from atomica_mcp.server import get_dataset_directory, ensure_dataset_available
 
 
-# Set default timeout for all tests in this module
-pytestmark = pytest.mark.timeout(300)
+# Resolved once at import; the skipif markers below share it
+DATASET_AVAILABLE = get_dataset_directory().exists()
+
+# Per-test budget for local queries (func_only: the shared server fixture may
+# download the dataset during setup). Local index queries take well under a
+# second, so a blown budget means something went to the network.
+LOCAL_TIMEOUT = 10
 
 
 class TestAtomicaMCP:
     """Test ATOMICA MCP server functionality."""
     
-    @pytest.fixture
-    def mcp_server(self):
-        """Create MCP server instance."""
-        return AtomicaMCP()
-    
+    @pytest.mark.timeout(LOCAL_TIMEOUT, func_only=True)
     def test_dataset_directory(self):
         """Test dataset directory resolution."""
         dataset_dir = get_dataset_directory()
         assert isinstance(dataset_dir, Path)
     
+    @pytest.mark.timeout(LOCAL_TIMEOUT, func_only=True)
     def test_server_initialization(self, mcp_server):
         """Test server initializes correctly."""
         assert mcp_server is not None
         assert hasattr(mcp_server, 'dataset_dir')
         assert hasattr(mcp_server, 'index_path')
     
+    @pytest.mark.timeout(LOCAL_TIMEOUT, func_only=True)
     def test_dataset_info(self, mcp_server):
         """Test dataset info retrieval."""
         info = mcp_server.dataset_info()
@@ -41,8 +44,9 @@ class TestAtomicaMCP:
         assert "repository" in info
         assert info["repository"] == "longevity-genie/atomica_longevity_proteins"
     
+    @pytest.mark.timeout(LOCAL_TIMEOUT, func_only=True)
     @pytest.mark.skipif(
-        not get_dataset_directory().exists(),
+        not DATASET_AVAILABLE,
         reason="Dataset not available"
     )
     def test_list_structures(self, mcp_server):
@@ -57,8 +61,21 @@ class TestAtomicaMCP:
         assert "total" in result
         assert isinstance(result["structures"], list)
     
+    @pytest.mark.timeout(LOCAL_TIMEOUT, func_only=True)
+    def test_invalid_pagination(self, mcp_server):
+        """Test that paging arguments that would never finish are rejected."""
+        for result in (
+            mcp_server.list_structures(limit=0),
+            mcp_server.list_structures(offset=-5),
+            mcp_server.search_by_organism("human", limit=0),
+            mcp_server.search_by_organism("human", offset=-1),
+        ):
+            assert "error" in result
+            assert result["structures"] == []
+    
+    @pytest.mark.timeout(LOCAL_TIMEOUT, func_only=True)
     @pytest.mark.skipif(
-        not get_dataset_directory().exists(),
+        not DATASET_AVAILABLE,
         reason="Dataset not available"
     )
     def test_get_structure_files(self, mcp_server):
@@ -74,9 +91,9 @@ class TestAtomicaMCP:
         assert "files" in result
         assert "availability" in result
     
-    @pytest.mark.timeout(60)
-    def test_resolve_pdb(self, mcp_server):
-        """Test PDB resolution (any PDB, not just ATOMICA)."""
+    @pytest.mark.timeout(LOCAL_TIMEOUT, func_only=True)
+    def test_resolve_pdb(self, mcp_server, mock_pdb_metadata):
+        """Test PDB resolution (any PDB, not just ATOMICA); canned unless --live."""
         # Test with TP53 structure
         result = mcp_server.resolve_pdb("1tup")
         
@@ -89,6 +106,20 @@ class TestAtomicaMCP:
             assert "uniprot_ids" in result
             assert "gene_symbols" in result
     
+    @pytest.mark.timeout(120)
+    @pytest.mark.network
+    def test_resolve_pdbs(self, mcp_server):
+        """Test batch PDB resolution matches single resolution."""
+        result = mcp_server.resolve_pdbs(["1tup", "1TUP", "4iqk"])
+    
+        assert isinstance(result, dict)
+        # Duplicates are dropped, order is preserved
+        assert result["pdb_ids"] == ["1TUP", "4IQK"]
+        assert set(result["results"]) == {"1TUP", "4IQK"}
+    
+        single = mcp_server.resolve_pdb("1tup")
+        assert result["results"]["1TUP"].get("found") == single.get("found")
+    
     @pytest.mark.timeout(120)
     @pytest.mark.slow
     @pytest.mark.skipif(
@@ -122,22 +153,20 @@ class TestAtomicaDataset:
         reason="Requires external API access which may be slow or unavailable"
     )
     @pytest.mark.skipif(
-        not get_dataset_directory().exists(),
+        not DATASET_AVAILABLE,
         reason="Dataset not available"
     )
-    def test_search_by_gene(self):
+    def test_search_by_gene(self, mcp_server):
         """Test searching by gene symbol."""
-        mcp = AtomicaMCP()
-        
-        if not mcp.dataset_available or mcp.index is None:
+        if not mcp_server.dataset_available or mcp_server.index is None:
             pytest.skip("Dataset or index not available")
         
         # Check if index has gene_symbols column
-        if "gene_symbols" not in mcp.index.columns:
+        if "gene_symbols" not in mcp_server.index.columns:
             pytest.skip("Index does not have gene symbols. Run 'dataset index' to rebuild.")
         
         # Test searching for KEAP1
-        result = mcp.search_by_gene("KEAP1")
+        result = mcp_server.search_by_gene("KEAP1")
         
         assert isinstance(result, dict)
         assert result["gene_symbol"] == "KEAP1"
@@ -151,22 +180,20 @@ class TestAtomicaDataset:
         reason="Requires external API access which may be slow or unavailable"
     )
     @pytest.mark.skipif(
-        not get_dataset_directory().exists(),
+        not DATASET_AVAILABLE,
         reason="Dataset not available"
     )
-    def test_search_by_organism(self):
+    def test_search_by_organism(self, mcp_server):
         """Test searching by organism."""
-        mcp = AtomicaMCP()
-        
-        if not mcp.dataset_available or mcp.index is None:
+        if not mcp_server.dataset_available or mcp_server.index is None:
             pytest.skip("Dataset or index not available")
         
         # Check if index has organisms column
-        if "organisms" not in mcp.index.columns:
+        if "organisms" not in mcp_server.index.columns:
             pytest.skip("Index does not have organisms. Run 'dataset index' to rebuild.")
         
         # Test searching for human structures
-        result = mcp.search_by_organism("human")
+        result = mcp_server.search_by_organism("human")
         
         assert isinstance(result, dict)
         assert result["organism"] == "human"
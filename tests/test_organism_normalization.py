@@ -7,19 +7,36 @@ in PDB organism names are correctly normalized and matched to AnAge entries.
 import pytest
 from pathlib import Path
 from atomica_mcp.preprocessing.pdb_utils import (
-    load_anage_data,
     normalize_organism_name,
     classify_organism,
-    get_project_data_dir,
+    classify_organisms_batch,
 )
 
 
+# (name as found in PDB, expected AnAge common name, expected class)
+MODEL_ORGANISMS = [
+    ("Drosophila melanogaster", "Fruit fly", "Insecta"),
+    ("Drosophila melangaster", "Fruit fly", "Insecta"),  # typo version
+    ("Caenorhabditis elegans", "Roundworm", "Chromadorea"),
+    ("Saccharomyces cerevisiae", "Baker's yeast", "Saccharomycetes"),
+    ("Baker's yeast", "Baker's yeast", "Saccharomycetes"),
+    ("Escherichia coli", "Escherichia coli", "Gammaproteobacteria"),
+    ("Bacillus coli", "Escherichia coli", "Gammaproteobacteria"),  # historical name
+]
+
+NON_ANAGE_ORGANISMS = [
+    "Arabidopsis thaliana",  # Plant
+    "Mycobacterium tuberculosis",  # Bacterium not in AnAge
+    "Pseudomonas aeruginosa",  # Bacterium not in AnAge
+]
+
+
 @pytest.fixture(scope="module")
-def anage_data():
-    """Load AnAge data once for all tests."""
-    data_dir = get_project_data_dir()
-    anage_file = data_dir / "input" / "anage" / "anage_data.txt"
-    return load_anage_data(anage_file)
+def classified(anage_data):
+    """Classify every parametrized organism in one batch call, keyed by name."""
+    names = [name for name, _, _ in MODEL_ORGANISMS] + NON_ANAGE_ORGANISMS
+    result = classify_organisms_batch(names, anage_data)
+    return {row["scientific_name"]: row for row in result.iter_rows(named=True)}
 
 
 class TestOrganismNormalization:
@@ -52,6 +69,11 @@ class TestOrganismNormalization:
         assert normalize_organism_name("Bacillus subtilis 168") == "bacillus subtilis"
         assert normalize_organism_name("Thermus thermophilus ATCC 27634") == "thermus thermophilus"
         assert normalize_organism_name("Pseudomonas aeruginosa PA01") == "pseudomonas aeruginosa"
+        # Uppercase strain IDs without a known marker
+        assert normalize_organism_name("Thermus thermophilus HB8") == "thermus thermophilus"
+        assert normalize_organism_name("Saccharomyces cerevisiae S288C") == "saccharomyces cerevisiae"
+        # Lowercase third words are not strain IDs
+        assert normalize_organism_name("Influenza a virus") == "influenza a virus"
     
     def test_case_insensitive(self):
         """Test that normalization is case-insensitive."""
@@ -70,39 +92,29 @@ class TestAnAgeClassification:
         assert result["common_name"] == "Human"
         assert result["classification"] == "Mammalia"
     
-    def test_mouse_strains(self, anage_data):
+    @pytest.mark.parametrize("variant", ["Balb/c mouse", "C57BL/6 mouse", "Swiss mouse"])
+    def test_mouse_strains(self, anage_data, variant):
         """Test that mouse strains are correctly classified."""
-        for variant in ["Balb/c mouse", "C57BL/6 mouse", "Swiss mouse"]:
-            result = classify_organism(variant, anage_data)
-            assert result["in_anage"] is True, f"Failed for {variant}"
-            assert result["common_name"] == "House mouse"
-            assert result["classification"] == "Mammalia"
+        result = classify_organism(variant, anage_data)
+        assert result["in_anage"] is True, f"Failed for {variant}"
+        assert result["common_name"] == "House mouse"
+        assert result["classification"] == "Mammalia"
     
-    def test_rat_strains(self, anage_data):
+    @pytest.mark.parametrize("variant", ["Buffalo rat", "Wistar rat", "Sprague-Dawley rat"])
+    def test_rat_strains(self, anage_data, variant):
         """Test that rat strains are correctly classified."""
-        for variant in ["Buffalo rat", "Wistar rat", "Sprague-Dawley rat"]:
-            result = classify_organism(variant, anage_data)
-            assert result["in_anage"] is True, f"Failed for {variant}"
-            assert result["common_name"] == "Norway rat"
-            assert result["classification"] == "Mammalia"
+        result = classify_organism(variant, anage_data)
+        assert result["in_anage"] is True, f"Failed for {variant}"
+        assert result["common_name"] == "Norway rat"
+        assert result["classification"] == "Mammalia"
     
-    def test_model_organisms(self, anage_data):
+    @pytest.mark.parametrize("scientific_name,expected_common,expected_class", MODEL_ORGANISMS)
+    def test_model_organisms(self, classified, scientific_name, expected_common, expected_class):
         """Test common model organisms."""
-        test_cases = [
-            ("Drosophila melanogaster", "Fruit fly", "Insecta"),
-            ("Drosophila melangaster", "Fruit fly", "Insecta"),  # typo version
-            ("Caenorhabditis elegans", "Roundworm", "Chromadorea"),
-            ("Saccharomyces cerevisiae", "Baker's yeast", "Saccharomycetes"),
-            ("Baker's yeast", "Baker's yeast", "Saccharomycetes"),
-            ("Escherichia coli", "Escherichia coli", "Gammaproteobacteria"),
-            ("Bacillus coli", "Escherichia coli", "Gammaproteobacteria"),  # historical name
-        ]
-        
-        for scientific_name, expected_common, expected_class in test_cases:
-            result = classify_organism(scientific_name, anage_data)
-            assert result["in_anage"] is True, f"Failed for {scientific_name}"
-            assert result["common_name"] == expected_common
-            assert result["classification"] == expected_class
+        result = classified[scientific_name]
+        assert result["in_anage"] is True, f"Failed for {scientific_name}"
+        assert result["common_name"] == expected_common
+        assert result["classification"] == expected_class
     
     def test_strain_variants(self, anage_data):
         """Test that strain variants are matched to base species."""
@@ -110,18 +122,12 @@ class TestAnAgeClassification:
         assert result["in_anage"] is True
         assert result["common_name"] == "Escherichia coli"
     
-    def test_non_anage_organisms(self, anage_data):
+    @pytest.mark.parametrize("organism", NON_ANAGE_ORGANISMS)
+    def test_non_anage_organisms(self, classified, organism):
         """Test that organisms not in AnAge are correctly identified."""
-        non_anage = [
-            "Arabidopsis thaliana",  # Plant
-            "Mycobacterium tuberculosis",  # Bacterium not in AnAge
-            "Pseudomonas aeruginosa",  # Bacterium not in AnAge
-        ]
-        
-        for organism in non_anage:
-            result = classify_organism(organism, anage_data)
-            assert result["in_anage"] is False
-            assert result["classification"] == "Unknown"
+        result = classified[organism]
+        assert result["in_anage"] is False
+        assert result["classification"] == "Unknown"
 
 
 class TestPerformance:
@@ -151,6 +157,16 @@ class TestPerformance:
         # All should be matched now
         assert matched == len(previously_failed), \
             f"Only {matched}/{len(previously_failed)} organisms matched"
+    
+    def test_batch_classification_matches_single(self, anage_data):
+        """Verify batch classification returns the per-name results in input order."""
+        names = ["Home sapiens", "Arabidopsis thaliana", "Home sapiens", "", "Escherichia coli K-12"]
+        
+        result = classify_organisms_batch(names, anage_data)
+        
+        assert result.get_column("scientific_name").to_list() == names
+        for name, row in zip(names, result.iter_rows(named=True)):
+            assert row == {"scientific_name": name, **classify_organism(name, anage_data)}
 
 
 if __name__ == "__main__":
@@ -2,56 +2,73 @@
 Integration tests for PDB mining functionality.
 
 These tests make real API calls to verify that PDB metadata resolution works correctly.
-No mocking - we test against actual PDB, UniProt, and AlphaFold databases.
+No mocking - we test against actual PDB, UniProt, and AlphaFold databases. They are
+skipped unless --run-network is given or a cassette recorded with --record exists in
+tests/cassettes/ for vcrpy to replay.
 """
 
 import pytest
 from atomica_mcp.mining.pdb_metadata import (
     get_gene_symbol,
     get_uniprot_info,
+    get_uniprot_info_batch,
     get_pdb_structures_from_uniprot,
     get_alphafold_structure,
     get_pdb_structure_metadata,
+    get_pdb_structure_metadata_batch,
     get_pdb_redo_info,
     get_complex_info,
     get_structures_for_uniprot,
     get_pdb_metadata,
 )
 
+# Every test here calls the live PDB/UniProt/AlphaFold APIs; replayed only once a cassette is recorded
+pytestmark = [pytest.mark.slow, pytest.mark.network, pytest.mark.usefixtures("api_cassette")]
+
 
 class TestGeneSymbolResolution:
     """Test gene symbol retrieval from UniProt IDs."""
     
-    def test_get_gene_symbol_human_protein(self) -> None:
+    @pytest.fixture(scope="class")
+    def uniprot_infos(self):
+        """Fetch the class's UniProt entries in one batched request; it also fills the gene symbol cache."""
+        return get_uniprot_info_batch(["P04637", "P03995", "P00549", "INVALID123"])
+    
+    def test_get_gene_symbol_human_protein(self, uniprot_infos) -> None:
         """Test gene symbol retrieval for well-known human protein."""
         # P04637 is human TP53 (tumor protein p53)
-        gene_symbol = get_gene_symbol("P04637")
-        assert gene_symbol == "TP53"
+        assert uniprot_infos["P04637"]["gene_symbol"] == "TP53"
+        assert get_gene_symbol("P04637") == "TP53"
     
-    def test_get_gene_symbol_mouse_protein(self) -> None:
+    def test_get_gene_symbol_mouse_protein(self, uniprot_infos) -> None:
         """Test gene symbol retrieval for mouse protein."""
         # P03995 is mouse GFAP (glial fibrillary acidic protein)
-        gene_symbol = get_gene_symbol("P03995")
-        assert gene_symbol == "Gfap"
+        assert uniprot_infos["P03995"]["gene_symbol"] == "Gfap"
+        assert get_gene_symbol("P03995") == "Gfap"
     
-    def test_get_gene_symbol_yeast_protein(self) -> None:
+    def test_get_gene_symbol_yeast_protein(self, uniprot_infos) -> None:
         """Test gene symbol retrieval for yeast protein."""
         # P00549 is yeast pyruvate kinase
-        gene_symbol = get_gene_symbol("P00549")
-        assert gene_symbol == "CDC19"
+        assert uniprot_infos["P00549"]["gene_symbol"] == "CDC19"
+        assert get_gene_symbol("P00549") == "CDC19"
     
-    def test_get_gene_symbol_invalid(self) -> None:
+    def test_get_gene_symbol_invalid(self, uniprot_infos) -> None:
         """Test that invalid UniProt IDs return None."""
-        gene_symbol = get_gene_symbol("INVALID123")
-        assert gene_symbol is None
+        assert uniprot_infos["INVALID123"] is None
+        assert get_gene_symbol("INVALID123") is None
 
 
 class TestUniProtInfo:
     """Test comprehensive UniProt information retrieval."""
     
-    def test_get_uniprot_info_human_tp53(self) -> None:
+    @pytest.fixture(scope="class")
+    def uniprot_infos(self):
+        """Fetch the class's UniProt entries in one batched request."""
+        return get_uniprot_info_batch(["P04637", "P0A7Y7"])
+    
+    def test_get_uniprot_info_human_tp53(self, uniprot_infos) -> None:
         """Test UniProt info for human TP53."""
-        info = get_uniprot_info("P04637")
+        info = uniprot_infos["P04637"]
         
         assert info is not None
         assert info["uniprot_id"] == "P04637"
@@ -62,10 +79,10 @@ class TestUniProtInfo:
         assert info["tax_id"] == 9606
         assert info["sequence_length"] == 393
     
-    def test_get_uniprot_info_ecoli_protein(self) -> None:
+    def test_get_uniprot_info_ecoli_protein(self, uniprot_infos) -> None:
         """Test UniProt info for E. coli protein - P0A7Y7 may be from Shigella flexneri."""
         # P0A7Y7 is RNase H - shared between E. coli and Shigella
-        info = get_uniprot_info("P0A7Y7")
+        info = uniprot_infos["P0A7Y7"]
         
         assert info is not None
         assert info["uniprot_id"] == "P0A7Y7"
@@ -74,6 +91,10 @@ class TestUniProtInfo:
         # Tax IDs for various E. coli strains and Shigella species (623 is Shigella flexneri)
         assert info["tax_id"] in [83333, 562, 198214, 623]
         assert info["sequence_length"] > 0
+    
+    def test_get_uniprot_info_matches_batch(self, uniprot_infos) -> None:
+        """Test that a single lookup returns the same entry as the batched one."""
+        assert get_uniprot_info("P04637") == uniprot_infos["P04637"]
 
 
 class TestPDBStructureRetrieval:
@@ -154,6 +175,16 @@ class TestPDBMetadata:
         assert metadata["pdb_id"] == "6VSB"
         assert "MICROSCOPY" in metadata["experimental_method"]
         assert metadata["resolution"] is not None
+    
+    def test_get_pdb_structure_metadata_batch(self) -> None:
+        """Test batched metadata retrieval matches per-entry retrieval."""
+        pdb_ids = ["2C0L", "1QND", "ZZZZ"]
+        batch = get_pdb_structure_metadata_batch(pdb_ids)
+        
+        assert list(batch) == pdb_ids
+        assert batch["ZZZZ"] is None
+        for pdb_id in ["2C0L", "1QND"]:
+            assert batch[pdb_id] == get_pdb_structure_metadata(pdb_id)
 
 
 class TestPDBRedo:
@@ -212,7 +243,6 @@ class TestComplexInfo:
 class TestStructuresForUniProt:
     """Test comprehensive structure retrieval for UniProt IDs."""
     
-    @pytest.mark.slow
     def test_get_structures_for_uniprot_with_alphafold(self) -> None:
         """Test structure retrieval including AlphaFold."""
         # P22307 (SCP2) has PDB structures and AlphaFold model
@@ -233,7 +263,6 @@ class TestStructuresForUniProt:
         if experimental:
             assert experimental[0].experimental_method == "X-RAY DIFFRACTION" or experimental[0].experimental_method in ["ELECTRON MICROSCOPY", "SOLUTION NMR"]
     
-    @pytest.mark.slow
     def test_get_structures_for_uniprot_without_alphafold(self) -> None:
         """Test structure retrieval excluding AlphaFold."""
         structures = get_structures_for_uniprot("P22307", include_alphafold=False)
@@ -244,7 +273,6 @@ class TestStructuresForUniProt:
         af_structures = [s for s in structures if s.structure_id.startswith("AF-")]
         assert len(af_structures) == 0
     
-    @pytest.mark.slow
     def test_get_structures_metadata_complete(self) -> None:
         """Test that retrieved structures have complete metadata."""
         structures = get_structures_for_uniprot("P22307", include_alphafold=True)
@@ -260,6 +288,23 @@ class TestStructuresForUniProt:
             if structure.experimental_method == "X-RAY DIFFRACTION":
                 assert structure.resolution is not None
 
+    
+    def test_get_structures_for_uniprot_prefiltered(self) -> None:
+        """Test that limits are applied before per-structure metadata is fetched."""
+        # P04637 (TP53) has hundreds of PDB entries
+        structures = get_structures_for_uniprot(
+            "P04637",
+            include_alphafold=False,
+            max_structures=5,
+            max_resolution=3.5,
+            min_coverage=0.1,
+        )
+        
+        assert 0 < len(structures) <= 5
+        for structure in structures:
+            if structure.resolution is not None:
+                assert structure.resolution <= 3.5
+
 
 class TestPDBMetadataByID:
     """Test PDB metadata retrieval by PDB ID."""
@@ -329,7 +374,6 @@ class TestErrorHandling:
 class TestRealWorldExamples:
     """Test with real-world examples from PDBminer."""
     
-    @pytest.mark.slow
     def test_pdbminer_example_p22307(self) -> None:
         """Test with P22307 (SCP2) from PDBminer examples."""
         # This is the example from PDBminer command_line example
@@ -357,7 +401,6 @@ class TestRealWorldExamples:
         assert "NMR" in qnd_structure.experimental_method
         assert qnd_structure.resolution is None
     
-    @pytest.mark.slow
     def test_pdbminer_example_p04637(self) -> None:
         """Test with P04637 (TP53) - well-known protein with many structures."""
         structures = get_structures_for_uniprot("P04637", include_alphafold=False)
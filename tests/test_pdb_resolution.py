@@ -9,9 +9,9 @@ Tests use actual AnAge data and known PDB IDs to verify:
 - UniProt ID resolution
 """
 import pytest
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from atomica_mcp import (
-    load_anage_data,
     load_pdb_annotations,
     fetch_pdb_metadata,
     get_chain_organism,
@@ -33,15 +33,13 @@ TEST_PDBS = {
 }
 
 
-@pytest.fixture(scope="session")
-def anage_data():
-    """Load AnAge database once per test session."""
-    anage_file = Path(__file__).parent.parent / "data" / "input" / "anage" / "anage_data.txt"
-    
-    if not anage_file.exists():
-        pytest.skip(f"AnAge data not found at {anage_file}")
-    
-    return load_anage_data(anage_file)
+@pytest.fixture(scope="module")
+def test_pdb_metadata(api_cassette):
+    """Fetch API metadata for TEST_PDBS once per module, all entries concurrently."""
+    pdb_ids = list(TEST_PDBS)
+    with ThreadPoolExecutor(max_workers=len(pdb_ids)) as executor:
+        results = executor.map(lambda pdb_id: fetch_pdb_metadata(pdb_id, use_tsv=False, timeout=10), pdb_ids)
+        return dict(zip(pdb_ids, results))
 
 
 @pytest.fixture(scope="session")
@@ -61,6 +59,14 @@ def load_pdb_data(pdb_annotations_available):
     return False
 
 
+@pytest.fixture(scope="module")
+def tsv_2uxq_metadata(load_pdb_data, api_cassette):
+    """Resolve 2uxq through the TSV-first path once per module (None without annotations)."""
+    if not load_pdb_data:
+        return None
+    return fetch_pdb_metadata("2uxq", use_tsv=True)
+
+
 class TestAnAgeData:
     """Tests for AnAge data loading and functionality."""
     
@@ -131,13 +137,15 @@ class TestEntryIDParsing:
         assert result["pdb_id"] == "2uxq"
 
 
+@pytest.mark.network
+@pytest.mark.usefixtures("api_cassette")
 class TestPDBResolutionWithFallback:
     """Integration tests for PDB resolution with TSV and API fallback."""
     
     @pytest.mark.parametrize("pdb_id", list(TEST_PDBS.keys()))
-    def test_pdb_api_resolution(self, pdb_id):
+    def test_pdb_api_resolution(self, pdb_id, test_pdb_metadata):
         """Test PDB resolution using RCSB API (always available)."""
-        metadata = fetch_pdb_metadata(pdb_id, use_tsv=False, timeout=10)
+        metadata = test_pdb_metadata[pdb_id]
         
         assert metadata["found"] is True, f"PDB {pdb_id} should be found"
         assert metadata["pdb_id"] == pdb_id
@@ -145,44 +153,44 @@ class TestPDBResolutionWithFallback:
         assert len(metadata["entities"]) > 0
     
     @pytest.mark.parametrize("pdb_id", list(TEST_PDBS.keys()))
-    def test_pdb_metadata_structure(self, pdb_id):
+    def test_pdb_metadata_structure(self, pdb_id, test_pdb_metadata):
         """Test that metadata has expected structure."""
-        metadata = fetch_pdb_metadata(pdb_id, use_tsv=False)
+        metadata = test_pdb_metadata[pdb_id]
         
-        assert "found" in metadata
-        assert "pdb_id" in metadata
-        assert "entities" in metadata
-        
-        for entity in metadata["entities"]:
-            assert "entity_id" in entity
-            assert "chains" in entity
-            assert "organism" in entity
-            assert "uniprot_ids" in entity
+        # Collect every missing field so one fetch reports all defects at once
+        missing = [key for key in ("found", "pdb_id", "entities") if key not in metadata]
+        for index, entity in enumerate(metadata.get("entities", [])):
+            missing += [
+                f"entities[{index}].{key}"
+                for key in ("entity_id", "chains", "organism", "uniprot_ids")
+                if key not in entity
+            ]
+        assert not missing, f"Metadata for {pdb_id} is missing: {missing}"
     
     @pytest.mark.parametrize("pdb_id", list(TEST_PDBS.keys()))
-    def test_pdb_organism_info(self, pdb_id, anage_data):
+    def test_pdb_organism_info(self, pdb_id, anage_data, test_pdb_metadata):
         """Test that organism information is extracted."""
-        metadata = fetch_pdb_metadata(pdb_id, use_tsv=False)
+        metadata = test_pdb_metadata[pdb_id]
         
         assert metadata["found"] is True
         
+        problems = []
         for entity in metadata["entities"]:
             for chain_id in entity["chains"]:
                 organism = get_chain_organism(metadata, chain_id, anage_data)
                 
-                assert "scientific_name" in organism
-                assert organism["scientific_name"] != ""
-                assert "taxonomy_id" in organism
-                assert "in_anage" in organism
+                problems += [f"chain {chain_id}: no {key}" for key in ("scientific_name", "taxonomy_id", "in_anage") if key not in organism]
+                if organism.get("scientific_name") == "":
+                    problems.append(f"chain {chain_id}: empty scientific_name")
+        assert not problems, f"Organism info for {pdb_id} has problems: {problems}"
     
-    def test_pdb_tsv_resolution_if_available(self, load_pdb_data, anage_data):
+    def test_pdb_tsv_resolution_if_available(self, load_pdb_data, anage_data, tsv_2uxq_metadata):
         """Test TSV-based resolution if annotations are available."""
         if not load_pdb_data:
             pytest.skip("PDB annotations not available")
         
         # Test with a known PDB
-        pdb_id = "2uxq"
-        metadata = fetch_pdb_metadata(pdb_id, use_tsv=True)
+        metadata = tsv_2uxq_metadata
         
         # Should either find it in TSV or fall back
         if metadata["found"]:
@@ -195,7 +203,7 @@ class TestPDBResolutionWithFallback:
                     organism = get_chain_organism(metadata, chain_id, anage_data)
                     assert "scientific_name" in organism
     
-    def test_pdb_fallback_chain(self, load_pdb_data, anage_data):
+    def test_pdb_fallback_chain(self, load_pdb_data, anage_data, test_pdb_metadata, tsv_2uxq_metadata):
         """Test that TSV falls back to API if needed."""
         if not load_pdb_data:
             pytest.skip("PDB annotations not available, skipping fallback test")
@@ -204,10 +212,10 @@ class TestPDBResolutionWithFallback:
         pdb_id = "2uxq"
         
         # Try TSV first
-        tsv_metadata = fetch_pdb_metadata(pdb_id, use_tsv=True)
+        tsv_metadata = tsv_2uxq_metadata
         
         # Try API
-        api_metadata = fetch_pdb_metadata(pdb_id, use_tsv=False)
+        api_metadata = test_pdb_metadata[pdb_id]
         
         # Both should find the PDB
         assert tsv_metadata["found"] is True
@@ -217,13 +225,15 @@ class TestPDBResolutionWithFallback:
         assert tsv_metadata["pdb_id"] == api_metadata["pdb_id"]
 
 
+@pytest.mark.network
+@pytest.mark.usefixtures("api_cassette")
 class TestPDBWithAnAgeIntegration:
     """Full integration tests with AnAge data."""
     
-    def test_human_protein_in_anage(self, anage_data):
+    def test_human_protein_in_anage(self, anage_data, test_pdb_metadata):
         """Test resolving human proteins with AnAge classification."""
-        # Fetch a known human protein
-        metadata = fetch_pdb_metadata("2uxq", use_tsv=False)
+        # A known human protein
+        metadata = test_pdb_metadata["2uxq"]
         
         assert metadata["found"] is True
         
@@ -237,10 +247,10 @@ class TestPDBWithAnAgeIntegration:
                     assert organism["in_anage"] is True
                     assert organism["classification"] == "Mammalia"
     
-    def test_pdb_chain_organism_classification(self, anage_data):
+    def test_pdb_chain_organism_classification(self, anage_data, test_pdb_metadata):
         """Test that chain organisms are properly classified."""
         pdb_id = "2uxq"
-        metadata = fetch_pdb_metadata(pdb_id, use_tsv=False)
+        metadata = test_pdb_metadata[pdb_id]
         
         if not metadata["found"]:
             pytest.skip(f"Could not fetch {pdb_id}")
@@ -262,6 +272,8 @@ class TestPDBWithAnAgeIntegration:
 class TestEdgeCases:
     """Tests for edge cases and error handling."""
     
+    @pytest.mark.network
+    @pytest.mark.usefixtures("api_cassette")
     def test_invalid_pdb_id(self):
         """Test handling of invalid PDB ID."""
         metadata = fetch_pdb_metadata("XXXX", use_tsv=False)
@@ -1,19 +1,50 @@
 #!/usr/bin/env python3
 """Test search_by_uniprot specifically for the relative paths fix."""
 
+import os
 import pytest
+from collections import defaultdict
 from pathlib import Path
-from atomica_mcp.server import AtomicaMCP, get_dataset_directory
+from atomica_mcp.server import get_dataset_directory
 
 
-@pytest.fixture
-def mcp_server():
-    """Create MCP server instance."""
-    return AtomicaMCP()
+# Resolved once at import; the skipif markers below share it
+DATASET_AVAILABLE = get_dataset_directory().exists()
+
+# Per-structure file path fields that must be relative to the dataset directory
+PATH_KEYS = ("interact_scores_path", "critical_residues_path", "pymol_path")
+
+
+def collect_relative_paths(structures):
+    """Assert every path field is relative, reporting all offenders at once, and return the paths found."""
+    paths = []
+    absolute = []
+    for structure in structures:
+        for path_key in PATH_KEYS:
+            path = structure.get(path_key)
+            if not path:
+                continue
+            if path.startswith(("/", "~")):
+                absolute.append(f"{path_key}: {path}")
+            paths.append(path)
+    assert not absolute, f"Paths should be relative, got: {absolute}"
+    return paths
+
+
+def assert_paths_exist(dataset_dir, paths):
+    """Assert paths exist under dataset_dir with one directory listing per parent instead of a stat per file."""
+    by_parent = defaultdict(set)
+    for path in paths:
+        abs_path = dataset_dir / path
+        by_parent[abs_path.parent].add(abs_path.name)
+    for parent, names in by_parent.items():
+        listing = set(os.listdir(parent)) if parent.is_dir() else set()
+        missing = sorted(names - listing)
+        assert not missing, f"Files should exist in {parent}: {missing}"
 
 
 @pytest.mark.skipif(
-    not get_dataset_directory().exists(),
+    not DATASET_AVAILABLE,
     reason="Dataset not available"
 )
 def test_search_by_uniprot_returns_relative_paths(mcp_server):
@@ -44,43 +75,14 @@ def test_search_by_uniprot_returns_relative_paths(mcp_server):
     dataset_dir = Path(result["dataset_directory"])
     assert dataset_dir.exists()
     
-    # Check that paths in structures are RELATIVE, not absolute
+    # Check that paths in structures are RELATIVE, not absolute, and valid under the dataset directory
     for structure in result["structures"]:
         assert "pdb_id" in structure
-        
-        # Check interact_scores_path
-        if "interact_scores_path" in structure and structure["interact_scores_path"]:
-            path = structure["interact_scores_path"]
-            assert not path.startswith("/"), f"interact_scores_path should be relative, got: {path}"
-            assert not path.startswith("~"), f"interact_scores_path should not use home dir, got: {path}"
-            
-            # Verify the path is valid by constructing absolute path
-            abs_path = dataset_dir / path
-            assert abs_path.exists(), f"File should exist: {abs_path}"
-        
-        # Check critical_residues_path
-        if "critical_residues_path" in structure and structure["critical_residues_path"]:
-            path = structure["critical_residues_path"]
-            assert not path.startswith("/"), f"critical_residues_path should be relative, got: {path}"
-            assert not path.startswith("~"), f"critical_residues_path should not use home dir, got: {path}"
-            
-            # Verify the path is valid
-            abs_path = dataset_dir / path
-            assert abs_path.exists(), f"File should exist: {abs_path}"
-        
-        # Check pymol_path
-        if "pymol_path" in structure and structure["pymol_path"]:
-            path = structure["pymol_path"]
-            assert not path.startswith("/"), f"pymol_path should be relative, got: {path}"
-            assert not path.startswith("~"), f"pymol_path should not use home dir, got: {path}"
-            
-            # Verify the path is valid
-            abs_path = dataset_dir / path
-            assert abs_path.exists(), f"File should exist: {abs_path}"
+    assert_paths_exist(dataset_dir, collect_relative_paths(result["structures"]))
 
 
 @pytest.mark.skipif(
-    not get_dataset_directory().exists(),
+    not DATASET_AVAILABLE,
     reason="Dataset not available"
 )
 def test_search_by_uniprot_json_serializable(mcp_server):
@@ -106,7 +108,33 @@ def test_search_by_uniprot_json_serializable(mcp_server):
 
 
 @pytest.mark.skipif(
-    not get_dataset_directory().exists(),
+    not DATASET_AVAILABLE,
+    reason="Dataset not available"
+)
+def test_search_by_uniprots_matches_single_searches(mcp_server):
+    """Test that the batch search returns the same structures as per-ID searches."""
+    if not mcp_server.dataset_available or mcp_server.index is None:
+        pytest.skip("Dataset or index not available")
+    
+    if "uniprot_ids" not in mcp_server.index.columns:
+        pytest.skip("Index does not have UniProt IDs")
+    
+    uniprot_ids = ["P02649", "Q14145", "P02649"]
+    result = mcp_server.search_by_uniprots(uniprot_ids)
+    
+    # Duplicates are dropped, order is preserved
+    assert result["uniprot_ids"] == ["P02649", "Q14145"]
+    assert "dataset_directory" in result
+    
+    for uniprot_id in result["uniprot_ids"]:
+        single = mcp_server.search_by_uniprot(uniprot_id)
+        batch = result["results"][uniprot_id]
+        assert batch["count"] == single["count"]
+        assert [s["pdb_id"] for s in batch["structures"]] == [s["pdb_id"] for s in single["structures"]]
+
+
+@pytest.mark.skipif(
+    not DATASET_AVAILABLE,
     reason="Dataset not available"
 )
 def test_search_by_gene_returns_relative_paths(mcp_server):
@@ -125,14 +153,7 @@ def test_search_by_gene_returns_relative_paths(mcp_server):
     
     # If structures found, check paths are relative
     if result.get("count", 0) > 0:
-        dataset_dir = Path(mcp_server.dataset_dir)
-        
-        for structure in result["structures"]:
-            # Check paths are relative
-            for path_key in ["interact_scores_path", "critical_residues_path", "pymol_path"]:
-                if path_key in structure and structure[path_key]:
-                    path = structure[path_key]
-                    assert not path.startswith("/"), f"{path_key} should be relative, got: {path}"
+        collect_relative_paths(result["structures"])
 
 
 if __name__ == "__main__":
@@ -3,6 +3,9 @@ Integration tests for UniProt ID resolution with fallback strategies.
 These tests use real API calls to verify that the fallback mechanisms work correctly.
 """
 
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+
 from atomica_mcp.mining.pdb_metadata import (
     get_pdb_metadata,
     resolve_uniprot_ids_with_fallbacks,
@@ -11,21 +14,53 @@ from atomica_mcp.mining.pdb_metadata import (
     get_uniprot_mappings_graphql,
 )
 
+# Every test here calls the live PDB/UniProt APIs; replayed only once a cassette is recorded
+pytestmark = [pytest.mark.slow, pytest.mark.network, pytest.mark.usefixtures("api_cassette")]
+
+# PDB entries whose full metadata several tests read
+METADATA_PDBS = ("1b68", "2flu", "6ht5", "1bna")
+
+
+# Structure whose UniProt mappings every resolution strategy is checked against
+MAPPING_PDB = "1b68"
+
+
+@pytest.fixture(scope="module")
+def pdb_metadata(api_cassette):
+    """Fetch get_pdb_metadata for METADATA_PDBS once per module, all entries concurrently."""
+    with ThreadPoolExecutor(max_workers=len(METADATA_PDBS)) as executor:
+        return dict(zip(METADATA_PDBS, executor.map(get_pdb_metadata, METADATA_PDBS)))
+
+
+@pytest.fixture(scope="module")
+def uniprot_mappings(api_cassette):
+    """
+    Resolve MAPPING_PDB through the fallback chain and each single source once, concurrently.
+    
+    Futures are returned so a failing source only fails the tests that read it.
+    """
+    lookups = {
+        "fallbacks": resolve_uniprot_ids_with_fallbacks,
+        "sifts": get_uniprot_mappings_sifts,
+        "graphql": get_uniprot_mappings_graphql,
+        "rest": get_uniprot_mappings_rcsb,
+    }
+    with ThreadPoolExecutor(max_workers=len(lookups)) as executor:
+        return {name: executor.submit(lookup, MAPPING_PDB) for name, lookup in lookups.items()}
+
 
-def test_resolve_uniprot_primary_pdbe_api():
+def test_resolve_uniprot_primary_pdbe_api(uniprot_mappings):
     """Test UniProt resolution using primary PDBe API."""
     # Test with a well-known structure (APOE)
-    pdb_id = "1b68"
-    uniprot_ids = resolve_uniprot_ids_with_fallbacks(pdb_id)
+    uniprot_ids = uniprot_mappings["fallbacks"].result()
     
-    assert len(uniprot_ids) > 0, f"Expected to find UniProt IDs for {pdb_id}"
+    assert len(uniprot_ids) > 0, f"Expected to find UniProt IDs for {MAPPING_PDB}"
     assert "P02649" in uniprot_ids, "Expected to find APOE UniProt ID (P02649)"
 
 
-def test_resolve_uniprot_sifts_fallback():
+def test_resolve_uniprot_sifts_fallback(uniprot_mappings):
     """Test SIFTS fallback mechanism."""
-    pdb_id = "1b68"
-    mappings = get_uniprot_mappings_sifts(pdb_id)
+    mappings = uniprot_mappings["sifts"].result()
     
     # SIFTS should return a dictionary
     assert isinstance(mappings, dict)
@@ -34,10 +69,9 @@ def test_resolve_uniprot_sifts_fallback():
         assert len(mappings) > 0
 
 
-def test_resolve_uniprot_rcsb_graphql_fallback():
+def test_resolve_uniprot_rcsb_graphql_fallback(uniprot_mappings):
     """Test RCSB GraphQL API fallback."""
-    pdb_id = "1b68"
-    uniprot_ids = get_uniprot_mappings_graphql(pdb_id)
+    uniprot_ids = uniprot_mappings["graphql"].result()
     
     assert isinstance(uniprot_ids, list)
     # RCSB GraphQL should also find this
@@ -45,18 +79,17 @@ def test_resolve_uniprot_rcsb_graphql_fallback():
         assert len(uniprot_ids) > 0
 
 
-def test_resolve_uniprot_rcsb_rest_fallback():
+def test_resolve_uniprot_rcsb_rest_fallback(uniprot_mappings):
     """Test RCSB REST API fallback."""
-    pdb_id = "1b68"
-    uniprot_ids = get_uniprot_mappings_rcsb(pdb_id)
+    uniprot_ids = uniprot_mappings["rest"].result()
     
     assert isinstance(uniprot_ids, list)
 
 
-def test_get_pdb_metadata_with_uniprot():
+def test_get_pdb_metadata_with_uniprot(pdb_metadata):
     """Test complete metadata retrieval with UniProt resolution."""
     pdb_id = "1b68"
-    metadata = get_pdb_metadata(pdb_id)
+    metadata = pdb_metadata[pdb_id]
     
     assert metadata is not None, f"Metadata should be found for {pdb_id}"
     assert metadata.pdb_id == "1B68"
@@ -67,11 +100,11 @@ def test_get_pdb_metadata_with_uniprot():
     assert "APOE" in metadata.gene_symbols
 
 
-def test_get_pdb_metadata_complex():
+def test_get_pdb_metadata_complex(pdb_metadata):
     """Test metadata retrieval for a protein complex."""
     # KEAP1-NRF2 complex
     pdb_id = "2flu"
-    metadata = get_pdb_metadata(pdb_id)
+    metadata = pdb_metadata[pdb_id]
     
     assert metadata is not None
     assert len(metadata.uniprot_ids) > 0
@@ -79,28 +112,26 @@ def test_get_pdb_metadata_complex():
     assert len(metadata.structures) > 0
 
 
-def test_get_pdb_metadata_multiple_structures():
+@pytest.mark.parametrize("pdb_id,expected_gene,expected_uniprot", [
+    ("1b68", "APOE", "P02649"),  # X-ray structure - APOE
+    ("2flu", None, None),  # Complex structure (KEAP1-NRF2)
+    ("6ht5", "Sox2", "P48432"),  # Oct4/Sox2 complex
+])
+def test_get_pdb_metadata_multiple_structures(pdb_id, expected_gene, expected_uniprot, pdb_metadata):
     """Test metadata retrieval for various structure types."""
-    test_cases = [
-        ("1b68", "APOE", "P02649"),  # X-ray structure - APOE
-        ("2flu", None, None),  # Complex structure (KEAP1-NRF2)
-        ("6ht5", "Sox2", "P48432"),  # Oct4/Sox2 complex
-    ]
+    metadata = pdb_metadata[pdb_id]
     
-    for pdb_id, expected_gene, expected_uniprot in test_cases:
-        metadata = get_pdb_metadata(pdb_id)
-        
-        assert metadata is not None, f"Should find metadata for {pdb_id}"
-        assert metadata.pdb_id == pdb_id.upper()
-        assert len(metadata.uniprot_ids) > 0, f"Should have UniProt IDs for {pdb_id}"
-        
-        if expected_uniprot:
-            assert expected_uniprot in metadata.uniprot_ids, \
-                f"Expected to find {expected_uniprot} in {pdb_id}"
-        
-        if expected_gene:
-            assert expected_gene in metadata.gene_symbols, \
-                f"Expected to find {expected_gene} in {pdb_id}"
+    assert metadata is not None, f"Should find metadata for {pdb_id}"
+    assert metadata.pdb_id == pdb_id.upper()
+    assert len(metadata.uniprot_ids) > 0, f"Should have UniProt IDs for {pdb_id}"
+    
+    if expected_uniprot:
+        assert expected_uniprot in metadata.uniprot_ids, \
+            f"Expected to find {expected_uniprot} in {pdb_id}"
+    
+    if expected_gene:
+        assert expected_gene in metadata.gene_symbols, \
+            f"Expected to find {expected_gene} in {pdb_id}"
 
 
 def test_uniprot_resolution_invalid_pdb():
@@ -112,27 +143,25 @@ def test_uniprot_resolution_invalid_pdb():
     assert metadata is None
 
 
-def test_uniprot_resolution_no_protein():
+def test_uniprot_resolution_no_protein(pdb_metadata):
     """Test PDB entries without protein structures."""
     # This would be a nucleic acid only structure
     # For now, we'll just verify the function doesn't crash
     pdb_id = "1bna"  # DNA structure
-    metadata = get_pdb_metadata(pdb_id)
+    metadata = pdb_metadata[pdb_id]
     
     # Should return something (even if no UniProt IDs)
     assert metadata is not None
     assert metadata.pdb_id == "1BNA"
 
 
-def test_fallback_cascading():
+def test_fallback_cascading(uniprot_mappings):
     """
     Test that fallback mechanisms cascade correctly.
     This test ensures that if one API fails, the next one is tried.
     """
-    pdb_id = "1b68"
-    
     # Get result using all fallbacks
-    uniprot_ids = resolve_uniprot_ids_with_fallbacks(pdb_id)
+    uniprot_ids = uniprot_mappings["fallbacks"].result()
     
     assert len(uniprot_ids) > 0, "At least one fallback should succeed"
     assert "P02649" in uniprot_ids, "Should find APOE UniProt ID"